@@ -5,6 +5,7 @@ from django.contrib.auth.models import AbstractUser
 from django.utils import timezone
 from django.core.validators import FileExtensionValidator
 from django.contrib.auth.models import BaseUserManager, AbstractBaseUser,PermissionsMixin,Permission
+from kibris_acil_satilik.storage import get_image_storage
 
 
 class UserManager(BaseUserManager):
@@ -84,6 +85,10 @@ class Offer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # core.LiveCounter scope and the fields active offers are also counted by.
+    COUNTER_SCOPE = 'offers'
+    COUNTER_DIMENSIONS = ('offer_type',)
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = "User Offer Request"
@@ -155,7 +160,7 @@ class OfferImage(models.Model):
     id = models.AutoField(primary_key=True)
     offer  = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(
-        upload_to='offer_images/',
+        upload_to='offer_images/', storage=get_image_storage,
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])]
     )
     is_cover_image = models.BooleanField(default=False)
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from kibris_acil_satilik.images import build_srcset
 from django.contrib.auth import authenticate
 from .models import OfferImage, Offer, OfferResponse, PropertyOffer, CarOffer
 from django.contrib.auth import get_user_model
@@ -155,10 +156,11 @@ class PropertyOfferDetailsSerializer(serializers.ModelSerializer):
 
 class OfferImageSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = OfferImage
-        fields = ['id', 'image', 'is_cover_image', 'is_active', 'uploaded_at', 'offer']
+        fields = ['id', 'image', 'srcset', 'is_cover_image', 'is_active', 'uploaded_at', 'offer']
         read_only_fields = ['id', 'uploaded_at']
         extra_kwargs = {'offer': {'write_only': True, 'required': False}}
 
@@ -168,6 +170,9 @@ class OfferImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_srcset(self, obj):
+        return build_srcset(self.context.get('request'), obj)
+
 class OfferResponseSerializer(serializers.ModelSerializer):
     created_by = UserEmailRelatedField(read_only=True, allow_null=True)
     offered_by = UserEmailRelatedField(required=False, allow_null=True, allow_empty=True)
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from knox.models import AuthToken
+
+from kibris_acil_satilik.authentication import invalidate_tokens
+from kibris_acil_satilik.images import enqueue_image_processing
+from .models import OfferImage
+
+
+@receiver(post_save, sender=OfferImage)
+def queue_offer_image_processing(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw and instance.image:
+        enqueue_image_processing(instance)
+
+
+@receiver(post_delete, sender=AuthToken)
+def forget_deleted_token(sender, instance, **kwargs):
+    invalidate_tokens([instance.digest])
@@ -1,3 +1,54 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from knox.models import AuthToken
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from kibris_acil_satilik.authentication import CachedTokenAuthentication, token_cache
+from .models import User
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Cached tokens skip knox's lookup but stop working as soon as their row is deleted."""
+
+    def setUp(self):
+        token_cache.clear()
+        cache.clear()
+        self.addCleanup(token_cache.clear)
+        self.user = User.objects.create_user(email='agent@example.com', password='secret')
+        self.auth_token, self.token = AuthToken.objects.create(self.user)
+        self.authentication = CachedTokenAuthentication()
+
+    def authenticate(self):
+        user, _ = self.authentication.authenticate_credentials(self.token.encode('utf-8'))
+        return user
+
+    def test_cached_token_costs_one_user_query(self):
+        self.assertEqual(self.authenticate(), self.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate(), self.user)
+
+    def test_deleted_token_is_rejected_immediately(self):
+        self.authenticate()
+        self.auth_token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    @override_settings(AUTH_TOKEN_SHARED_CACHE='default')
+    def test_deleted_token_is_dropped_from_the_shared_cache(self):
+        self.authenticate()
+        # Another process only knows the token through the shared cache.
+        token_cache.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate(), self.user)
+        token_cache.clear()
+        self.auth_token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_logout_revokes_a_cached_token(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        self.assertEqual(client.get('/api/properties/admin/').status_code, 200)
+        self.assertEqual(client.post('/api/accounts/logout/').status_code, 204)
+        self.assertEqual(client.get('/api/properties/admin/').status_code, 401)
@@ -4,7 +4,7 @@ from django.urls import path, include
 from knox import views as knox_views
 from rest_framework.routers import DefaultRouter
 from .views import RegisterView, LoginView, UserDetailView, PublicOfferCreateView, OfferAdminViewSet, \
-    OfferResponseAdminViewSet
+    OfferResponseAdminViewSet, AuthCacheStatsView
 
 router = DefaultRouter()
 router.register(r'admin/offers', OfferAdminViewSet, basename='admin-offer')
@@ -16,6 +16,7 @@ urlpatterns = [
     path('logout/', knox_views.LogoutView.as_view(), name='logout'),
     path('logoutall/', knox_views.LogoutAllView.as_view(), name='logoutall'),  # Logout from all devices
     path('user/', UserDetailView.as_view(), name='user-detail'),
+    path('auth-cache-stats/', AuthCacheStatsView.as_view(), name='auth-cache-stats'),
 
     # Public endpoint for creating offers
     path('offers/submit/', PublicOfferCreateView.as_view(), name='public-offer-submit'),
@@ -6,15 +6,17 @@ from django.contrib.auth import login
 from django.db import IntegrityError
 from knox.models import AuthToken
 from knox.views import LoginView as KnoxLoginView
-from knox.auth import TokenAuthentication
+from kibris_acil_satilik.authentication import CachedTokenAuthentication, token_cache_stats
 
+from core.models import LiveCounter
 from properties.models import PropertyAdvertisement
 from vehicles.models import CarAdvertisement
 from .filters import OfferFilter
 from .models import User, OfferImage, Offer, OfferResponse
 from .serializers import UserSerializer, RegisterSerializer, LoginSerializer, OfferResponseSerializer, \
     UserOfferAdminSerializer, UserOfferCreateSerializer, OfferImageSerializer
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.parsers import MultiPartParser, FormParser
+from kibris_acil_satilik.parsers import ORJSONParser
 from collections import OrderedDict
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -25,7 +27,7 @@ from rest_framework.permissions import AllowAny
 class RegisterView(generics.CreateAPIView):
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
 
     def create(self, request, *args, **kwargs):
         try:
@@ -79,8 +81,8 @@ class UserDetailView(generics.RetrieveUpdateAPIView):
     """View for retrieving and updating user details"""
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    authentication_classes = [CachedTokenAuthentication]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
 
     def get_object(self):
         return self.request.user
@@ -99,7 +101,7 @@ class UserDetailView(generics.RetrieveUpdateAPIView):
 class OfferAdminViewSet(viewsets.ModelViewSet):
     serializer_class = UserOfferAdminSerializer
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     filter_backends = [DjangoFilterBackend, drf_filters.SearchFilter, drf_filters.OrderingFilter]
     filterset_class = OfferFilter
@@ -168,7 +170,7 @@ class OfferResponseAdminViewSet(viewsets.ModelViewSet):
 class PublicOfferCreateView(generics.CreateAPIView):
     serializer_class = UserOfferCreateSerializer
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    parser_classes = [MultiPartParser, FormParser, ORJSONParser]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -182,20 +184,27 @@ class PublicOfferCreateView(generics.CreateAPIView):
         )
 
 class DashboardTotalsView(APIView):
+    """Active car, property and offer totals with per-type breakdowns, read from core.LiveCounter."""
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def get(self, request, format=None):
-        total_cars = CarAdvertisement.objects.filter(is_active=True).count()
-        total_properties = PropertyAdvertisement.objects.filter(is_active=True).count()
-        total_offers = Offer.objects.filter(is_active=True).count()
-
-        data = {
-            "cars": total_cars,
-            "properties": total_properties,
-            "offers": total_offers,
-        }
+        scopes = [model.COUNTER_SCOPE for model in (CarAdvertisement, PropertyAdvertisement, Offer)]
+        totals = LiveCounter.totals(*scopes)
+
+        data = {scope: totals[scope].pop('total') for scope in scopes}
+        data["breakdowns"] = totals
         return Response(data)
+
+
+class AuthCacheStatsView(APIView):
+    """Hit rates of this process's authentication token caches."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, format=None):
+        return Response(token_cache_stats())
+
+
 class APIRootView(APIView):
     """
     API Root view providing links to major application endpoints.
@@ -0,0 +1,69 @@
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import Job
+
+
+def enqueue(kind, payload=None, delay=None):
+    """
+    Queues a job. Inside a transaction the job only becomes visible to workers when it
+    commits, together with whatever rows it refers to.
+    """
+    if kind not in settings.JOB_HANDLERS:
+        raise ValueError(f"No handler configured for job kind '{kind}'.")
+    run_after = timezone.now() + delay if delay else timezone.now()
+    return Job.objects.create(kind=kind, payload=payload or {}, run_after=run_after)
+
+
+def claim_jobs(limit=1):
+    """
+    Atomically claims up to `limit` due jobs, skipping rows other workers hold locked. Jobs
+    left RUNNING for longer than JOB_LOCK_TIMEOUT (a crashed worker) are claimed again.
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT)
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(Q(status=Job.PENDING, run_after__lte=now) | Q(status=Job.RUNNING, locked_at__lt=stale_before))
+            .order_by('run_after', 'id')[:limit]
+        )
+        if jobs:
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=Job.RUNNING, locked_at=now, updated_at=now
+            )
+    return jobs
+
+
+def run_job(job):
+    """
+    Runs a claimed job's handler. Failures are retried with exponential backoff until
+    JOB_MAX_ATTEMPTS, after which the job is left FAILED with the traceback in last_error.
+    Returns True if the job succeeded.
+    """
+    attempts = job.attempts + 1
+    try:
+        handler = import_string(settings.JOB_HANDLERS[job.kind])
+        handler(job.payload)
+    except Exception:
+        failed = attempts >= settings.JOB_MAX_ATTEMPTS
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.FAILED if failed else Job.PENDING,
+            attempts=attempts,
+            run_after=timezone.now() + timedelta(seconds=settings.JOB_RETRY_DELAY * 2 ** (attempts - 1)),
+            locked_at=None,
+            last_error=traceback.format_exc(),
+            updated_at=timezone.now(),
+        )
+        return False
+
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.DONE, attempts=attempts, locked_at=None, last_error='', updated_at=timezone.now()
+    )
+    return True
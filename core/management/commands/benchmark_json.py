@@ -0,0 +1,71 @@
+import base64
+import io
+import os
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from kibris_acil_satilik.parsers import ORJSONParser
+from kibris_acil_satilik.renderers import ORJSONRenderer
+from properties.models import PropertyAdvertisement
+from properties.serializers import PropertyDetailSerializer, PropertyListSerializer
+from vehicles.models import CarAdvertisement
+from vehicles.serializers import CarDetailSerializer, CarListSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Times DRF's JSONRenderer/JSONParser against the orjson renderer and parser on list and "
+        "detail payloads serialized from the database, and on an admin image upload body."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100, help="Advertisements per list payload.")
+        parser.add_argument('--image-kb', type=int, default=2048, help="Size of the base64 image in the upload body.")
+        parser.add_argument('--repeat', type=int, default=5, help="Timing runs; the fastest is reported.")
+
+    def handle(self, *args, **options):
+        request = Request(APIRequestFactory().get('/'))
+        context = {'request': request}
+        property_ads = list(
+            PropertyAdvertisement.objects.filter(is_active=True).select_related('location')
+            .prefetch_related('images')[:options['rows']]
+        )
+        car_ads = list(CarAdvertisement.objects.filter(is_active=True).prefetch_related('images')[:options['rows']])
+        if not property_ads or not car_ads:
+            raise CommandError("Needs at least one active property and car advertisement.")
+
+        payloads = [
+            (f"property list ({len(property_ads)} ads)", PropertyListSerializer(property_ads, many=True, context=context).data),
+            (f"car list ({len(car_ads)} ads)", CarListSerializer(car_ads, many=True, context=context).data),
+            ("property detail", PropertyDetailSerializer(property_ads[0], context=context).data),
+            ("car detail", CarDetailSerializer(car_ads[0], context=context).data),
+        ]
+        for label, data in payloads:
+            self.compare(
+                f"render {label}", options['repeat'],
+                lambda: JSONRenderer().render(data), lambda: ORJSONRenderer().render(data),
+            )
+
+        image = base64.b64encode(os.urandom(options['image_kb'] * 1024)).decode('ascii')
+        body = JSONRenderer().render({
+            'title': 'Benchmark', 'price': '125000.00',
+            'images': [{'image': f'data:image/jpeg;base64,{image}', 'is_cover': True, 'position': 0}],
+        })
+        self.compare(
+            f"parse admin upload ({len(body) // 1024} KB)", options['repeat'],
+            lambda: JSONParser().parse(io.BytesIO(body)), lambda: ORJSONParser().parse(io.BytesIO(body)),
+        )
+
+    def compare(self, label, repeat, baseline, candidate):
+        number, _ = timeit.Timer(baseline).autorange()
+        baseline_time = min(timeit.repeat(baseline, number=number, repeat=repeat)) / number
+        candidate_time = min(timeit.repeat(candidate, number=number, repeat=repeat)) / number
+        self.stdout.write(
+            f"{label}: json {baseline_time * 1e6:.1f} us, orjson {candidate_time * 1e6:.1f} us "
+            f"({baseline_time / candidate_time:.1f}x)"
+        )
@@ -0,0 +1,84 @@
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from core.models import Blob
+from kibris_acil_satilik.images import IMAGE_MODELS, delete_image_files
+from kibris_acil_satilik.storage import image_storage
+
+
+def count_references(names):
+    """Number of image rows referring to each of `names`, across IMAGE_MODELS."""
+    counts = {}
+    for model_label in IMAGE_MODELS:
+        rows = (
+            apps.get_model(model_label).objects.filter(image__in=names)
+            .values('image').annotate(refs=Count('pk')).values_list('image', 'refs')
+        )
+        for name, refs in rows:
+            counts[name] = counts.get(name, 0) + refs
+    return counts
+
+
+class Command(BaseCommand):
+    help = "Deletes image blobs, with their derivatives, that have been unreferenced for longer than the grace period."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace', type=int, default=settings.BLOB_GC_GRACE_SECONDS, help="Seconds a blob must have been unreferenced.")
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help="Only report what would be deleted.")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        cutoff = timezone.now() - timedelta(seconds=options['grace'])
+        deleted = recounted = reused = 0
+        last_pk = 0
+        while True:
+            with transaction.atomic():
+                # Locked rows make concurrent Blob.acquire() calls for the same names wait.
+                batch = list(
+                    Blob.objects.select_for_update(skip_locked=True)
+                    .filter(ref_count__lte=0, updated_at__lt=cutoff, pk__gt=last_pk)
+                    .order_by('pk')[:options['batch_size']]
+                )
+                if not batch:
+                    break
+                last_pk = batch[-1].pk
+
+                # Counters drifted by writes that bypass signals are corrected, not trusted.
+                references = count_references([blob.name for blob in batch])
+                for name, refs in references.items():
+                    recounted += 1
+                    if not options['dry_run']:
+                        Blob.objects.filter(name=name).update(ref_count=refs)
+
+                doomed = []
+                for blob in batch:
+                    if blob.name in references:
+                        continue
+                    # A dedup hit touches the file before the new reference commits.
+                    if image_storage.exists(blob.name) and image_storage.get_modified_time(blob.name) >= cutoff:
+                        reused += 1
+                        continue
+                    doomed.append(blob)
+
+                deleted += len(doomed)
+                if options['dry_run']:
+                    for blob in doomed:
+                        self.stdout.write(blob.name)
+                    continue
+                Blob.objects.filter(pk__in=[blob.pk for blob in doomed]).delete()
+                for blob in doomed:
+                    delete_image_files(image_storage, blob.name)
+
+        action = "Would delete" if options['dry_run'] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {deleted} blobs in {time.monotonic() - started:.1f}s "
+            f"({recounted} still referenced and recounted, {reused} recently reused)."
+        ))
@@ -0,0 +1,132 @@
+import os
+import re
+import shutil
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from core.models import Blob
+from kibris_acil_satilik.images import DERIVATIVE_SUFFIX
+
+# Leftovers of an interrupted ContentAddressedStorage write, never referenced.
+PARTIAL_SUFFIX = re.compile(r'\.[0-9a-f]{32}\.part$')
+
+
+def file_field_sources():
+    """(model, field name) of every FileField, so any stored file a row points to is kept."""
+    return [
+        (model, field.name)
+        for model in apps.get_models()
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField)
+    ]
+
+
+def scan_files(root, exclude=()):
+    """
+    Yields (path relative to `root`, os.DirEntry) for every regular file below `root`,
+    walking directories with os.scandir so only one directory listing is held at a time.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path not in exclude:
+                            pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield os.path.relpath(entry.path, root).replace(os.sep, '/'), entry
+        except FileNotFoundError:
+            continue
+
+
+def referenced_names(names, sources):
+    """The subset of storage `names` referred to by a file field or a core.Blob row."""
+    referenced = set(Blob.objects.filter(name__in=names).values_list('name', flat=True))
+    for model, field_name in sources:
+        remaining = [name for name in names if name not in referenced]
+        if not remaining:
+            break
+        referenced.update(
+            model._default_manager.filter(**{f'{field_name}__in': remaining}).values_list(field_name, flat=True)
+        )
+    return referenced
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes (or quarantines) files under MEDIA_ROOT that no database row refers to and that are "
+        "older than the grace period. Candidates are checked against the database in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace', type=int, default=settings.MEDIA_GC_GRACE_SECONDS, help="Minimum file age in seconds.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Files checked against the DB per query.")
+        parser.add_argument('--quarantine', help="Move orphans into this directory instead of deleting them.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report orphans.")
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.root = os.path.abspath(settings.MEDIA_ROOT)
+        self.quarantine = os.path.abspath(options['quarantine']) if options['quarantine'] else None
+        self.sources = file_field_sources()
+        self.stats = dict.fromkeys(['scanned', 'recent', 'referenced', 'orphaned', 'bytes', 'errors'], 0)
+        started = time.monotonic()
+        cutoff = time.time() - options['grace']
+
+        batch = []
+        for name, entry in scan_files(self.root, exclude={self.quarantine}):
+            self.stats['scanned'] += 1
+            stat = entry.stat(follow_symlinks=False)
+            if stat.st_mtime >= cutoff:
+                self.stats['recent'] += 1
+                continue
+            batch.append((name, stat.st_size))
+            if len(batch) >= options['batch_size']:
+                self.collect(batch)
+                batch = []
+        if batch:
+            self.collect(batch)
+
+        elapsed = time.monotonic() - started
+        action = "Would remove" if options['dry_run'] else ("Quarantined" if self.quarantine else "Deleted")
+        self.stdout.write(self.style.SUCCESS(
+            f"Scanned {self.stats['scanned']} files in {elapsed:.1f}s "
+            f"({self.stats['scanned'] / elapsed if elapsed else 0:.0f} files/s): "
+            f"{self.stats['referenced']} referenced, {self.stats['recent']} within the grace period. "
+            f"{action} {self.stats['orphaned']} orphans ({self.stats['bytes']} bytes), {self.stats['errors']} errors."
+        ))
+
+    def collect(self, batch):
+        """Removes the files of `batch` ((name, size) pairs) that nothing refers to."""
+        owners = {}
+        for name, _ in batch:
+            if not PARTIAL_SUFFIX.search(name):
+                owners[name] = DERIVATIVE_SUFFIX.sub('', name)
+        referenced = referenced_names(list(set(owners.values())), self.sources)
+
+        for name, size in batch:
+            if owners.get(name) in referenced:
+                self.stats['referenced'] += 1
+                continue
+            self.stats['orphaned'] += 1
+            self.stats['bytes'] += size
+            if self.options['dry_run']:
+                self.stdout.write(name)
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                if self.quarantine:
+                    target = os.path.join(self.quarantine, name)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    shutil.move(path, target)
+                else:
+                    os.remove(path)
+            except OSError as e:
+                self.stats['errors'] += 1
+                self.stderr.write(f"{name}: {e}")
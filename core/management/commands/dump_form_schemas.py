@@ -0,0 +1,32 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from properties.views import PROPERTY_FORM_SCHEMA
+from vehicles.views import CAR_FORM_SCHEMA
+
+FORM_SCHEMAS = [
+    ('property-form-schema.json', PROPERTY_FORM_SCHEMA),
+    ('car-form-schema.json', CAR_FORM_SCHEMA),
+]
+
+
+class Command(BaseCommand):
+    help = "Writes the property and car advertisement form schemas to static JSON files for the frontend build."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output-dir', default=os.path.join(settings.STATIC_ROOT, 'form-schemas'),
+            help="Directory to write the schema files to (default: STATIC_ROOT/form-schemas)."
+        )
+
+    def handle(self, *args, **options):
+        output_dir = options['output_dir']
+        os.makedirs(output_dir, exist_ok=True)
+        for file_name, schema in FORM_SCHEMAS:
+            body, etag = schema.get()
+            path = os.path.join(output_dir, file_name)
+            with open(path, 'wb') as f:
+                f.write(body)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path} ({len(body)} bytes, ETag {etag})."))
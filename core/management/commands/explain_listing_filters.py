@@ -0,0 +1,82 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from properties.filters import PropertyFilter
+from properties.views import PublicPropertyListView, PropertyBasicListView
+from vehicles.filters import CarFilter
+from vehicles.views import PublicCarListView, CarBasicListView
+
+# (label, view class, filterset class, query params) for every filter combination the
+# public listings are expected to serve from an index rather than a sequential scan.
+FILTER_COMBINATIONS = [
+    ('properties: default page', PublicPropertyListView, PropertyFilter, {}),
+    ('properties: type', PublicPropertyListView, PropertyFilter, {'type': 'villa'}),
+    ('properties: type + roomType', PublicPropertyListView, PropertyFilter, {'type': 'apartment', 'roomType': '2+1'}),
+    ('properties: type + roomType + price range', PublicPropertyListView, PropertyFilter,
+     {'type': 'apartment', 'roomType': '3+1', 'minPrice': '50000', 'maxPrice': '250000'}),
+    ('properties: city + location', PublicPropertyListView, PropertyFilter, {'city': 'nicosia', 'location': 'kumsal'}),
+    ('properties basic: default page', PropertyBasicListView, None, {}),
+    ('cars: default page', PublicCarListView, CarFilter, {}),
+    ('cars: brand', PublicCarListView, CarFilter, {'brand': 'bmw'}),
+    ('cars: brand + series', PublicCarListView, CarFilter, {'brand': 'bmw', 'series': '3-series'}),
+    ('cars: brand + series + modelYear', PublicCarListView, CarFilter,
+     {'brand': 'toyota', 'series': 'corolla', 'modelYear': '2018'}),
+    ('cars basic: default page', CarBasicListView, None, {}),
+]
+
+
+def find_seq_scans(plan_node, found=None):
+    """Collects the relation names of every Seq Scan node in a JSON EXPLAIN plan tree."""
+    if found is None:
+        found = []
+    if plan_node.get('Node Type') == 'Seq Scan':
+        found.append(plan_node.get('Relation Name'))
+    for child in plan_node.get('Plans', []):
+        find_seq_scans(child, found)
+    return found
+
+
+class Command(BaseCommand):
+    help = "Runs EXPLAIN on each registered public listing filter combination and reports sequential scans."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--analyze', action='store_true', help="Use EXPLAIN ANALYZE (executes the queries).")
+        parser.add_argument(
+            '--force-index', action='store_true',
+            help="Disable seq scans for the session, to check an index is usable on small development tables."
+        )
+        parser.add_argument('--page-size', type=int, default=10)
+        parser.add_argument('--fail-on-seqscan', action='store_true', help="Exit with an error if any seq scan is found.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("explain_listing_filters requires PostgreSQL.")
+
+        seq_scan_combinations = []
+        for label, view_class, filterset_class, params in FILTER_COMBINATIONS:
+            queryset = view_class().get_queryset()
+            if filterset_class is not None:
+                filterset = filterset_class(data=params, queryset=queryset)
+                if not filterset.is_valid():
+                    raise CommandError(f"Invalid params for '{label}': {filterset.errors}")
+                queryset = filterset.qs
+            queryset = queryset[:options['page_size']]
+
+            with transaction.atomic():
+                if options['force_index']:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL enable_seqscan = off")
+                plan = json.loads(queryset.explain(format='json', analyze=options['analyze']))
+
+            seq_scans = find_seq_scans(plan[0]['Plan'])
+            if seq_scans:
+                seq_scan_combinations.append(label)
+                self.stdout.write(self.style.WARNING(f"SEQ SCAN  {label}: {', '.join(sorted(set(seq_scans)))}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"INDEXED   {label}"))
+
+        self.stdout.write(f"{len(FILTER_COMBINATIONS) - len(seq_scan_combinations)}/{len(FILTER_COMBINATIONS)} combinations use indexes only.")
+        if seq_scan_combinations and options['fail_on_seqscan']:
+            raise CommandError(f"{len(seq_scan_combinations)} combination(s) fall back to sequential scans.")
@@ -0,0 +1,85 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from kibris_acil_satilik.images import IMAGE_MODELS, generate_derivatives
+from kibris_acil_satilik.response_cache import invalidate_ad_details, invalidate_public_responses
+
+# Image model -> (response cache namespace, foreign key to the ad) of models with a `status`.
+CACHED_IMAGE_MODELS = {
+    'properties.PropertyImage': ('properties', 'property_ad_id'),
+    'vehicles.CarImage': ('cars', 'car_ad_id'),
+}
+
+
+def generate_for_name(model_label, name, overwrite):
+    """Process pool entry point: returns (name, files written, error message or None)."""
+    storage = apps.get_model(model_label)._meta.get_field('image').storage
+    try:
+        return name, generate_derivatives(storage, name, overwrite=overwrite), None
+    except Exception as e:
+        return name, 0, str(e)
+
+
+class Command(BaseCommand):
+    help = "Generates missing WebP derivatives for existing property, car and offer images using a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count).")
+        parser.add_argument('--overwrite', action='store_true', help="Regenerate derivatives that already exist.")
+        parser.add_argument('--chunk-size', type=int, default=500, help="Image names read from the DB per query.")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        processed = written = failed = 0
+        # Forked workers must not share the parent's DB connections; they only use storage.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            for model_label in IMAGE_MODELS:
+                model = apps.get_model(model_label)
+                names = (
+                    model.objects.exclude(image='')
+                    .values_list('image', flat=True).iterator(chunk_size=options['chunk_size'])
+                )
+                pending, ready = set(), []
+                for name in names:
+                    pending.add(executor.submit(generate_for_name, model_label, name, options['overwrite']))
+                    if len(pending) >= options['chunk_size']:
+                        done = next(as_completed(pending))
+                        pending.discard(done)
+                        processed, written, failed = self.record(done.result(), processed, written, failed, ready)
+                    if len(ready) >= options['chunk_size']:
+                        self.mark_ready(model, ready)
+                for done in as_completed(pending):
+                    processed, written, failed = self.record(done.result(), processed, written, failed, ready)
+                self.mark_ready(model, ready)
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {processed} images in {elapsed:.1f}s ({processed / elapsed if elapsed else 0:.1f}/s): "
+            f"{written} derivatives written, {failed} failed."
+        ))
+
+    def record(self, result, processed, written, failed, ready):
+        name, files_written, error = result
+        if error:
+            self.stderr.write(f"{name}: {error}")
+        else:
+            ready.append(name)
+        return processed + 1, written + files_written, failed + (1 if error else 0)
+
+    def mark_ready(self, model, names):
+        """Marks pending images among `names`, whose derivatives now all exist, as ready."""
+        if names and model._meta.label in CACHED_IMAGE_MODELS:
+            namespace, ad_field = CACHED_IMAGE_MODELS[model._meta.label]
+            images = model.objects.filter(image__in=names, status=model.PENDING)
+            ad_ids = set(images.values_list(ad_field, flat=True))
+            images.update(status=model.READY)
+            # Bulk updates send no signals; cached payloads carry the images' srcset.
+            if ad_ids:
+                invalidate_ad_details(namespace, *ad_ids)
+                invalidate_public_responses(namespace)
+        names.clear()
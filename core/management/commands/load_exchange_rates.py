@@ -0,0 +1,69 @@
+import json
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import ExchangeRate
+from .recompute_price_base import recompute_price_base
+
+
+class Command(BaseCommand):
+    help = (
+        "Loads exchange rates (value of one unit in BASE_CURRENCY) from a JSON file of "
+        "{\"CUR\": rate} or from CUR=rate arguments, then recomputes price_base for the affected ads."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('rates', nargs='*', help="Rates as CUR=rate, e.g. USD=0.79. Overrides --file.")
+        parser.add_argument('--file', default=None, help="JSON rates file. Defaults to settings.EXCHANGE_RATES_FILE.")
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--no-recompute', action='store_true', help="Only store the rates.")
+
+    def handle(self, *args, **options):
+        raw_rates = self.parse_arguments(options['rates']) if options['rates'] else self.read_file(options['file'])
+
+        rates = {}
+        for currency, rate in raw_rates.items():
+            try:
+                rate = Decimal(str(rate))
+            except InvalidOperation:
+                raise CommandError(f"Invalid rate for {currency}: {rate!r}")
+            if rate <= 0:
+                raise CommandError(f"Rate for {currency} must be positive.")
+            rates[currency.upper()] = rate
+
+        changed = []
+        with transaction.atomic():
+            for currency, rate in rates.items():
+                exchange_rate, created = ExchangeRate.objects.get_or_create(currency=currency, defaults={'rate': rate})
+                if created or exchange_rate.rate != rate:
+                    exchange_rate.rate = rate
+                    exchange_rate.save(update_fields=['rate', 'updated_at'])
+                    changed.append(currency)
+        self.stdout.write(f"Loaded {len(rates)} rates, {len(changed)} changed: {', '.join(changed) or '-'}.")
+
+        if changed and not options['no_recompute']:
+            updated = recompute_price_base(options['batch_size'], changed)
+            self.stdout.write(self.style.SUCCESS(f"Recomputed price_base for {updated} advertisements."))
+
+    def parse_arguments(self, arguments):
+        rates = {}
+        for argument in arguments:
+            currency, separator, rate = argument.partition('=')
+            if not separator:
+                raise CommandError(f"Expected CUR=rate, got {argument!r}.")
+            rates[currency.strip()] = rate.strip()
+        return rates
+
+    def read_file(self, path):
+        path = path or settings.EXCHANGE_RATES_FILE
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                rates = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read exchange rates from {path}: {e}")
+        if not isinstance(rates, dict):
+            raise CommandError(f"{path} must contain an object of currency to rate.")
+        return rates
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from core.models import AdIndex
+from properties.models import PropertyAdvertisement
+from vehicles.models import CarAdvertisement
+
+INDEXED_MODELS = [PropertyAdvertisement, CarAdvertisement]
+
+
+def rebuild_ad_index(batch_size=1000):
+    """
+    Upserts the index rows of every ad in pk-range batches and deletes rows whose ad no
+    longer exists. Returns (rows synced, rows removed).
+    """
+    synced = removed = 0
+    for model in INDEXED_MODELS:
+        max_pk = model.objects.aggregate(max_pk=Max('pk'))['max_pk'] or 0
+        for start in range(0, max_pk + 1, batch_size):
+            synced += AdIndex.sync(model, pk__gte=start, pk__lt=start + batch_size)
+        removed += (
+            AdIndex.objects.filter(kind=model.AD_INDEX_KIND)
+            .exclude(ad_id__in=model.objects.values('pk')).delete()[0]
+        )
+    return synced, removed
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the cross-vertical advertisement index (core.AdIndex) from the property and car tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        synced, removed = rebuild_ad_index(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {synced} advertisements, removed {removed} stale rows."))
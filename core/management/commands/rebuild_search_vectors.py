@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from core.models import AdIndex
+from properties.models import PropertyAdvertisement
+from vehicles.models import CarAdvertisement
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the full-text search vectors of all property and car advertisements and "
+        "copies them to the unified search index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for model in (PropertyAdvertisement, CarAdvertisement):
+            max_pk = model.objects.aggregate(max_pk=Max('pk'))['max_pk'] or 0
+            for start in range(0, max_pk + 1, batch_size):
+                model.update_search_vectors(pk__gte=start, pk__lt=start + batch_size)
+                AdIndex.sync(model, pk__gte=start, pk__lt=start + batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt search vectors for {model._meta.verbose_name_plural}."))
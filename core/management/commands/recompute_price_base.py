@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from kibris_acil_satilik.response_cache import invalidate_public_responses
+from properties.models import PropertyAdvertisement
+from vehicles.models import CarAdvertisement
+
+# (model, currency field) of every advertisement with a price_base column.
+PRICED_MODELS = [
+    (PropertyAdvertisement, 'price_currency'),
+    (CarAdvertisement, 'price_type'),
+]
+
+
+def recompute_price_base(batch_size=1000, currencies=None):
+    """
+    Recomputes price_base in pk-range batches, one UPDATE per batch. When `currencies` is given
+    only ads priced in those currencies are touched. Returns the number of rows updated.
+    """
+    updated = 0
+    for model, currency_field in PRICED_MODELS:
+        filters = {f'{currency_field}__in': currencies} if currencies else {}
+        max_pk = model.objects.aggregate(max_pk=Max('pk'))['max_pk'] or 0
+        for start in range(0, max_pk + 1, batch_size):
+            updated += model.update_price_base(pk__gte=start, pk__lt=start + batch_size, **filters)
+    # Bulk updates send no signals; price ordering of the cached public listings changed.
+    invalidate_public_responses('properties')
+    invalidate_public_responses('cars')
+    return updated
+
+
+class Command(BaseCommand):
+    help = "Recomputes the base currency price of all property and car advertisements from the exchange rate table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--currency', action='append', dest='currencies', help="Only recompute ads priced in this currency (repeatable).")
+
+    def handle(self, *args, **options):
+        currencies = [currency.upper() for currency in options['currencies'] or []]
+        updated = recompute_price_base(options['batch_size'], currencies)
+        self.stdout.write(self.style.SUCCESS(f"Recomputed price_base for {updated} advertisements."))
@@ -0,0 +1,16 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from core.models import COUNTED_MODELS, LiveCounter
+
+
+class Command(BaseCommand):
+    help = "Recounts active advertisements and offers and corrects drifted core.LiveCounter rows."
+
+    def handle(self, *args, **options):
+        for label in COUNTED_MODELS:
+            model = apps.get_model(label)
+            corrected = LiveCounter.reconcile(model)
+            self.stdout.write(self.style.SUCCESS(
+                f"Reconciled counters for {model._meta.verbose_name_plural}: {corrected} corrected."
+            ))
@@ -0,0 +1,57 @@
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from core.jobs import claim_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "Runs background jobs from the core.Job queue with a pool of worker threads."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=2, help="Worker threads.")
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument('--once', action='store_true', help="Exit once the queue is drained.")
+
+    def handle(self, *args, **options):
+        self.stats_lock = threading.Lock()
+        self.succeeded = self.failed = 0
+        stop = threading.Event()
+
+        workers = [
+            threading.Thread(target=self.work, args=(stop, options['poll_interval'], options['once']), daemon=True)
+            for _ in range(options['concurrency'])
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            while any(worker.is_alive() for worker in workers):
+                time.sleep(0.2)
+        except KeyboardInterrupt:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+        self.stdout.write(self.style.SUCCESS(f"Jobs succeeded: {self.succeeded}, failed: {self.failed}."))
+
+    def work(self, stop, poll_interval, once):
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                jobs = claim_jobs(limit=1)
+                if not jobs:
+                    if once:
+                        return
+                    stop.wait(poll_interval)
+                    continue
+                for job in jobs:
+                    succeeded = run_job(job)
+                    with self.stats_lock:
+                        if succeeded:
+                            self.succeeded += 1
+                        else:
+                            self.failed += 1
+        finally:
+            connection.close()
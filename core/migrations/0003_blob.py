@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 00:28
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_blobs(apps, schema_editor):
+    """Counts the references of the files already stored by the image models."""
+    Blob = apps.get_model('core', 'Blob')
+    counts = {}
+    for app_label, model_name in [('properties', 'PropertyImage'), ('vehicles', 'CarImage'), ('accounts', 'OfferImage')]:
+        rows = (
+            apps.get_model(app_label, model_name).objects.exclude(image='')
+            .values('image').annotate(refs=Count('pk')).values_list('image', 'refs')
+        )
+        for name, refs in rows:
+            counts[name] = counts.get(name, 0) + refs
+    Blob.objects.bulk_create([Blob(name=name, ref_count=refs) for name, refs in counts.items()], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_job'),
+        ('accounts', '0002_rename_model_name_caroffer_brand_caroffer_fuel_type_and_more'),
+        ('properties', '0010_image_status'),
+        ('vehicles', '0010_image_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('ref_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('ref_count__lte', 0)), fields=['updated_at'], name='core_blob_unreferenced_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_blobs, migrations.RunPython.noop),
+    ]
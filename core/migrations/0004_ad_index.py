@@ -0,0 +1,58 @@
+# Generated by Django 5.2 on 2026-10-17 00:34
+
+from django.db import migrations, models
+
+
+def backfill_ad_index(apps, schema_editor):
+    AdIndex = apps.get_model('core', 'AdIndex')
+    sources = [
+        ('property', apps.get_model('properties', 'PropertyAdvertisement'), 'price_currency'),
+        ('car', apps.get_model('vehicles', 'CarAdvertisement'), 'price_type'),
+    ]
+    for kind, model, currency_field in sources:
+        rows = model.objects.values_list(
+            'pk', 'published_date', 'is_active', 'title', 'price', currency_field, 'advertisement_type', 'cover_image_path'
+        ).iterator(chunk_size=1000)
+        AdIndex.objects.bulk_create(
+            (
+                AdIndex(
+                    kind=kind, ad_id=pk, published_date=published_date, is_active=is_active, title=title,
+                    price=price, currency=currency, advertisement_type=advertisement_type,
+                    cover_image_path=cover_image_path,
+                )
+                for pk, published_date, is_active, title, price, currency, advertisement_type, cover_image_path in rows
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_blob'),
+        ('properties', '0011_image_blob_storage'),
+        ('vehicles', '0011_image_blob_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('property', 'Property'), ('car', 'Car')], max_length=10)),
+                ('ad_id', models.IntegerField()),
+                ('published_date', models.DateTimeField()),
+                ('is_active', models.BooleanField(default=True)),
+                ('title', models.CharField(max_length=200)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=20)),
+                ('currency', models.CharField(max_length=3)),
+                ('advertisement_type', models.CharField(max_length=50)),
+                ('cover_image_path', models.CharField(blank=True, max_length=255, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('is_active', True)), fields=['-published_date', '-id'], name='core_adindex_feed_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'ad_id'), name='core_adindex_kind_ad_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_ad_index, migrations.RunPython.noop),
+    ]
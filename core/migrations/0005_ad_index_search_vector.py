@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-17 00:36
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_search_vectors(apps, schema_editor):
+    AdIndex = apps.get_model('core', 'AdIndex')
+    sources = [
+        ('property', apps.get_model('properties', 'PropertyAdvertisement')),
+        ('car', apps.get_model('vehicles', 'CarAdvertisement')),
+    ]
+    for kind, model in sources:
+        AdIndex.objects.filter(kind=kind).update(
+            search_vector=Subquery(model.objects.filter(pk=OuterRef('ad_id')).values('search_vector')[:1])
+        )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_ad_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adindex',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='adindex',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('is_active', True)), fields=['search_vector'], name='core_adindex_search_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-17 00:39
+
+from django.db import migrations, models
+
+
+def backfill_live_counters(apps, schema_editor):
+    LiveCounter = apps.get_model('core', 'LiveCounter')
+    sources = [
+        ('properties', apps.get_model('properties', 'PropertyAdvertisement'), ['advertisement_type', 'property_type']),
+        ('cars', apps.get_model('vehicles', 'CarAdvertisement'), ['advertisement_type', 'vehicle_type']),
+        ('offers', apps.get_model('accounts', 'Offer'), ['offer_type']),
+    ]
+    counters = []
+    for scope, model, dimensions in sources:
+        active = model.objects.filter(is_active=True)
+        counters.append(LiveCounter(scope=scope, count=active.count()))
+        for dimension in dimensions:
+            for row in active.values(dimension).annotate(n=models.Count('pk')).order_by():
+                counters.append(LiveCounter(scope=scope, dimension=dimension, value=row[dimension] or '', count=row['n']))
+    LiveCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_ad_index_search_vector'),
+        ('accounts', '0003_image_blob_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LiveCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(max_length=30)),
+                ('dimension', models.CharField(blank=True, default='', max_length=50)),
+                ('value', models.CharField(blank=True, default='', max_length=50)),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('scope', 'dimension', 'value'), name='core_livecounter_key_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_live_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,292 @@
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models, transaction
+from django.db.models import Case, F, OuterRef, Subquery, When
+from django.utils import timezone
+
+
+class ExchangeRate(models.Model):
+    """Value of one unit of `currency` in settings.BASE_CURRENCY."""
+    currency = models.CharField(max_length=3, unique=True)
+    rate = models.DecimalField(max_digits=20, decimal_places=10)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['currency']
+
+    def __str__(self):
+        return f"1 {self.currency} = {self.rate} {settings.BASE_CURRENCY}"
+
+    @classmethod
+    def conversion_expression(cls, amount_field, currency_field):
+        """
+        Expression converting `amount_field` priced in `currency_field` to BASE_CURRENCY, for
+        use in an UPDATE. Amounts in a currency without a rate convert to NULL.
+        """
+        rate = cls.objects.filter(currency=OuterRef(currency_field)).values('rate')[:1]
+        return Case(
+            When(**{currency_field: settings.BASE_CURRENCY}, then=F(amount_field)),
+            default=F(amount_field) * Subquery(rate),
+            output_field=models.DecimalField(max_digits=20, decimal_places=2),
+        )
+
+
+class Job(models.Model):
+    """
+    A unit of background work claimed by `run_jobs` workers with SELECT ... FOR UPDATE SKIP
+    LOCKED. `kind` names a handler in settings.JOB_HANDLERS, which is called with `payload`.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['run_after', 'id'], name='core_job_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+            models.Index(
+                fields=['locked_at'], name='core_job_running_idx',
+                condition=models.Q(status='running'),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.status})"
+
+
+class Blob(models.Model):
+    """
+    A stored image file (see kibris_acil_satilik.storage.ContentAddressedStorage) and the
+    number of PropertyImage, CarImage and OfferImage rows referring to it, kept by the
+    signals in core.signals. Blobs left unreferenced are deleted by `collect_blobs`.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    ref_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['updated_at'], name='core_blob_unreferenced_idx',
+                condition=models.Q(ref_count__lte=0),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
+    @classmethod
+    def acquire(cls, *names):
+        """Adds a reference to each of `names` (repeats count), creating missing rows in one upsert."""
+        counts = Counter(name for name in names if name)
+        if not counts:
+            return
+        table = cls._meta.db_table
+        values = ", ".join(["(%s, %s, %s)"] * len(counts))
+        params = []
+        now = timezone.now()
+        for name, count in counts.items():
+            params += [name, count, now]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (name, ref_count, updated_at) VALUES {values} "
+                f"ON CONFLICT (name) DO UPDATE SET ref_count = {table}.ref_count + EXCLUDED.ref_count, "
+                f"updated_at = EXCLUDED.updated_at",
+                params,
+            )
+
+    @classmethod
+    def release(cls, *names):
+        """Drops a reference to each of `names` (repeats count)."""
+        counts = Counter(name for name in names if name)
+        now = timezone.now()
+        for name, count in counts.items():
+            cls.objects.filter(name=name).update(ref_count=F('ref_count') - count, updated_at=now)
+
+
+class AdIndex(models.Model):
+    """
+    One row per property and car advertisement holding what cross-vertical feeds show, so
+    they read a single table instead of merging per-vertical queries. It also carries each
+    ad's `search_vector`, so one GIN index answers searches across both verticals and ranks
+    them on one scale. Ad models name their
+    `AD_INDEX_KIND` and map the index columns to their own fields in `AD_INDEX_COLUMNS`;
+    rows are kept current by the apps' signals (see sync) and rebuilt by `rebuild_ad_index`.
+    """
+    PROPERTY = 'property'
+    CAR = 'car'
+    KIND_CHOICES = [
+        (PROPERTY, 'Property'),
+        (CAR, 'Car'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    ad_id = models.IntegerField()
+    published_date = models.DateTimeField()
+    is_active = models.BooleanField(default=True)
+    title = models.CharField(max_length=200)
+    price = models.DecimalField(max_digits=20, decimal_places=2)
+    currency = models.CharField(max_length=3)
+    advertisement_type = models.CharField(max_length=50)
+    cover_image_path = models.CharField(max_length=255, blank=True, null=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'ad_id'], name='core_adindex_kind_ad_uniq'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['-published_date', '-id'], name='core_adindex_feed_idx',
+                condition=models.Q(is_active=True),
+            ),
+            GinIndex(fields=['search_vector'], name='core_adindex_search_idx', condition=models.Q(is_active=True)),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.ad_id}: {self.title}"
+
+    @classmethod
+    def sync(cls, ad_model, **filters):
+        """Upserts the index rows of the `ad_model` ads matching `filters`, two queries in all."""
+        columns = ad_model.AD_INDEX_COLUMNS
+        rows = ad_model.objects.filter(**filters).values('pk', *columns.values())
+        entries = [
+            cls(kind=ad_model.AD_INDEX_KIND, ad_id=row['pk'], **{column: row[field] for column, field in columns.items()})
+            for row in rows
+        ]
+        cls.objects.bulk_create(
+            entries, batch_size=1000,
+            update_conflicts=True, unique_fields=['kind', 'ad_id'], update_fields=list(columns),
+        )
+        return len(entries)
+
+    @classmethod
+    def remove(cls, ad_model, *ad_ids):
+        cls.objects.filter(kind=ad_model.AD_INDEX_KIND, ad_id__in=ad_ids).delete()
+
+
+# Models counted by LiveCounter, as app labels.
+COUNTED_MODELS = ['properties.PropertyAdvertisement', 'vehicles.CarAdvertisement', 'accounts.Offer']
+
+
+class LiveCounter(models.Model):
+    """
+    Number of active rows of a counted model (`scope`), in total (empty `dimension`) and per
+    value of each of its `COUNTER_DIMENSIONS` fields, so dashboards read a handful of rows
+    instead of counting the tables. Counted models are listed in COUNTED_MODELS; the signals
+    in core.signals apply each save's and delete's change right after it, inside the writer's
+    transaction when there is one, and `reconcile_counters` recounts to fix drift from
+    queryset updates or concurrent edits.
+    """
+    scope = models.CharField(max_length=30)
+    dimension = models.CharField(max_length=50, blank=True, default='')
+    value = models.CharField(max_length=50, blank=True, default='')
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'dimension', 'value'], name='core_livecounter_key_uniq'),
+        ]
+
+    def __str__(self):
+        key = f"{self.dimension}={self.value}" if self.dimension else "total"
+        return f"{self.scope} {key}: {self.count}"
+
+    @staticmethod
+    def counted_fields(model):
+        return ['is_active', *model.COUNTER_DIMENSIONS]
+
+    @staticmethod
+    def keys(model, values):
+        """Counter keys a row with these counted field `values` contributes to."""
+        if not values or not values['is_active']:
+            return []
+        scope = model.COUNTER_SCOPE
+        return [(scope, '', '')] + [(scope, dimension, values[dimension] or '') for dimension in model.COUNTER_DIMENSIONS]
+
+    @classmethod
+    def apply(cls, added=(), removed=()):
+        """Adds one per key in `added` and subtracts one per key in `removed`, in one upsert."""
+        deltas = Counter(added)
+        deltas.subtract(removed)
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        table = cls._meta.db_table
+        values = ", ".join(["(%s, %s, %s, %s)"] * len(deltas))
+        params = []
+        for (scope, dimension, value), delta in deltas.items():
+            params += [scope, dimension, value, delta]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (scope, dimension, value, count) VALUES {values} "
+                f"ON CONFLICT (scope, dimension, value) DO UPDATE SET count = {table}.count + EXCLUDED.count",
+                params,
+            )
+
+    @classmethod
+    def reconcile(cls, model):
+        """
+        Recounts the active rows of `model` and rewrites its counters, locking them meanwhile.
+        Returns the number of counters that were corrected.
+        """
+        scope = model.COUNTER_SCOPE
+        with transaction.atomic():
+            stored = {
+                (counter.scope, counter.dimension, counter.value): counter
+                for counter in cls.objects.select_for_update().filter(scope=scope)
+            }
+            active = model.objects.filter(is_active=True)
+            expected = Counter({(scope, '', ''): active.count()})
+            for dimension in model.COUNTER_DIMENSIONS:
+                for row in active.values(dimension).annotate(n=models.Count('pk')).order_by():
+                    expected[(scope, dimension, row[dimension] or '')] += row['n']
+
+            stale = [counter.pk for key, counter in stored.items() if key not in expected and counter.count]
+            changed = [
+                cls(scope=key[0], dimension=key[1], value=key[2], count=count)
+                for key, count in expected.items()
+                if key not in stored or stored[key].count != count
+            ]
+            cls.objects.filter(pk__in=stale).delete()
+            cls.objects.bulk_create(
+                changed, update_conflicts=True,
+                unique_fields=['scope', 'dimension', 'value'], update_fields=['count'],
+            )
+        return len(stale) + len(changed)
+
+    @classmethod
+    def totals(cls, *scopes):
+        """{scope: {'total': n, dimension: {value: n}}} for `scopes`, read in one query."""
+        totals = {scope: {'total': 0} for scope in scopes}
+        for scope, dimension, value, count in cls.objects.filter(scope__in=scopes).values_list(
+            'scope', 'dimension', 'value', 'count'
+        ):
+            if dimension:
+                totals[scope].setdefault(dimension, {})[value] = count
+            else:
+                totals[scope]['total'] = count
+        return totals
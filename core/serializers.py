@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+from kibris_acil_satilik.storage import image_storage
+from .models import AdIndex
+
+
+class AdCardSerializer(serializers.ModelSerializer):
+    """Compact card of a property or car advertisement, read from core.AdIndex alone."""
+    id = serializers.IntegerField(source='ad_id', read_only=True)
+    cover_image = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AdIndex
+        fields = ('kind', 'id', 'title', 'price', 'currency', 'advertisement_type', 'cover_image', 'published_date')
+
+    def get_cover_image(self, obj):
+        request = self.context.get('request')
+        if obj.cover_image_path and request:
+            return request.build_absolute_uri(image_storage.url(obj.cover_image_path))
+        return None
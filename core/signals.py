@@ -0,0 +1,70 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Blob, LiveCounter
+
+
+@receiver(pre_save, sender='properties.PropertyImage')
+@receiver(pre_save, sender='vehicles.CarImage')
+@receiver(pre_save, sender='accounts.OfferImage')
+def remember_replaced_image(sender, instance, update_fields=None, **kwargs):
+    instance._replaced_image_name = None
+    if instance._state.adding or (update_fields is not None and 'image' not in update_fields):
+        return
+    stored_name = sender.objects.filter(pk=instance.pk).values_list('image', flat=True).first()
+    if stored_name != instance.image.name:
+        instance._replaced_image_name = stored_name
+
+
+@receiver(post_save, sender='properties.PropertyImage')
+@receiver(post_save, sender='vehicles.CarImage')
+@receiver(post_save, sender='accounts.OfferImage')
+def acquire_image_blob(sender, instance, created=False, **kwargs):
+    replaced_name = getattr(instance, '_replaced_image_name', None)
+    if created or replaced_name:
+        Blob.acquire(instance.image.name)
+    if replaced_name:
+        Blob.release(replaced_name)
+
+
+@receiver(post_delete, sender='properties.PropertyImage')
+@receiver(post_delete, sender='vehicles.CarImage')
+@receiver(post_delete, sender='accounts.OfferImage')
+def release_image_blob(sender, instance, **kwargs):
+    Blob.release(instance.image.name)
+
+
+@receiver(pre_save, sender='properties.PropertyAdvertisement')
+@receiver(pre_save, sender='vehicles.CarAdvertisement')
+@receiver(pre_save, sender='accounts.Offer')
+def remember_counted_values(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._counted_keys = None
+    if raw:
+        return
+    if instance._state.adding:
+        instance._counted_keys = []
+        return
+    fields = LiveCounter.counted_fields(sender)
+    if update_fields is not None and not set(fields) & set(update_fields):
+        return
+    stored = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    instance._counted_keys = LiveCounter.keys(sender, stored)
+
+
+@receiver(post_save, sender='properties.PropertyAdvertisement')
+@receiver(post_save, sender='vehicles.CarAdvertisement')
+@receiver(post_save, sender='accounts.Offer')
+def update_live_counters(sender, instance, raw=False, **kwargs):
+    previous_keys = getattr(instance, '_counted_keys', None)
+    if raw or previous_keys is None:
+        return
+    values = {field: getattr(instance, field) for field in LiveCounter.counted_fields(sender)}
+    LiveCounter.apply(added=LiveCounter.keys(sender, values), removed=previous_keys)
+
+
+@receiver(post_delete, sender='properties.PropertyAdvertisement')
+@receiver(post_delete, sender='vehicles.CarAdvertisement')
+@receiver(post_delete, sender='accounts.Offer')
+def release_live_counters(sender, instance, **kwargs):
+    values = {field: getattr(instance, field) for field in LiveCounter.counted_fields(sender)}
+    LiveCounter.apply(removed=LiveCounter.keys(sender, values))
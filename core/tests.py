@@ -0,0 +1,404 @@
+import io
+import shutil
+import tempfile
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.core.paginator import EmptyPage
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from PIL import Image
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import User
+from kibris_acil_satilik.counting import CountStrategyPaginator
+from kibris_acil_satilik.images import derivative_names, generate_derivatives, srcset_for
+from kibris_acil_satilik.pagination import CustomPagination
+from kibris_acil_satilik.parsers import ORJSONParser
+from kibris_acil_satilik.renderers import ORJSONRenderer
+from kibris_acil_satilik.storage import ContentAddressedStorage, image_storage
+from properties.models import Location, PropertyAdvertisement, PropertyImage
+from .models import AdIndex, Blob, LiveCounter
+
+
+def jpeg_bytes(size=(64, 48)):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, (200, 30, 30)).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+class ContentAddressedStorageTests(SimpleTestCase):
+
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location)
+        self.storage = ContentAddressedStorage(location=self.location)
+
+    def test_identical_content_is_stored_once(self):
+        first = self.storage.save('property_images/a.jpg', ContentFile(jpeg_bytes()))
+        second = self.storage.save('car_images/b.JPG', ContentFile(jpeg_bytes()))
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith('blobs/') and first.endswith('.jpg'))
+
+    def test_derivatives_of_a_blob_are_stored_next_to_it(self):
+        name = self.storage.save('property_images/a.jpg', ContentFile(jpeg_bytes()))
+        self.assertEqual(generate_derivatives(self.storage, name), len(derivative_names(name)))
+        for derivative in derivative_names(name):
+            self.assertTrue(self.storage.exists(derivative), derivative)
+
+    def test_derivatives_of_a_legacy_file_are_stored_next_to_it(self):
+        # Files saved before content addressing keep their upload_to path.
+        self.storage._write('property_images/old.jpg', ContentFile(jpeg_bytes()))
+        self.assertEqual(
+            generate_derivatives(self.storage, 'property_images/old.jpg'), len(derivative_names('property_images/old.jpg'))
+        )
+        for derivative in derivative_names('property_images/old.jpg'):
+            self.assertTrue(self.storage.exists(derivative), derivative)
+        self.assertEqual(generate_derivatives(self.storage, 'property_images/old.jpg'), 0)
+
+
+
+    def test_uploads_cannot_replace_stored_files_by_name(self):
+        name = self.storage.save('accounts/offer_images/a.jpg', ContentFile(jpeg_bytes()))
+        generate_derivatives(self.storage, name)
+        derivative = derivative_names(name)[0]
+        with self.storage.open(derivative, 'rb') as f:
+            stored = f.read()
+
+        for upload_name in (derivative, name, 'accounts/offer_images/x.jpg.w320.webp'):
+            saved = self.storage.save(upload_name, ContentFile(b'not the original bytes'))
+            self.assertNotEqual(saved, upload_name)
+            self.assertTrue(saved.startswith('blobs/') and not saved.endswith('.w320.webp'))
+        with self.storage.open(derivative, 'rb') as f:
+            self.assertEqual(f.read(), stored)
+        with self.assertRaises(ValueError):
+            self.storage.save_derivative('accounts/offer_images/x.jpg', ContentFile(b''))
+
+    def test_srcset_lists_only_written_derivatives(self):
+        name = self.storage.save('accounts/offer_images/a.jpg', ContentFile(jpeg_bytes()))
+        build_url = 'https://example.com'.__add__
+        self.assertEqual(srcset_for(build_url, self.storage, name), build_url(self.storage.url(name)))
+        self.assertEqual(srcset_for(build_url, self.storage, name, ready=False), build_url(self.storage.url(name)))
+
+        generate_derivatives(self.storage, name)
+        self.storage.delete(derivative_names(name)[-1])
+        widths = [entry.rsplit(' ', 1)[1] for entry in srcset_for(build_url, self.storage, name).split(', ')]
+        self.assertEqual(widths, [f'{width}w' for width in settings.IMAGE_DERIVATIVE_WIDTHS[:-1]])
+
+class BlobReferenceTests(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        location = Location.objects.create(city='Nicosia', area=None)
+        self.ads = [
+            PropertyAdvertisement.objects.create(
+                location=location, title=f'House {i}', price=Decimal('100000'), price_currency='GBP',
+                address='Main street', room_type='3+1', property_type='villa', advertisement_type='sale',
+                gross_area=120,
+            )
+            for i in range(2)
+        ]
+
+    def collect(self):
+        call_command('collect_blobs', grace=0, stdout=io.StringIO())
+
+    def test_last_release_lets_collect_blobs_free_the_blob(self):
+        images = [
+            PropertyImage.objects.create(property_ad=ad, image=ContentFile(jpeg_bytes(), name='house.jpg'))
+            for ad in self.ads
+        ]
+        name = images[0].image.name
+        self.assertEqual(images[1].image.name, name)
+        self.assertEqual(Blob.objects.get(name=name).ref_count, 2)
+
+        images[0].delete()
+        self.assertEqual(Blob.objects.get(name=name).ref_count, 1)
+        self.collect()
+        self.assertTrue(Blob.objects.filter(name=name).exists())
+        self.assertTrue(image_storage.exists(name))
+
+        images[1].delete()
+        self.assertEqual(Blob.objects.get(name=name).ref_count, 0)
+        self.collect()
+        self.assertFalse(Blob.objects.filter(name=name).exists())
+        self.assertFalse(image_storage.exists(name))
+
+    def test_drifted_count_is_recounted_instead_of_freed(self):
+        image = PropertyImage.objects.create(property_ad=self.ads[0], image=ContentFile(jpeg_bytes(), name='house.jpg'))
+        Blob.objects.filter(name=image.image.name).update(ref_count=0)
+        self.collect()
+        self.assertEqual(Blob.objects.get(name=image.image.name).ref_count, 1)
+        self.assertTrue(image_storage.exists(image.image.name))
+
+class CursorPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        # Three rows share a published_date, so pages have to split ties on id.
+        dates = [now, now - timedelta(hours=1), now - timedelta(hours=1), now - timedelta(hours=1),
+                 now - timedelta(hours=2), now - timedelta(hours=3), now - timedelta(hours=3)]
+        cls.rows = [
+            AdIndex.objects.create(
+                kind=AdIndex.CAR, ad_id=900000 + i, published_date=published_date, title=f'Car {i}',
+                price=Decimal('1000'), currency='GBP', advertisement_type='sale',
+            )
+            for i, published_date in enumerate(dates)
+        ]
+
+    def queryset(self, ordering='-published_date'):
+        return AdIndex.objects.filter(kind=AdIndex.CAR, ad_id__gte=900000).order_by(ordering)
+
+    def paginate(self, queryset, cursor='', page_size=2):
+        paginator = CustomPagination()
+        request = Request(APIRequestFactory().get('/', {'cursor': cursor, 'page_size': page_size}))
+        return paginator, [row.pk for row in paginator.paginate_queryset(queryset, request)]
+
+    def walk(self, ordering):
+        pks, cursor = [], ''
+        # Bounded, so a cursor that stops advancing fails the test instead of looping.
+        for _ in range(len(self.rows)):
+            paginator, page = self.paginate(self.queryset(ordering), cursor)
+            pks += page
+            cursor = paginator.next_cursor
+            if cursor is None:
+                break
+        return pks
+
+    def newest_first(self):
+        return [row.pk for row in sorted(self.rows, key=lambda row: (row.published_date, row.pk), reverse=True)]
+
+    def test_pages_split_ties_without_duplicates_or_skips(self):
+        self.assertEqual(self.walk('-published_date'), self.newest_first())
+        self.assertEqual(self.walk('published_date'), self.newest_first()[::-1])
+
+    def test_next_page_seeks_past_the_cursor_row(self):
+        paginator, first_page = self.paginate(self.queryset())
+        # A newer row published after the first page was served does not shift the next one.
+        AdIndex.objects.create(
+            kind=AdIndex.CAR, ad_id=900100, published_date=timezone.now(), title='Newer car',
+            price=Decimal('1000'), currency='GBP', advertisement_type='sale',
+        )
+        _, second_page = self.paginate(self.queryset(), paginator.next_cursor)
+        self.assertEqual(first_page + second_page, self.newest_first()[:4])
+
+    def test_last_page_has_no_cursor(self):
+        paginator, page = self.paginate(self.queryset(), page_size=len(self.rows))
+        self.assertEqual(len(page), len(self.rows))
+        self.assertFalse(paginator.cursor_has_next)
+        self.assertIsNone(paginator.next_cursor)
+
+    def test_invalid_cursor_is_not_found(self):
+        for cursor in ('not-a-cursor', 'e30=', '!!!'):
+            with self.assertRaises(NotFound):
+                self.paginate(self.queryset(), cursor)
+
+    def test_cursor_of_another_ordering_is_not_found(self):
+        paginator, _ = self.paginate(self.queryset('-published_date'))
+        with self.assertRaises(NotFound):
+            self.paginate(self.queryset('published_date'), paginator.next_cursor)
+
+
+
+@override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=0)
+class EstimatedCountPaginationTests(TestCase):
+    """A planner estimate short of the real count must not hide the pages past it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(7):
+            AdIndex.objects.create(
+                kind=AdIndex.CAR, ad_id=900000 + i, published_date=timezone.now(), title=f'Car {i}',
+                price=Decimal('1000'), currency='GBP', advertisement_type='sale',
+            )
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch('kibris_acil_satilik.counting.estimate_count', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def queryset(self):
+        return AdIndex.objects.filter(kind=AdIndex.CAR, ad_id__gte=900000).order_by('ad_id')
+
+    def test_pages_past_the_estimate_are_served(self):
+        paginator = CountStrategyPaginator(self.queryset(), 2)
+        self.assertEqual((paginator.count, paginator.count_is_estimate, paginator.num_pages), (2, True, 1))
+        pages = [paginator.page(number) for number in (1, 2, 3, 4)]
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual([page.has_next() for page in pages], [True, True, True, False])
+        self.assertEqual(pages[2].next_page_number(), 4)
+        with self.assertRaises(EmptyPage):
+            paginator.page(5)
+        with self.assertRaises(EmptyPage):
+            paginator.page(0)
+
+    def test_total_pages_covers_the_pages_reached(self):
+        pagination = CustomPagination()
+        request = Request(APIRequestFactory().get('/', {'page': 3, 'page_size': 2}))
+        page = pagination.paginate_queryset(self.queryset(), request)
+        data = pagination.get_paginated_response([row.pk for row in page]).data
+        self.assertEqual(len(data['results']), 2)
+        self.assertTrue(data['count_is_estimate'] and data['total_pages_is_estimate'])
+        self.assertEqual((data['total_pages'], data['has_next']), (4, True))
+        self.assertIn('page=4', data['next'])
+
+    @override_settings(PAGINATION_COUNT_ESTIMATE_THRESHOLD=100)
+    def test_exact_counts_still_end_at_the_last_page(self):
+        paginator = CountStrategyPaginator(self.queryset(), 2)
+        self.assertEqual((paginator.count, paginator.count_is_estimate), (7, False))
+        self.assertFalse(paginator.page(4).has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(5)
+
+class LiveCounterTests(TestCase):
+
+    def setUp(self):
+        # Start from counters that match the table, whatever the database already holds.
+        LiveCounter.reconcile(PropertyAdvertisement)
+        self.before = self.totals()
+        self.ad = PropertyAdvertisement.objects.create(
+            location=Location.objects.create(city='Iskele', area=None), title='Beach house',
+            price=Decimal('150000'), price_currency='GBP', address='Coast road', room_type='4+1',
+            property_type='villa', advertisement_type='sale', gross_area=200,
+        )
+
+    def totals(self):
+        return LiveCounter.totals(PropertyAdvertisement.COUNTER_SCOPE)[PropertyAdvertisement.COUNTER_SCOPE]
+
+    def change(self, dimension=None, value=None):
+        """Difference from the counts before the test's ad existed."""
+        after, before = self.totals(), self.before
+        if dimension is None:
+            return after['total'] - before['total']
+        return after.get(dimension, {}).get(value, 0) - before.get(dimension, {}).get(value, 0)
+
+    def test_saves_and_deletes_move_the_counters(self):
+        self.assertEqual((self.change(), self.change('property_type', 'villa')), (1, 1))
+
+        self.ad.is_active = False
+        self.ad.save()
+        self.assertEqual((self.change(), self.change('property_type', 'villa')), (0, 0))
+
+        self.ad.is_active = True
+        self.ad.property_type = 'apartment'
+        self.ad.save()
+        self.assertEqual(
+            (self.change(), self.change('property_type', 'villa'), self.change('property_type', 'apartment')),
+            (1, 0, 1),
+        )
+
+        self.ad.delete()
+        self.assertEqual((self.change(), self.change('property_type', 'apartment')), (0, 0))
+
+    def test_reconcile_counters_corrects_drift(self):
+        # Queryset updates send no signals.
+        PropertyAdvertisement.objects.filter(pk=self.ad.pk).update(is_active=False)
+        LiveCounter.objects.filter(scope=PropertyAdvertisement.COUNTER_SCOPE, dimension='').update(count=F('count') + 5)
+        self.assertEqual(self.change(), 6)
+
+        call_command('reconcile_counters', stdout=io.StringIO())
+        self.assertEqual(self.totals(), self.before)
+        self.assertEqual(LiveCounter.reconcile(PropertyAdvertisement), 0)
+
+
+class PublicResponseCacheTests(TestCase):
+    """Cached public responses are served until a save or delete bumps their generation."""
+
+    def setUp(self):
+        cache.clear()
+        self.ad = PropertyAdvertisement.objects.create(
+            location=Location.objects.create(city='Lefke', area=None), title='Orchard house',
+            price=Decimal('120000'), price_currency='GBP', address='Orchard lane', room_type='3+1',
+            property_type='villa', advertisement_type='sale', gross_area=140,
+        )
+
+    def titles(self, client=None):
+        response = (client or self.client).get('/api/properties/', {'city': 'Lefke'})
+        self.assertEqual(response.status_code, 200)
+        return [result['title'] for result in response.json()['results']]
+
+    def test_cached_response_is_served_until_a_save(self):
+        self.assertEqual(self.titles(), ['Orchard house'])
+        # Queryset updates send no signals, so the cached response is still served.
+        PropertyAdvertisement.objects.filter(pk=self.ad.pk).update(title='Stale orchard house')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.titles(), ['Orchard house'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ad.title = 'Lemon grove house'
+            self.ad.save()
+        self.assertEqual(self.titles(), ['Lemon grove house'])
+
+    def test_delete_invalidates_the_cached_response(self):
+        self.assertEqual(self.titles(), ['Orchard house'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.ad.delete()
+        self.assertEqual(self.titles(), [])
+
+    def test_authenticated_requests_bypass_the_cache(self):
+        self.assertEqual(self.titles(), ['Orchard house'])
+        PropertyAdvertisement.objects.filter(pk=self.ad.pk).update(title='Lemon grove house')
+        admin_client = APIClient()
+        admin_client.force_authenticate(User.objects.create_user(email='viewer@example.com', password='secret'))
+        response = admin_client.get('/api/properties/', {'city': 'Lefke'})
+        self.assertEqual([result['title'] for result in response.json()['results']], ['Lemon grove house'])
+        self.assertNotIn('public', response.get('Cache-Control', ''))
+        self.assertEqual(self.titles(), ['Orchard house'])
+
+
+class ORJSONRendererParserTests(SimpleTestCase):
+    payload = {
+        'id': 7,
+        'title': 'Deniz manzaralı villa \u2028 ≠ "quoted"',
+        'price': Decimal('125000.50'),
+        'ratio': 0.1,
+        'published': datetime(2026, 10, 17, 9, 30, 5, 123456, tzinfo=dt_timezone.utc),
+        'available_from': date(2026, 11, 1),
+        'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+        'label': gettext_lazy('Sale'),
+        'images': [{'position': 0, 'srcset': None, 'is_cover': True}],
+        'features': {},
+    }
+
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), 'application/json', {})
+
+    def test_round_trip_matches_drf(self):
+        body = ORJSONRenderer().render(self.payload)
+        self.assertEqual(body, JSONRenderer().render(self.payload))
+        self.assertEqual(self.parse(ORJSONParser(), body), self.parse(JSONParser(), body))
+        self.assertEqual(self.parse(ORJSONParser(), body)['price'], 125000.5)
+
+    def test_documented_float_differences(self):
+        # JSONRenderer refuses non-finite floats; dumps() writes them as null.
+        with self.assertRaises(ValueError):
+            JSONRenderer().render({'n': float('nan')})
+        self.assertEqual(ORJSONRenderer().render({'n': float('nan'), 'i': float('inf')}), b'{"n":null,"i":null}')
+        body = ORJSONRenderer().render([1e-7, 1e16])
+        self.assertEqual(body, b'[1e-7,1e16]')
+        self.assertEqual(self.parse(ORJSONParser(), body), self.parse(JSONParser(), JSONRenderer().render([1e-7, 1e16])))
+
+    def test_parser_rejects_what_strict_json_parser_does(self):
+        for body in (b'{"n": NaN}', b'{"n": Infinity}', b'{"title": '):
+            with self.assertRaises(ParseError):
+                self.parse(ORJSONParser(), body)
+            with self.assertRaises(ParseError):
+                self.parse(JSONParser(), body)
@@ -0,0 +1,113 @@
+import binascii
+from collections import namedtuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils import timezone
+from knox.auth import TokenAuthentication
+from knox.crypto import hash_token
+from knox.models import AuthToken
+from knox.settings import knox_settings
+
+from .lru import LRUCache
+
+CachedToken = namedtuple('CachedToken', ['digest', 'token_key', 'user_id', 'expiry'])
+
+# Verified tokens of this process, keyed by the raw token so hits skip hashing.
+token_cache = LRUCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+shared_cache_counts = {'hits': 0, 'misses': 0}
+
+
+def get_shared_cache():
+    """The cache configured as AUTH_TOKEN_SHARED_CACHE, or None when only the LRU is used."""
+    alias = settings.AUTH_TOKEN_SHARED_CACHE
+    return caches[alias] if alias else None
+
+
+def shared_cache_key(digest):
+    return f"knox-token:{digest}"
+
+
+def seconds_until(expiry, limit):
+    """Cache lifetime of an entry: `limit`, cut short by the token's expiry."""
+    if expiry is None:
+        return limit
+    return max(0, min(limit, (expiry - timezone.now()).total_seconds()))
+
+
+def invalidate_tokens(digests):
+    """Forgets the tokens with these digests, in this process's LRU and in the shared cache."""
+    digests = set(digests)
+    token_cache.discard_where(lambda entry: entry.digest in digests)
+    shared_cache = get_shared_cache()
+    if shared_cache is not None:
+        shared_cache.delete_many([shared_cache_key(digest) for digest in digests])
+
+
+def token_cache_stats():
+    lookups = shared_cache_counts['hits'] + shared_cache_counts['misses']
+    return {
+        'local': token_cache.stats(),
+        'shared': {
+            'enabled': bool(settings.AUTH_TOKEN_SHARED_CACHE),
+            'hits': shared_cache_counts['hits'],
+            'misses': shared_cache_counts['misses'],
+            'hit_rate': shared_cache_counts['hits'] / lookups if lookups else 0.0,
+        },
+    }
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    knox TokenAuthentication that remembers verified tokens, mapped to their user id and
+    expiry. A known token is authenticated from the in-process LRU, or after hashing from the
+    optional shared cache, and then costs a single user query by primary key. Entries never
+    outlive the token's expiry, and are dropped when the token row is deleted (logout, logout
+    from all devices, knox's expiry cleanup) by accounts.signals. Other processes' LRUs drop
+    a deleted token when its entry's AUTH_TOKEN_CACHE_TTL runs out.
+    """
+
+    def authenticate_credentials(self, token):
+        token_string = token.decode('utf-8')
+        entry = token_cache.get(token_string) or self.get_shared_entry(token_string)
+        if entry is not None and (entry.expiry is None or entry.expiry > timezone.now()):
+            user = get_user_model()._default_manager.filter(pk=entry.user_id).first()
+            if user is not None:
+                auth_token = AuthToken(digest=entry.digest, token_key=entry.token_key, user=user, expiry=entry.expiry)
+                auth_token._state.adding = False
+                auth_token._state.db = 'default'
+                if knox_settings.AUTO_REFRESH and auth_token.expiry:
+                    self.renew_token(auth_token)
+                    self.remember(token_string, auth_token)
+                return self.validate_user(auth_token)
+
+        # Unknown, expired or stale entries go through knox, which also deletes expired tokens.
+        token_cache.pop(token_string)
+        user, auth_token = super().authenticate_credentials(token)
+        self.remember(token_string, auth_token)
+        return user, auth_token
+
+    def get_shared_entry(self, token_string):
+        shared_cache = get_shared_cache()
+        if shared_cache is None:
+            return None
+        try:
+            digest = hash_token(token_string)
+        except (TypeError, binascii.Error):
+            return None
+        entry = shared_cache.get(shared_cache_key(digest))
+        shared_cache_counts['hits' if entry is not None else 'misses'] += 1
+        if entry is not None:
+            token_cache.set(token_string, entry, ttl=seconds_until(entry.expiry, settings.AUTH_TOKEN_CACHE_TTL))
+        return entry
+
+    def remember(self, token_string, auth_token):
+        entry = CachedToken(auth_token.digest, auth_token.token_key, auth_token.user_id, auth_token.expiry)
+        token_cache.set(token_string, entry, ttl=seconds_until(entry.expiry, settings.AUTH_TOKEN_CACHE_TTL))
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            shared_cache.set(
+                shared_cache_key(entry.digest), entry,
+                timeout=seconds_until(entry.expiry, settings.AUTH_TOKEN_SHARED_CACHE_TTL),
+            )
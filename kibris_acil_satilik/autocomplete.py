@@ -0,0 +1,77 @@
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import OperationalError, connection, transaction
+from django.db.models import F, Max, Value
+
+from properties.models import Location, PropertyAdvertisement
+from vehicles.models import CarAdvertisement
+
+from .lru import LRUCache
+
+# (kind, model, field, filters) for every column suggestions are drawn from. Each field has a
+# gin_trgm_ops index, partial on is_active for the advertisement columns.
+AUTOCOMPLETE_SOURCES = [
+    ('property_title', PropertyAdvertisement, 'title', {'is_active': True}),
+    ('car_title', CarAdvertisement, 'title', {'is_active': True}),
+    ('car_brand', CarAdvertisement, 'brand', {'is_active': True}),
+    ('car_series', CarAdvertisement, 'series', {'is_active': True}),
+    ('city', Location, 'city', {}),
+    ('area', Location, 'area', {}),
+]
+
+suggestion_cache = LRUCache(
+    maxsize=settings.AUTOCOMPLETE_CACHE_SIZE,
+    ttl=settings.AUTOCOMPLETE_CACHE_TTL,
+)
+
+
+def normalize_prefix(text):
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def build_suggestion_queryset(text, limit):
+    """
+    One UNION ALL query over every source: distinct values whose trigrams word-match the
+    text, ranked by word similarity across all sources.
+    """
+    parts = []
+    for kind, model, field, filters in AUTOCOMPLETE_SOURCES:
+        parts.append(
+            model.objects.filter(**filters, **{f'{field}__trigram_word_similar': text})
+            .values(value=F(field))
+            .annotate(similarity=Max(TrigramWordSimilarity(text, field)), kind=Value(kind))
+            .order_by()
+        )
+    return parts[0].union(*parts[1:], all=True).order_by('-similarity', 'value')[:limit]
+
+
+def get_suggestions(text, limit):
+    """
+    Returns (suggestions, timed_out) for a normalized prefix. Results come from the in-process
+    LRU when possible; otherwise the query runs under AUTOCOMPLETE_TIMEOUT_MS and an empty,
+    uncached list is returned if it overruns the budget.
+    """
+    cache_key = (text, limit)
+    suggestions = suggestion_cache.get(cache_key)
+    if suggestions is not None:
+        return suggestions, False
+
+    try:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", [str(settings.AUTOCOMPLETE_TIMEOUT_MS)])
+                cursor.execute(
+                    "SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                    [str(settings.AUTOCOMPLETE_SIMILARITY_THRESHOLD)]
+                )
+            suggestions = [
+                {'kind': row['kind'], 'value': row['value']}
+                for row in build_suggestion_queryset(text, limit)
+            ]
+    except OperationalError:
+        return [], True
+
+    suggestion_cache.set(cache_key, suggestions)
+    return suggestions, False
@@ -0,0 +1,111 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+COUNT_CACHE_KEY_PREFIX = 'pagination-count'
+
+
+def get_filter_signature(queryset):
+    """
+    Normalized signature of a queryset's filter state: the SQL and params of the unordered
+    query, so the same filters always hash the same regardless of page, ordering or the
+    order the query params were sent in.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha256(f"{sql}|{params!r}".encode('utf-8')).hexdigest()
+    return f"{queryset.model._meta.label_lower}:{digest}"
+
+
+def estimate_count(queryset):
+    """
+    Returns the planner's row estimate for the queryset, or None when the database cannot
+    provide one. Unfiltered querysets read pg_class.reltuples, filtered ones EXPLAIN the query.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 for tables that were never vacuumed or analyzed.
+            return int(row[0]) if row and row[0] >= 0 else None
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPage(Page):
+    """Page of a paginator with an estimated count, knowing whether another page follows."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self.followed = has_next
+
+    def has_next(self):
+        return self.followed
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Paginator whose total count is cached per filter signature for a short TTL and, when the
+    planner estimates more rows than PAGINATION_COUNT_ESTIMATE_THRESHOLD, taken from that
+    estimate instead of running COUNT(*). `count_is_estimate` tells which one was used.
+
+    An estimate can be short of the real count, so with one any page number is looked up:
+    pages past the estimated last page are served while they hold rows, and whether a next
+    page exists is told by fetching one row more than the page.
+    """
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super().count
+
+        cache_key = f"{COUNT_CACHE_KEY_PREFIX}:{get_filter_signature(self.object_list)}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            count, self.count_is_estimate = cached
+            return count
+
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate >= settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD:
+            count, self.count_is_estimate = estimate, True
+        else:
+            count, self.count_is_estimate = self.object_list.count(), False
+
+        cache.set(cache_key, (count, self.count_is_estimate), settings.PAGINATION_COUNT_CACHE_TTL)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            number = int(number)
+            if number < 1 or not self.count_is_estimate:
+                raise
+            return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return EstimatedCountPage(object_list[:self.per_page], number, self, len(object_list) > self.per_page)
@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import F
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics
+from rest_framework.response import Response
+
+from .counting import get_filter_signature
+from .search import FullTextSearchFilter
+
+FACET_CACHE_KEY_PREFIX = 'facet-counts'
+
+
+def count_facets(queryset, facets):
+    """
+    Counts the rows of `queryset` per distinct value of every facet in one grouped query.
+
+    `facets` maps a facet name to a field path. The filtered queryset is wrapped in
+    `GROUP BY GROUPING SETS ((facet_0), (facet_1), ..., ())`, so each facet's counts and the
+    overall total come back from a single scan. Returns (total, {name: [{value, count}, ...]})
+    with each facet's values ordered by descending count; null and empty values are skipped.
+    """
+    names = list(facets)
+    aliases = [f'facet_{index}' for index in range(len(names))]
+    values_qs = queryset.order_by().values(**{alias: F(facets[name]) for alias, name in zip(aliases, names)})
+    sql, params = values_qs.query.sql_with_params()
+
+    columns = ', '.join(aliases)
+    grouping_sets = ', '.join(f'({alias})' for alias in aliases)
+    facet_sql = (
+        f"SELECT {columns}, GROUPING({columns}), COUNT(*) FROM ({sql}) AS facet_source "
+        f"GROUP BY GROUPING SETS ({grouping_sets}, ())"
+    )
+
+    total = 0
+    counts = {name: [] for name in names}
+    all_grouped = (1 << len(aliases)) - 1
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(facet_sql, params)
+        for row in cursor.fetchall():
+            values, grouping, count = row[:len(aliases)], row[-2], row[-1]
+            if grouping == all_grouped:
+                total = count
+                continue
+            # GROUPING() sets one bit per rolled-up column, the first column being the highest,
+            # so the single cleared bit identifies the facet this row counts.
+            index = len(aliases) - (all_grouped ^ grouping).bit_length()
+            value = values[index]
+            if value is None or value == '':
+                continue
+            counts[names[index]].append({'value': value, 'count': count})
+
+    for facet_counts in counts.values():
+        facet_counts.sort(key=lambda item: (-item['count'], str(item['value'])))
+    return total, counts
+
+
+class FacetCountsView(generics.GenericAPIView):
+    """
+    Base view returning per-facet counts for the listing's current filter state. Subclasses set
+    `queryset`, `filterset_class`, `search_fields` and `facets`, the same way the matching
+    list view is configured, so it accepts exactly the list view's query params.
+
+    Results are cached per filter signature for FACET_COUNTS_CACHE_TTL seconds (0 disables).
+    """
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter]
+    pagination_class = None
+    facets = {}
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        ttl = settings.FACET_COUNTS_CACHE_TTL
+        cache_key = f"{FACET_CACHE_KEY_PREFIX}:{get_filter_signature(queryset)}"
+        data = cache.get(cache_key) if ttl else None
+        if data is None:
+            total, counts = count_facets(queryset, self.facets)
+            data = {'count': total, 'facets': counts}
+            if ttl:
+                cache.set(cache_key, data, ttl)
+        return Response(data)
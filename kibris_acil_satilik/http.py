@@ -0,0 +1,62 @@
+import hashlib
+import threading
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+
+from .renderers import dumps
+
+
+def etag_matches(request, etag):
+    """True when the request's If-None-Match header lists `etag` (or `*`), compared weakly."""
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    if '*' in etags:
+        return True
+    return etag.removeprefix('W/') in {candidate.removeprefix('W/') for candidate in etags}
+
+
+class PrecomputedJSON:
+    """
+    A JSON document built once per process by calling `build()`, and rebuilt only when
+    `version()` returns something new. The body is rendered to bytes once and served with a
+    strong ETag (a hash of those bytes), so revalidating clients get a 304 without any
+    rendering at all.
+    """
+
+    def __init__(self, build, version=None, max_age=0):
+        self.build = build
+        self.version = version or (lambda: None)
+        self.max_age = max_age
+        self._state = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Returns (body, etag) for the current version, building it if needed."""
+        version = self.version()
+        state = self._state
+        if state is None or state[0] != version:
+            with self._lock:
+                state = self._state
+                if state is None or state[0] != version:
+                    body = dumps(self.build())
+                    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+                    state = self._state = (version, body, etag)
+        return state[1], state[2]
+
+    def response(self, request):
+        body, etag = self.get()
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, max_age=self.max_age, must_revalidate=True)
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._state = None
@@ -0,0 +1,136 @@
+import io
+import logging
+import re
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.apps import apps
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Models whose `image` files get derivatives and are stored as blobs, as app labels.
+IMAGE_MODELS = ['properties.PropertyImage', 'vehicles.CarImage', 'accounts.OfferImage']
+
+
+# Matches the suffix derivative_name() appends to the name of the image it was derived from.
+DERIVATIVE_SUFFIX = re.compile(r'\.w\d+\.webp$')
+
+
+def derivative_name(name, width):
+    """Storage name of the `width` px WebP derivative of the image stored as `name`."""
+    return f"{name}.w{width}.webp"
+
+
+def derivative_names(name):
+    return [derivative_name(name, width) for width in settings.IMAGE_DERIVATIVE_WIDTHS]
+
+
+def render_derivatives(source):
+    """
+    Yields (width, webp_bytes) for every configured width from an image file object. EXIF
+    orientation is applied to the pixels and no metadata (EXIF, ICC, XMP) is carried over.
+    Images narrower than a width are not upscaled; that variant keeps the original size.
+    """
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        image.info = {}
+        for width in settings.IMAGE_DERIVATIVE_WIDTHS:
+            variant = image
+            if image.width > width:
+                variant = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+            buffer = io.BytesIO()
+            variant.save(buffer, 'WEBP', quality=settings.IMAGE_DERIVATIVE_QUALITY, method=4)
+            yield width, buffer.getvalue()
+
+
+def generate_derivatives(storage, name, overwrite=False):
+    """
+    Writes the WebP derivatives of the stored image `name` next to it, through the
+    ContentAddressedStorage `storage`. Existing derivatives are kept unless `overwrite`.
+    Returns the number of files written.
+    """
+    if not overwrite and all(storage.exists(derivative) for derivative in derivative_names(name)):
+        return 0
+    written = 0
+    with storage.open(name, 'rb') as source:
+        for width, data in render_derivatives(source):
+            target = derivative_name(name, width)
+            if storage.exists(target):
+                if not overwrite:
+                    continue
+                storage.delete(target)
+            storage.save_derivative(target, ContentFile(data))
+            written += 1
+    return written
+
+
+def enqueue_image_processing(*images):
+    """Queues a `process_image` job for each saved image instance."""
+    from core.jobs import enqueue
+
+    for image in images:
+        enqueue('process_image', {'model': image._meta.label, 'pk': image.pk})
+
+
+def process_image(payload):
+    """
+    `process_image` job handler: decodes and verifies an uploaded image, writes its
+    derivatives and records the outcome in the image's `status`. Saving the status runs the
+    model's cover bookkeeping, which skips failed images. Images that cannot be decoded are
+    marked failed for good; storage errors raise so the job is retried.
+    """
+    model = apps.get_model(payload['model'])
+    image = model.objects.filter(pk=payload['pk']).first()
+    if image is None or not image.image:
+        return
+    has_status = hasattr(image, 'status')
+    if has_status:
+        model.objects.filter(pk=image.pk).update(status=model.PROCESSING)
+
+    try:
+        with image.image.storage.open(image.image.name, 'rb') as source:
+            with Image.open(source) as decoded:
+                decoded.verify()
+    except (Image.UnidentifiedImageError, Image.DecompressionBombError, SyntaxError, ValueError) as e:
+        logger.warning("Rejected image %s: %s", image.image.name, e)
+        if has_status:
+            image.status = model.FAILED
+            image.save(update_fields=['status'])
+        return
+
+    generate_derivatives(image.image.storage, image.image.name)
+    if has_status:
+        image.status = model.READY
+        image.save(update_fields=['status'])
+
+
+def delete_image_files(storage, name):
+    """Deletes a stored image and its derivatives."""
+    for target in [name] + derivative_names(name):
+        storage.delete(target)
+
+
+def srcset_for(build_url, storage, name, ready=None):
+    """
+    `srcset` value of the stored image `name`, with URLs made absolute by `build_url`: its
+    derivatives by width once they are written, else the original alone. `ready` is the
+    processing outcome of images that record one; without it storage is asked which
+    derivatives exist.
+    """
+    if ready is None:
+        widths = [width for width in settings.IMAGE_DERIVATIVE_WIDTHS if storage.exists(derivative_name(name, width))]
+    else:
+        widths = settings.IMAGE_DERIVATIVE_WIDTHS if ready else []
+    if not widths:
+        return build_url(storage.url(name))
+    return ", ".join(f"{build_url(storage.url(derivative_name(name, width)))} {width}w" for width in widths)
+
+
+def build_srcset(request, image):
+    """`srcset` value of an image model instance (see srcset_for), or None without a request."""
+    if not image.image or request is None:
+        return None
+    ready = image.status == image.READY if hasattr(image, 'status') else None
+    return srcset_for(request.build_absolute_uri, image.image.storage, image.image.name, ready)
@@ -0,0 +1,24 @@
+from django.db.models import F
+from rest_framework import filters
+
+
+class AliasedOrderingFilter(filters.OrderingFilter):
+    """
+    OrderingFilter that keeps the public ordering names while sorting on another column, set
+    per view as e.g. `ordering_aliases = {'price': 'price_base'}`. The aliased column sorts its
+    NULLs (price_base of a currency without a rate) last in both directions.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        aliases = getattr(view, 'ordering_aliases', None)
+        if not ordering or not aliases:
+            return ordering
+
+        aliased = []
+        for term in ordering:
+            if isinstance(term, str) and term.lstrip('-') in aliases:
+                column = F(aliases[term.lstrip('-')])
+                term = column.desc(nulls_last=True) if term.startswith('-') else column.asc(nulls_last=True)
+            aliased.append(term)
+        return aliased
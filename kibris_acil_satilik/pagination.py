@@ -1,17 +1,52 @@
+import base64
+import copy
+import json
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, OrderBy, Q
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from collections import OrderedDict
 
+from .counting import CountStrategyPaginator
+
 
 class CustomPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
     page_query_param = 'page'
+    django_paginator_class = CountStrategyPaginator
+
+    # Opt-in keyset mode: `?cursor=` (empty) starts at the first page, subsequent pages pass
+    # back the `next_cursor` value. It seeks on (first ordering field, id) and never counts.
+    cursor_query_param = 'cursor'
+    cursor_fallback_ordering = '-published_date'
+    # Non-null annotations that may lead the ordering, seeked on like model fields.
+    cursor_annotations = ('search_rank',)
+    invalid_cursor_message = 'Invalid cursor'
+
+    cursor_mode = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        if self.cursor_mode:
+            return self.paginate_queryset_by_cursor(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.cursor_mode:
+            return self.get_cursor_paginated_response(data)
+
         current_page = self.page.number
         total_pages = self.page.paginator.num_pages
+        if self.page.paginator.count_is_estimate:
+            # Approximate like the count it comes from, but never short of the pages reached.
+            total_pages = max(total_pages, current_page + (1 if self.page.has_next() else 0))
 
         if total_pages <= 5:
             page_numbers = list(range(1, total_pages + 1))
@@ -25,7 +60,9 @@ class CustomPagination(PageNumberPagination):
 
         return Response(OrderedDict([
             ('count', self.page.paginator.count),
+            ('count_is_estimate', self.page.paginator.count_is_estimate),
             ('total_pages', total_pages),
+            ('total_pages_is_estimate', self.page.paginator.count_is_estimate),
             ('current_page', current_page),
             ('page_numbers', page_numbers),
             ('has_next', self.page.has_next()),
@@ -35,4 +72,123 @@ class CustomPagination(PageNumberPagination):
             ('first_page', self.request.build_absolute_uri().split('?')[0] + '?page=1'),
             ('last_page', self.request.build_absolute_uri().split('?')[0] + f'?page={total_pages}'),
             ('results', data)
-        ]))
\ No newline at end of file
+        ]))
+
+    # --- Keyset (cursor) mode ---
+
+    def get_keyset_ordering(self, queryset):
+        """
+        Returns (ordering, field) for the first ordering key of the queryset, as applied by the
+        view's OrderingFilter, either a name or an F() expression ordered with asc()/desc().
+        Falls back to -published_date when that key is not a concrete model field. Keys in
+        `cursor_annotations` (such as FullTextSearchFilter's rank) are seeked on as well.
+        Nullable fields are paged with their NULLs last, in either direction.
+        """
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        candidates = [self.ordering_name(ordering[0])] if ordering else []
+        candidates.append(self.cursor_fallback_ordering)
+
+        for candidate in candidates:
+            if candidate is None:
+                continue
+            field_name = candidate.lstrip('-')
+            if field_name == 'pk':
+                field_name = queryset.model._meta.pk.name
+            prefix = '-' if candidate.startswith('-') else ''
+            if field_name in self.cursor_annotations and field_name in queryset.query.annotations:
+                field = copy.copy(queryset.query.annotations[field_name].output_field)
+                field.set_attributes_from_name(field_name)
+                return f'{prefix}{field_name}', field
+            try:
+                field = queryset.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete:
+                return f'{prefix}{field_name}', field
+        return '-pk', queryset.model._meta.pk
+
+    @staticmethod
+    def ordering_name(term):
+        """`term` of an order_by() as a '-'-prefixed name, or None for other expressions."""
+        if isinstance(term, str):
+            return term
+        if isinstance(term, OrderBy) and isinstance(term.expression, F):
+            return f"{'-' if term.descending else ''}{term.expression.name}"
+        return None
+
+    def encode_cursor(self, ordering, field, obj):
+        if isinstance(obj, dict):
+            # A values() row, holding `pk` and the ordering key (see ValuesSerializer).
+            obj = SimpleNamespace(**obj)
+        value = None if getattr(obj, field.attname) is None else field.value_to_string(obj)
+        position = {'o': ordering, 'v': value, 'id': obj.pk}
+        return base64.urlsafe_b64encode(json.dumps(position).encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, encoded, ordering, field):
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            if position['o'] != ordering:
+                raise ValueError("Cursor was issued for a different ordering.")
+            value = None if position['v'] is None else field.to_python(position['v'])
+            return value, position['id']
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        ordering, field = self.get_keyset_ordering(queryset)
+        descending = ordering.startswith('-')
+        pk_name = queryset.model._meta.pk.name
+        if field.name == pk_name:
+            queryset = queryset.order_by(ordering)
+        else:
+            key = OrderBy(F(field.name), descending=descending, nulls_last=True) if field.null else ordering
+            queryset = queryset.order_by(key, f'-{pk_name}' if descending else pk_name)
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            value, pk = self.decode_cursor(encoded, ordering, field)
+            lookup = 'lt' if descending else 'gt'
+            if field.name == pk_name:
+                queryset = queryset.filter(**{f'{pk_name}__{lookup}': pk})
+            elif value is None:
+                # Past the last non-null key: only NULLs remain, ordered by pk.
+                queryset = queryset.filter(**{f'{field.name}__isnull': True, f'{pk_name}__{lookup}': pk})
+            else:
+                seek = Q(**{f'{field.name}__{lookup}': value}) | Q(**{field.name: value, f'{pk_name}__{lookup}': pk})
+                if field.null:
+                    seek |= Q(**{f'{field.name}__isnull': True})
+                queryset = queryset.filter(seek)
+
+        results = list(queryset[:page_size + 1])
+        self.cursor_has_next = len(results) > page_size
+        results = results[:page_size]
+        self.next_cursor = self.encode_cursor(ordering, field, results[-1]) if self.cursor_has_next else None
+        return results
+
+    def get_next_cursor_link(self):
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_cursor_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('has_next', self.cursor_has_next),
+            ('next_cursor', self.next_cursor),
+            ('next', self.get_next_cursor_link()),
+            ('results', data)
+        ]))
+
+
+class FeedPagination(CustomPagination):
+    """Always pages by cursor, FEED_PAGE_SIZE items at a time unless `page_size` asks otherwise."""
+    page_size = settings.FEED_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = True
+        return self.paginate_queryset_by_cursor(queryset, request)
@@ -0,0 +1,65 @@
+import datetime
+import decimal
+
+import orjson
+from django.db.models.query import QuerySet
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import JSONRenderer
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_default(obj):
+    """
+    Converts what orjson does not serialize natively the way DRF's JSONEncoder does: Decimals
+    as floats (serializer fields already render prices as strings), lazy strings, timedeltas
+    as seconds, querysets and other iterables as arrays.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, QuerySet):
+        return tuple(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, '__getitem__'):
+        try:
+            return dict(obj)
+        except (TypeError, ValueError):
+            pass
+    if hasattr(obj, '__iter__'):
+        return tuple(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data):
+    """
+    Compact UTF-8 JSON bytes of `data` in the layout of DRF's JSONRenderer. Floats differ:
+    NaN and Infinity, which JSONRenderer refuses with a ValueError, are written as null, and
+    exponent notation is shorter (`1e-7` and `1e16` rather than `1e-07` and `1e+16`).
+    Datetimes, dates, times and UUIDs are encoded by orjson itself, UTC offsets as `Z`.
+    """
+    # JSONRenderer escapes these two so the output is also valid JavaScript.
+    return orjson.dumps(data, default=orjson_default, option=ORJSON_OPTIONS) \
+        .replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson; see dumps() for where its output differs. Indented
+    output, which orjson cannot produce with arbitrary widths (the browsable API asks for
+    it), is left to JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type or '', renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
@@ -0,0 +1,164 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from .http import etag_matches
+
+RESPONSE_CACHE_KEY_PREFIX = 'public-response'
+AD_DETAIL_CACHE_KEY_PREFIX = 'ad-detail'
+
+
+def normalized_query_string(request):
+    """
+    The request's query string with parameters sorted by name and empty values dropped, so
+    `?b=2&a=1`, `?a=1&b=2` and `?a=1&b=2&c=` share a cache entry. Repeated values of one
+    parameter keep their order.
+    """
+    items = []
+    for key in sorted(request.query_params):
+        items.extend((key, value) for value in request.query_params.getlist(key) if value != '')
+    return urlencode(items)
+
+
+def generation_key(namespace):
+    return f"{RESPONSE_CACHE_KEY_PREFIX}:generation:{namespace}"
+
+
+def invalidate_public_responses(namespace):
+    """
+    Invalidates every cached public response depending on `namespace` by bumping its
+    generation once the current transaction commits. Superseded entries are never read
+    again and expire after PUBLIC_RESPONSE_CACHE_TTL.
+    """
+    def bump():
+        key = generation_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def public_response_cache_key(request, namespaces):
+    """
+    Cache key of a public response: the generations of the data it depends on, the host
+    (serializers build absolute URLs), the negotiated format, the path and the normalized
+    query string.
+    """
+    generations = cache.get_many([generation_key(namespace) for namespace in namespaces])
+    version = '.'.join(str(generations.get(generation_key(namespace), 0)) for namespace in namespaces)
+    source = '|'.join([
+        request.get_host(), request.accepted_renderer.format, request.path, normalized_query_string(request),
+    ])
+    return f"{RESPONSE_CACHE_KEY_PREFIX}:{version}:{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+
+
+class PublicResponseCacheMixin:
+    """
+    Serves a read-only public view's successful GET responses from the cache, rendered bytes
+    and all, and marks them cacheable by shared caches such as a reverse proxy. The response
+    must not depend on the requesting user. `response_cache_namespaces` names the data the
+    response is built from; see invalidate_public_responses. Views defining their own `get`
+    start it with get_cached_response(). Only JSON responses are cached and marked public:
+    the browsable API's HTML carries the viewer's username and CSRF token. Authenticated
+    requests bypass the cache and are neither stored nor marked public.
+    """
+    response_cache_namespaces = ()
+
+    def get_cached_response(self, request):
+        """The cached response for this request, or None; a miss is stored once rendered."""
+        self.response_cache_key = None
+        if request.accepted_renderer.format != 'json' or request.user.is_authenticated:
+            return None
+        self.response_cache_key = public_response_cache_key(request, self.response_cache_namespaces)
+        cached = cache.get(self.response_cache_key)
+        if cached is None:
+            return None
+        content, content_type = cached
+        return HttpResponse(content, content_type=content_type)
+
+    def get(self, request, *args, **kwargs):
+        cached = self.get_cached_response(request)
+        if cached is not None:
+            return cached
+        return super().get(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method != 'GET' or response.status_code != 200:
+            return response
+        cache_key = getattr(self, 'response_cache_key', None)
+        if cache_key is None:
+            return response
+        if hasattr(response, 'render') and not response.is_rendered:
+            response.render()
+            cache.set(cache_key, (response.content, response['Content-Type']), settings.PUBLIC_RESPONSE_CACHE_TTL)
+        mark_public(response)
+        return response
+
+
+def mark_public(response):
+    """Lets shared caches store a response that is the same for every caller."""
+    patch_vary_headers(response, ['Accept'])
+    patch_cache_control(response, public=True, max_age=settings.PUBLIC_RESPONSE_MAX_AGE)
+
+
+def ad_detail_cache_key(kind, pk):
+    return f"{AD_DETAIL_CACHE_KEY_PREFIX}:{kind}:{pk}"
+
+
+def invalidate_ad_details(kind, *pks):
+    """Drops the cached detail responses of these ads once the current transaction commits."""
+    keys = [ad_detail_cache_key(kind, pk) for pk in pks if pk is not None]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class AdDetailCacheMixin:
+    """
+    Caches a public retrieve view's rendered JSON per ad, as (host, ETag, body), so a hit costs
+    a single cache GET and no queries. The host is checked because serializers build absolute
+    URLs. Entries are deleted by the `detail_cache_kind` app's signals whenever the ad or a
+    related row shown in the payload changes, and expire after AD_DETAIL_CACHE_TTL.
+    Revalidating clients get a 304 when the ETag (a hash of the body) still matches.
+    """
+    detail_cache_kind = None
+
+    def retrieve(self, request, *args, **kwargs):
+        self.detail_cache_key = None
+        if request.accepted_renderer.format != 'json':
+            return super().retrieve(request, *args, **kwargs)
+        self.detail_cache_key = ad_detail_cache_key(self.detail_cache_kind, kwargs[self.lookup_url_kwarg or self.lookup_field])
+        cached = cache.get(self.detail_cache_key)
+        if cached is not None:
+            host, etag, content = cached
+            if host == request.get_host():
+                self.detail_cache_key = None
+                if etag_matches(request, etag):
+                    response = HttpResponseNotModified()
+                else:
+                    response = HttpResponse(content, content_type='application/json')
+                response['ETag'] = etag
+                return response
+        return super().retrieve(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method != 'GET' or response.status_code not in (200, 304):
+            return response
+        if request.accepted_renderer.format != 'json':
+            return response
+        cache_key = getattr(self, 'detail_cache_key', None)
+        if cache_key is not None and response.status_code == 200 and not response.is_rendered:
+            response.render()
+            etag = f'"{hashlib.sha256(response.content).hexdigest()[:32]}"'
+            response['ETag'] = etag
+            cache.set(cache_key, (request.get_host(), etag, response.content), settings.AD_DETAIL_CACHE_TTL)
+        mark_public(response)
+        return response
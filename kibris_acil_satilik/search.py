@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+from rest_framework import filters
+
+
+def build_search_vector(weighted_expressions):
+    """
+    Combines (expression, weight) pairs into one tsvector expression, indexed once per
+    configuration in SEARCH_CONFIGS so both Turkish and English stemming can match.
+    Null expressions are coalesced to '' by SearchVector.
+    """
+    vector = None
+    for config in settings.SEARCH_CONFIGS:
+        for expression, weight in weighted_expressions:
+            part = SearchVector(expression, config=config, weight=weight)
+            vector = part if vector is None else vector + part
+    return vector
+
+
+def build_search_query(text):
+    query = None
+    for config in settings.SEARCH_CONFIGS:
+        part = SearchQuery(text, config=config, search_type='websearch')
+        query = part if query is None else query | part
+    return query
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter that matches the `search` param against the model's
+    GIN-indexed `search_vector` column and ranks the results.
+
+    List it after OrderingFilter: when the request has no explicit `ordering` param, results
+    are ordered by rank first, falling back to the ordering already applied. Models without a
+    search vector, and non-PostgreSQL databases, get the regular SearchFilter behaviour.
+    """
+    search_vector_field = 'search_vector'
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms or not self.supports_full_text_search(queryset):
+            return super().filter_queryset(request, queryset, view)
+
+        query = build_search_query(' '.join(search_terms))
+        # ts_rank() returns a real; as a double the rank survives the round trip through a
+        # pagination cursor exactly, so keyset comparisons against it hold.
+        queryset = queryset.filter(**{self.search_vector_field: query}).annotate(
+            search_rank=Cast(SearchRank(F(self.search_vector_field), query), FloatField())
+        )
+        if filters.OrderingFilter.ordering_param not in request.query_params:
+            queryset = queryset.order_by('-search_rank', *queryset.query.order_by)
+        return queryset
+
+    def supports_full_text_search(self, queryset):
+        if connections[queryset.db].vendor != 'postgresql':
+            return False
+        try:
+            queryset.model._meta.get_field(self.search_vector_field)
+        except FieldDoesNotExist:
+            return False
+        return True
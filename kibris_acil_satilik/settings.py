@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     # Third-party apps
     'rest_framework',
@@ -53,6 +54,7 @@ INSTALLED_APPS = [
     'accounts',
     'properties',
     'vehicles',
+    'core',
 ]
 
 MIDDLEWARE = [
@@ -101,6 +103,16 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
 CORS_ALLOW_ALL_ORIGINS = os.getenv('CORS_ALLOW_ALL_ORIGINS', 'False') == 'True'
 CORS_ALLOWED_ORIGINS = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',')
 CORS_ALLOW_CREDENTIALS = os.getenv('CORS_ALLOW_CREDENTIALS', 'True') == 'False'
@@ -111,7 +123,7 @@ AUTH_USER_MODEL = 'accounts.User'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'knox.auth.TokenAuthentication',
+        'kibris_acil_satilik.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -121,10 +133,95 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'kibris_acil_satilik.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'kibris_acil_satilik.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'kibris_acil_satilik.pagination.CustomPagination',
     'PAGE_SIZE': 10,
 }
 
+# Text search configurations every advertisement search vector is built with.
+SEARCH_CONFIGS = ['turkish', 'english']
+
+# Paginated list counts are cached per filter signature for this many seconds, and taken from
+# the query planner's row estimate instead of COUNT(*) once the estimate reaches the threshold.
+PAGINATION_COUNT_CACHE_TTL = int(os.getenv('PAGINATION_COUNT_CACHE_TTL', 60))
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = int(os.getenv('PAGINATION_COUNT_ESTIMATE_THRESHOLD', 10000))
+
+# Currency every advertisement's price_base is expressed in, and the default file the
+# load_exchange_rates command reads ({"CUR": rate, ...}, the value of one unit in BASE_CURRENCY).
+# No rates ship with the project: ads priced in another currency have no price_base until
+# `manage.py load_exchange_rates` (from this file or CUR=rate arguments) has been run.
+BASE_CURRENCY = os.getenv('BASE_CURRENCY', 'GBP')
+EXCHANGE_RATES_FILE = os.getenv('EXCHANGE_RATES_FILE', BASE_DIR / 'exchange_rates.json')
+
+# Facet counts are cached per filter signature for this many seconds (0 disables caching).
+FACET_COUNTS_CACHE_TTL = int(os.getenv('FACET_COUNTS_CACHE_TTL', 60))
+
+# Browser cache lifetime (seconds) of the precomputed filter options and form schemas; clients
+# revalidate with If-None-Match afterwards.
+FILTER_OPTIONS_MAX_AGE = int(os.getenv('FILTER_OPTIONS_MAX_AGE', 300))
+
+# Search box autocomplete: trigram word-similarity suggestions answered within a latency
+# budget, with recent prefixes kept in a per-process LRU.
+AUTOCOMPLETE_MIN_LENGTH = 2
+AUTOCOMPLETE_DEFAULT_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 25
+AUTOCOMPLETE_TIMEOUT_MS = int(os.getenv('AUTOCOMPLETE_TIMEOUT_MS', 150))
+AUTOCOMPLETE_SIMILARITY_THRESHOLD = float(os.getenv('AUTOCOMPLETE_SIMILARITY_THRESHOLD', 0.3))
+AUTOCOMPLETE_CACHE_SIZE = int(os.getenv('AUTOCOMPLETE_CACHE_SIZE', 2048))
+AUTOCOMPLETE_CACHE_TTL = int(os.getenv('AUTOCOMPLETE_CACHE_TTL', 300))
+
+# Largest image accepted by the multipart upload endpoints, in bytes.
+IMAGE_UPLOAD_MAX_BYTES = int(os.getenv('IMAGE_UPLOAD_MAX_BYTES', 15 * 1024 * 1024))
+
+# Widths (px) of the WebP derivatives generated for every uploaded ad and offer image.
+IMAGE_DERIVATIVE_WIDTHS = [320, 640, 1280]
+IMAGE_DERIVATIVE_QUALITY = int(os.getenv('IMAGE_DERIVATIVE_QUALITY', 80))
+
+# Default page size of the cursor-paged cross-vertical feeds (latest advertisements).
+FEED_PAGE_SIZE = int(os.getenv('FEED_PAGE_SIZE', 6))
+
+# Property and car list endpoints serialize values() rows to plain dicts (see
+# kibris_acil_satilik.values_serializers) instead of running their model serializers.
+FAST_LIST_SERIALIZERS = os.getenv('FAST_LIST_SERIALIZERS', 'True') == 'True'
+
+# Responses of the anonymous public listing/detail endpoints are cached server side for
+# PUBLIC_RESPONSE_CACHE_TTL seconds (until an ad changes) and marked cacheable by shared caches
+# for PUBLIC_RESPONSE_MAX_AGE seconds. Use a shared CACHE_BACKEND with several processes.
+PUBLIC_RESPONSE_CACHE_TTL = int(os.getenv('PUBLIC_RESPONSE_CACHE_TTL', 10 * 60))
+PUBLIC_RESPONSE_MAX_AGE = int(os.getenv('PUBLIC_RESPONSE_MAX_AGE', 60))
+# Rendered public ad detail responses, cached per ad and dropped whenever the ad changes.
+AD_DETAIL_CACHE_TTL = int(os.getenv('AD_DETAIL_CACHE_TTL', 24 * 60 * 60))
+
+# Unreferenced image blobs (core.Blob) are kept this long before collect_blobs deletes them.
+BLOB_GC_GRACE_SECONDS = int(os.getenv('BLOB_GC_GRACE_SECONDS', 24 * 60 * 60))
+# Files under MEDIA_ROOT younger than this are never treated as orphans by collect_orphaned_media.
+MEDIA_GC_GRACE_SECONDS = int(os.getenv('MEDIA_GC_GRACE_SECONDS', 24 * 60 * 60))
+
+# Background jobs (core.Job), run by the run_jobs command. Handlers are dotted paths called
+# with the job payload. Failed jobs are retried after JOB_RETRY_DELAY * 2^(attempt - 1) seconds.
+JOB_HANDLERS = {
+    'process_image': 'kibris_acil_satilik.images.process_image',
+}
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 5))
+JOB_RETRY_DELAY = int(os.getenv('JOB_RETRY_DELAY', 10))
+JOB_LOCK_TIMEOUT = int(os.getenv('JOB_LOCK_TIMEOUT', 600))
+
+# Verified knox tokens are cached by CachedTokenAuthentication in a per-process LRU and, when
+# AUTH_TOKEN_SHARED_CACHE names a cache alias, in that shared cache. AUTH_TOKEN_CACHE_TTL bounds
+# how long another process may still accept a token deleted by logout.
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv('AUTH_TOKEN_CACHE_SIZE', 10000))
+AUTH_TOKEN_CACHE_TTL = int(os.getenv('AUTH_TOKEN_CACHE_TTL', 60))
+AUTH_TOKEN_SHARED_CACHE = os.getenv('AUTH_TOKEN_SHARED_CACHE', '')
+AUTH_TOKEN_SHARED_CACHE_TTL = int(os.getenv('AUTH_TOKEN_SHARED_CACHE_TTL', 15 * 60))
+
 # Knox authentication settings
 KNOX_TOKEN_MODEL = 'knox.AuthToken'
 
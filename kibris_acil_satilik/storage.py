@@ -0,0 +1,104 @@
+import hashlib
+import os
+import uuid
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+
+from .images import DERIVATIVE_SUFFIX
+
+BLOB_PREFIX = 'blobs'
+
+
+def blob_name(digest, ext=''):
+    """Sharded storage name of the blob whose SHA-256 hex digest is `digest`."""
+    return f"{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+class HashingTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    Spools uploads to a temporary file like TemporaryFileUploadHandler, hashing each chunk as
+    it arrives. The SHA-256 hex digest is left on the file as `content_hash`, so
+    ContentAddressedStorage does not have to read the file again.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.digest = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.digest.update(raw_data)
+        super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.content_hash = self.digest.hexdigest()
+        return file
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that keeps every distinct content once, named after its SHA-256
+    digest under `blobs/<aa>/<bb>/` (see blob_name), keeping the extension of the name it was
+    saved as, whatever that name is. Only WebP derivatives, written through save_derivative,
+    are stored under a name of the caller's choosing. Saving bytes that are already stored writes nothing and returns the existing name, so
+    several image rows may share a file: files are never deleted on behalf of a single row;
+    core.Blob counts the references and `collect_blobs` removes unreferenced ones.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The requested name is replaced by the content's blob name in _save.
+        return name
+
+    def save_derivative(self, name, content):
+        """
+        Stores `content` as `name`, a derivative name (see images.derivative_name), replacing
+        any file of that name. Derivatives live next to the image they were made from, blob or
+        file saved before content addressing, so they can be found by name.
+        """
+        if not DERIVATIVE_SUFFIX.search(name):
+            raise ValueError(f"{name!r} is not a derivative name.")
+        name = self.generate_filename(name)
+        self._write(name, content)
+        return name
+
+    def _save(self, name, content):
+        digest = getattr(content, 'content_hash', None)
+        if digest is None:
+            hasher = hashlib.sha256()
+            for chunk in content.chunks():
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+        name = blob_name(digest, os.path.splitext(name)[1].lower())
+        if self.exists(name):
+            # Refreshing the mtime tells `collect_blobs` the blob is being reused.
+            os.utime(self.path(name))
+            return name
+        self._write(name, content)
+        return name
+
+    def _write(self, name, content):
+        """
+        Writes `content` to `name`, replacing any existing file atomically: concurrent writers
+        store identical bytes, so the last rename wins without readers seeing a partial file.
+        """
+        full_path = self.path(name)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if hasattr(content, 'temporary_file_path'):
+            file_move_safe(content.temporary_file_path(), full_path, allow_overwrite=True)
+        else:
+            partial_path = f"{full_path}.{uuid.uuid4().hex}.part"
+            with open(partial_path, 'wb') as partial:
+                for chunk in content.chunks():
+                    partial.write(chunk)
+            os.replace(partial_path, full_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+
+image_storage = ContentAddressedStorage()
+
+
+def get_image_storage():
+    """Storage of ad and offer image fields."""
+    return image_storage
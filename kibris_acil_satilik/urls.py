@@ -19,7 +19,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from accounts.views import APIRootView, DashboardTotalsView
-from properties.views import LatestAdvertisementsView, CombinedFilterOptionsView, PropertyBasicListView
+from properties.views import LatestAdvertisementsView, CombinedFilterOptionsView, PropertyBasicListView, AutocompleteView, \
+    UnifiedSearchView
 from vehicles.views import CarBasicListView
 
 urlpatterns = [
@@ -33,6 +34,8 @@ urlpatterns = [
     path('api/totals/', DashboardTotalsView.as_view(), name='dashboard-totals'),
     path('api/propertiesbasic/', PropertyBasicListView.as_view(), name='property-basic-list'),
     path('api/carsbasic/', CarBasicListView.as_view(), name='car-basic-list'),
+    path('api/autocomplete/', AutocompleteView.as_view(), name='autocomplete'),
+    path('api/search/', UnifiedSearchView.as_view(), name='unified-search'),
 
 
 ]
@@ -0,0 +1,148 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import F, OrderBy
+from django.utils.encoding import iri_to_uri
+from rest_framework.response import Response
+
+from .images import srcset_for
+
+
+def absolute_url_builder(request):
+    """
+    Function making URLs absolute exactly like request.build_absolute_uri, with the scheme and
+    host resolved once for the root-relative URLs storages return.
+    """
+    scheme_host = request.build_absolute_uri('/')[:-1]
+
+    def build(url):
+        if url.startswith('/') and not url.startswith('//') and '/./' not in url and '/../' not in url:
+            return iri_to_uri(scheme_host + url)
+        return request.build_absolute_uri(url)
+
+    return build
+
+
+class ValuesSerializer:
+    """
+    Reproduces the output of `serializer_class`, a ModelSerializer, from values() rows instead
+    of model instances. Model fields (including ones reached through a dotted `source`) are
+    read from their column and formatted by the serializer's own field, so the JSON matches
+    byte for byte. Nested `many=True` fields named in `related` are filled from one query per
+    page, grouped by parent; any other field needs a `get_<field>(row)` method reading the
+    columns listed in `extra_columns`.
+    """
+    serializer_class = None
+    # field name -> (ValuesSerializer of the nested rows, their foreign key to this model)
+    related = {}
+    extra_columns = ()
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.columns = ['pk', *self.extra_columns]
+        self.plan = []
+        for name, field in self.serializer_class(context=self.context).fields.items():
+            if field.write_only:
+                continue
+            method = getattr(self, f'get_{name}', None)
+            if name in self.related:
+                self.plan.append((name, None))
+            elif method is not None:
+                self.plan.append((name, method))
+            else:
+                column = field.source.replace('.', '__')
+                if column not in self.columns:
+                    self.columns.append(column)
+                self.plan.append((name, self.column_reader(column, field)))
+
+    @staticmethod
+    def column_reader(column, field):
+        to_representation = field.to_representation
+
+        def read(row):
+            value = row[column]
+            return None if value is None else to_representation(value)
+
+        return read
+
+    def values_queryset(self, queryset):
+        """`queryset` as values() rows with the serialized columns and the keys it is ordered by."""
+        columns = list(self.columns)
+        for key in queryset.query.order_by or queryset.model._meta.ordering:
+            if isinstance(key, OrderBy) and isinstance(key.expression, F):
+                key = key.expression.name
+            if isinstance(key, str) and key != '?' and key.lstrip('-') not in columns:
+                columns.append(key.lstrip('-'))
+        return queryset.prefetch_related(None).values(*columns)
+
+    def serialize(self, rows):
+        rows = list(rows)
+        parent_ids = [row['pk'] for row in rows]
+        nested = {
+            name: serializer_class(self.context).grouped(foreign_key, parent_ids)
+            for name, (serializer_class, foreign_key) in self.related.items()
+        }
+        data = []
+        for row in rows:
+            item = {}
+            for name, read in self.plan:
+                item[name] = nested[name].get(row['pk'], []) if read is None else read(row)
+            data.append(item)
+        return data
+
+    def grouped(self, foreign_key, parent_ids):
+        """Serialized rows pointing at `parent_ids` through `foreign_key`, in default order, by parent id."""
+        groups = defaultdict(list)
+        if not parent_ids:
+            return groups
+        model = self.serializer_class.Meta.model
+        rows = list(model.objects.filter(**{f'{foreign_key}__in': parent_ids}).values(foreign_key, *self.columns))
+        for row, item in zip(rows, self.serialize(rows)):
+            groups[row[foreign_key]].append(item)
+        return groups
+
+
+class ImageValuesSerializer(ValuesSerializer):
+    """
+    ValuesSerializer of the ad image serializers, with their absolute `image` URL and a
+    `srcset` listing derivatives only once the image's `status` is ready.
+    """
+    extra_columns = ('image', 'status')
+
+    def __init__(self, context=None):
+        super().__init__(context)
+        request = self.context.get('request')
+        self.build_url = absolute_url_builder(request) if request is not None else None
+        model = self.serializer_class.Meta.model
+        self.storage = model._meta.get_field('image').storage
+        self.ready_status = model.READY
+
+    def get_image(self, row):
+        if row['image'] and self.build_url:
+            return self.build_url(self.storage.url(row['image']))
+        return None
+
+    def get_srcset(self, row):
+        if not row['image'] or self.build_url is None:
+            return None
+        return srcset_for(self.build_url, self.storage, row['image'], row['status'] == self.ready_status)
+
+
+class ValuesListMixin:
+    """
+    Serves a view's list action through `values_serializer_class` while
+    settings.FAST_LIST_SERIALIZERS is on: the filtered queryset is paginated as values() rows
+    and serialized to plain dicts, without model instances or nested serializers.
+    """
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer_class is None or not settings.FAST_LIST_SERIALIZERS:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.values_serializer_class(self.get_serializer_context())
+        queryset = serializer.values_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
@@ -166,3 +166,90 @@ FEATURE_TR_LABELS_MAP = {
     "Rear Window Defroster": "Arka Cam Buz Çözücü",
     "Smart Tailgate": "Akıllı Bagaj Kapağı",
 }
+
+# Bit of each feature key in an advertisement's feature_mask. Append-only: a new feature
+# takes the next unused number and a removed feature's number is never reused, so masks
+# already stored stay valid whatever order the feature fields are declared in.
+PROPERTY_FEATURE_BITS = {
+    'elevator': 0,
+    'gardened': 1,
+    'fitness': 2,
+    'security': 3,
+    'thermal_insulation': 4,
+    'doorman': 5,
+    'car_park': 6,
+    'playground': 7,
+    'water_tank': 8,
+    'tennis_court': 9,
+    'swimming_pool': 10,
+    'football_field': 11,
+    'basketball_field': 12,
+    'generator': 13,
+    'pvc': 14,
+    'market': 15,
+    'siding': 16,
+    'fire_escape': 17,
+    'adsl': 18,
+    'alarm': 19,
+    'balcony': 20,
+    'built_in_kitchen': 21,
+    'barbecue': 22,
+    'furnished': 23,
+    'laundry_room': 24,
+    'air_conditioning': 25,
+    'wallpaper': 26,
+    'dressing_room': 27,
+    'jacuzzi': 28,
+    'tv_satellite': 29,
+    'laminate': 30,
+    'marble_floor': 31,
+    'panel_door': 32,
+    'blinds': 33,
+    'shower': 34,
+    'sauna': 35,
+    'satin_plaster': 36,
+    'satin_color': 37,
+    'ceramic_floor': 38,
+    'video_intercom': 39,
+    'parquet': 40,
+    'spotlight': 41,
+    'fireplace': 42,
+    'terrace': 43,
+    'cloakroom': 44,
+    'underfloor_heating': 45,
+    'double_glazing': 46,
+    'parent_bathroom': 47,
+}
+
+CAR_FEATURE_BITS = {
+    'headlamp_xenon': 0,
+    'headlight_adaptive': 1,
+    'headlight_sensor': 2,
+    'electric_mirrors': 3,
+    'folding_mirrors': 4,
+    'mirrors_heated': 5,
+    'parking_sensor_rear': 6,
+    'parking_sensor_front': 7,
+    'rain_sensor': 8,
+    'alloy_wheel': 9,
+    'rear_window_defroster': 10,
+    'smart_tailgate': 11,
+    'fabric_armchair': 12,
+    'leather_fabric_armchair': 13,
+    'electric_windshields': 14,
+    'front_armrest': 15,
+    'rear_armrest': 16,
+    'keyless_drive': 17,
+    'forward_gear': 18,
+    'hydraulic_steering': 19,
+    'functional_steering_wheel': 20,
+    'adjustable_steering_wheel': 21,
+    'leather_steering_wheel': 22,
+    'cruise_control': 23,
+    'adaptive_cruise_control': 24,
+    'reverse_view_camera': 25,
+    'road_computer': 26,
+    'start_stop': 27,
+    'air_conditioner_digital': 28,
+    'digital_monitor': 29,
+}
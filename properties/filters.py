@@ -1,17 +1,40 @@
+from django.db.models import BigIntegerField, F, Value
 from django_filters import rest_framework as filters
+from rest_framework.exceptions import ValidationError
 
 from .models import PropertyAdvertisement
 
 
+class FeatureMaskFilter(filters.CharFilter):
+    """
+    Comma-separated feature keys, e.g. `features=swimming_pool,elevator,parquet`. Matches ads
+    having all of them with one bitwise containment check on the ad's feature_mask column.
+    """
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        bits = qs.model.feature_bits()
+        keys = {key.strip() for key in value.split(',') if key.strip()}
+        unknown = sorted(keys - bits.keys())
+        if unknown:
+            raise ValidationError({self.field_name: [f"Unknown feature(s): {', '.join(unknown)}"]})
+        mask = sum(bits[key] for key in keys)
+        mask = Value(mask, output_field=BigIntegerField())
+        return qs.alias(matched_features=F('feature_mask').bitand(mask)).filter(matched_features=mask)
+
+
 class PropertyFilter(filters.FilterSet):
-    minPrice = filters.NumberFilter(field_name="price", lookup_expr='gte')
-    maxPrice = filters.NumberFilter(field_name="price", lookup_expr='lte')
+    # Price bounds are in settings.BASE_CURRENCY and compared against the converted price.
+    minPrice = filters.NumberFilter(field_name="price_base", lookup_expr='gte')
+    maxPrice = filters.NumberFilter(field_name="price_base", lookup_expr='lte')
     city = filters.CharFilter(field_name="location__city",
                                  lookup_expr='iexact')
     location = filters.CharFilter(field_name="location__area", lookup_expr='iexact',
                                               label="Location (Area)")
     type = filters.CharFilter(field_name="property_type", lookup_expr='iexact', label="Property Type")
     roomType = filters.CharFilter(field_name="room_type", lookup_expr='iexact')
+    features = FeatureMaskFilter(field_name="features", label="Features")
 
 
     class Meta:
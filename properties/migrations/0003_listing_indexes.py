@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 00:08
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_alter_propertyadvertisement_floor_location'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(django.db.models.functions.text.Upper('city'), django.db.models.functions.text.Upper('area'), name='location_upper_city_area_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyadvertisement',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-published_date'], name='prop_ad_active_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyadvertisement',
+            index=models.Index(django.db.models.functions.text.Upper('property_type'), django.db.models.functions.text.Upper('room_type'), models.F('price'), condition=models.Q(('is_active', True)), name='prop_ad_type_room_price_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 00:10
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_cover_image_path(apps, schema_editor):
+    PropertyAdvertisement = apps.get_model('properties', 'PropertyAdvertisement')
+    PropertyImage = apps.get_model('properties', 'PropertyImage')
+    covers = PropertyImage.objects.filter(property_ad=OuterRef('pk')).order_by('-is_cover', 'uploaded_at').values('image')[:1]
+    PropertyAdvertisement.objects.update(cover_image_path=Subquery(covers))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0003_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyadvertisement',
+            name='cover_image_path',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True),
+        ),
+        migrations.RunPython(backfill_cover_image_path, migrations.RunPython.noop),
+    ]
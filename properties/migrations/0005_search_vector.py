@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-17 00:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+from django.db.models import F, Max, OuterRef, Subquery
+
+from kibris_acil_satilik.search import build_search_vector
+
+
+def backfill_search_vectors(apps, schema_editor):
+    # The expression of PropertyAdvertisement.search_vector_expression(), applied one pk
+    # range per UPDATE so a large table is not rewritten in a single statement.
+    PropertyAdvertisement = apps.get_model('properties', 'PropertyAdvertisement')
+    Location = apps.get_model('properties', 'Location')
+    PropertyExplanation = apps.get_model('properties', 'PropertyExplanation')
+    location = Location.objects.filter(pk=OuterRef('location_id'))
+    explanation = PropertyExplanation.objects.filter(property_ad_id=OuterRef('pk'))
+    vector = build_search_vector([
+        (F('title'), 'A'),
+        (Subquery(location.values('city')[:1]), 'B'),
+        (Subquery(location.values('area')[:1]), 'B'),
+        (F('address'), 'C'),
+        (Subquery(explanation.values('explanation')[:1]), 'D'),
+    ])
+    max_pk = PropertyAdvertisement.objects.aggregate(max_pk=Max('pk'))['max_pk'] or 0
+    for start in range(0, max_pk + 1, 1000):
+        PropertyAdvertisement.objects.filter(pk__gte=start, pk__lt=start + 1000).update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0004_cover_image_path'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyadvertisement',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='propertyadvertisement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='prop_ad_search_vector_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+from properties.constants import PROPERTY_FEATURE_BITS
+from properties.utils import build_feature_mask_expression, get_feature_bits
+
+
+def backfill_feature_mask(apps, schema_editor):
+    PropertyAdvertisement = apps.get_model('properties', 'PropertyAdvertisement')
+    feature_models = [
+        apps.get_model('properties', 'PropertyExternalFeature'),
+        apps.get_model('properties', 'PropertyInteriorFeature'),
+    ]
+    PropertyAdvertisement.objects.update(
+        feature_mask=build_feature_mask_expression(feature_models, get_feature_bits(feature_models, PROPERTY_FEATURE_BITS), 'property_ad')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0006_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyadvertisement',
+            name='feature_mask',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_feature_mask, migrations.RunPython.noop),
+    ]
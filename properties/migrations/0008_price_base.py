@@ -0,0 +1,70 @@
+# Generated by Django 5.2 on 2026-10-17 00:18
+
+import json
+from decimal import Decimal
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, F, OuterRef, Subquery, When
+
+
+def backfill_price_base(apps, schema_editor):
+    # Converts every price with the exchange rate table, first seeded from
+    # settings.EXCHANGE_RATES_FILE when that file exists. Ads in a currency with no rate keep
+    # a NULL price_base, as the model allows, until load_exchange_rates recomputes them.
+    ExchangeRate = apps.get_model('core', 'ExchangeRate')
+    PropertyAdvertisement = apps.get_model('properties', 'PropertyAdvertisement')
+    try:
+        with open(settings.EXCHANGE_RATES_FILE, 'r', encoding='utf-8') as f:
+            rates = json.load(f)
+    except FileNotFoundError:
+        rates = {}
+    except (OSError, ValueError) as e:
+        print(f"\n  Ignoring {settings.EXCHANGE_RATES_FILE}: {e}")
+        rates = {}
+    for currency, rate in rates.items():
+        ExchangeRate.objects.get_or_create(currency=currency.upper(), defaults={'rate': Decimal(str(rate))})
+
+    rate = ExchangeRate.objects.filter(currency=OuterRef('price_currency')).values('rate')[:1]
+    PropertyAdvertisement.objects.update(price_base=Case(
+        When(price_currency=settings.BASE_CURRENCY, then=F('price')),
+        default=F('price') * Subquery(rate),
+        output_field=models.DecimalField(max_digits=20, decimal_places=2),
+    ))
+    missing = sorted(set(PropertyAdvertisement.objects.filter(price_base__isnull=True).values_list('price_currency', flat=True)))
+    if missing:
+        print(
+            f"\n  No exchange rate for {', '.join(missing)}: those ads have no price_base yet. Run "
+            f"`manage.py load_exchange_rates {missing[0]}=<value in {settings.BASE_CURRENCY}> ...` to fill it in."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0007_feature_mask'),
+        ('core', '0001_exchange_rate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='propertyadvertisement',
+            name='prop_ad_type_room_price_idx',
+        ),
+        migrations.AddField(
+            model_name='propertyadvertisement',
+            name='price_base',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=20, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='propertyadvertisement',
+            index=models.Index(django.db.models.functions.text.Upper('property_type'), django.db.models.functions.text.Upper('room_type'), models.F('price_base'), condition=models.Q(('is_active', True)), name='prop_ad_type_room_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyadvertisement',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['price_base'], name='prop_ad_active_price_base_idx'),
+        ),
+        migrations.RunPython(backfill_price_base, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-17 00:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0008_price_base'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='propertyimage',
+            options={'ordering': ['-is_cover', models.OrderBy(models.F('position'), nulls_last=True), 'uploaded_at']},
+        ),
+        migrations.AddField(
+            model_name='propertyimage',
+            name='position',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
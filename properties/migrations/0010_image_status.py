@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-17 00:25
+
+from django.db import migrations, models
+
+from kibris_acil_satilik.images import derivative_names
+from kibris_acil_satilik.storage import image_storage
+
+
+def mark_processed_images_ready(apps, schema_editor):
+    # Images uploaded while derivatives were written synchronously already have them; the
+    # rest stay pending until generate_image_derivatives writes theirs and marks them ready.
+    PropertyImage = apps.get_model('properties', 'PropertyImage')
+    rows = PropertyImage.objects.exclude(image='').values_list('pk', 'image').iterator(chunk_size=1000)
+    ready = []
+    for pk, name in rows:
+        if all(image_storage.exists(derivative) for derivative in derivative_names(name)):
+            ready.append(pk)
+        if len(ready) >= 1000:
+            PropertyImage.objects.filter(pk__in=ready).update(status='ready')
+            ready = []
+    PropertyImage.objects.filter(pk__in=ready).update(status='ready')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0009_image_position'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='propertyimage',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('ready', 'Ready'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.RunPython(mark_processed_images_ready, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,253 @@
+# Generated by Django 5.2 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0011_image_blob_storage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='basketball_field',
+            field=models.BooleanField(default=False, verbose_name='Basketball Field'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='car_park',
+            field=models.BooleanField(default=False, verbose_name='Car Park'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='doorman',
+            field=models.BooleanField(default=False, verbose_name='Doorman'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='elevator',
+            field=models.BooleanField(default=False, verbose_name='Elevator'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='fire_escape',
+            field=models.BooleanField(default=False, verbose_name='Fire Escape'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='fitness',
+            field=models.BooleanField(default=False, verbose_name='Fitness Center'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='football_field',
+            field=models.BooleanField(default=False, verbose_name='Football Field'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='gardened',
+            field=models.BooleanField(default=False, verbose_name='Gardened'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='generator',
+            field=models.BooleanField(default=False, verbose_name='Generator'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='market',
+            field=models.BooleanField(default=False, verbose_name='Market Nearby'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='playground',
+            field=models.BooleanField(default=False, verbose_name='Playground'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='pvc',
+            field=models.BooleanField(default=False, verbose_name='PVC'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='security',
+            field=models.BooleanField(default=False, verbose_name='Security'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='siding',
+            field=models.BooleanField(default=False, verbose_name='Siding'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='swimming_pool',
+            field=models.BooleanField(default=False, verbose_name='Swimming Pool'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='tennis_court',
+            field=models.BooleanField(default=False, verbose_name='Tennis Court'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='thermal_insulation',
+            field=models.BooleanField(default=False, verbose_name='Thermal Insulation'),
+        ),
+        migrations.AlterField(
+            model_name='propertyexternalfeature',
+            name='water_tank',
+            field=models.BooleanField(default=False, verbose_name='Water Tank'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='adsl',
+            field=models.BooleanField(default=False, verbose_name='ADSL'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='air_conditioning',
+            field=models.BooleanField(default=False, verbose_name='Air Conditioning'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='alarm',
+            field=models.BooleanField(default=False, verbose_name='Alarm System'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='balcony',
+            field=models.BooleanField(default=False, verbose_name='Balcony'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='barbecue',
+            field=models.BooleanField(default=False, verbose_name='Barbecue'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='blinds',
+            field=models.BooleanField(default=False, verbose_name='Blinds'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='built_in_kitchen',
+            field=models.BooleanField(default=False, verbose_name='Built-in Kitchen'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='ceramic_floor',
+            field=models.BooleanField(default=False, verbose_name='Ceramic Floor'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='cloakroom',
+            field=models.BooleanField(default=False, verbose_name='Cloakroom'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='double_glazing',
+            field=models.BooleanField(default=False, verbose_name='Double Glazing'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='dressing_room',
+            field=models.BooleanField(default=False, verbose_name='Dressing Room'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='fireplace',
+            field=models.BooleanField(default=False, verbose_name='Fireplace'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='furnished',
+            field=models.BooleanField(default=False, verbose_name='Furnished'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='jacuzzi',
+            field=models.BooleanField(default=False, verbose_name='Jacuzzi'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='laminate',
+            field=models.BooleanField(default=False, verbose_name='Laminate Flooring'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='laundry_room',
+            field=models.BooleanField(default=False, verbose_name='Laundry Room'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='marble_floor',
+            field=models.BooleanField(default=False, verbose_name='Marble Floor'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='panel_door',
+            field=models.BooleanField(default=False, verbose_name='Panel Door'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='parent_bathroom',
+            field=models.BooleanField(default=False, verbose_name='Parent Bathroom'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='parquet',
+            field=models.BooleanField(default=False, verbose_name='Parquet'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='satin_color',
+            field=models.BooleanField(default=False, verbose_name='Satin Paint'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='satin_plaster',
+            field=models.BooleanField(default=False, verbose_name='Satin Plaster'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='sauna',
+            field=models.BooleanField(default=False, verbose_name='Sauna'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='shower',
+            field=models.BooleanField(default=False, verbose_name='Shower Cabin'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='spotlight',
+            field=models.BooleanField(default=False, verbose_name='Spotlight'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='terrace',
+            field=models.BooleanField(default=False, verbose_name='Terrace'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='tv_satellite',
+            field=models.BooleanField(default=False, verbose_name='TV Satellite'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='underfloor_heating',
+            field=models.BooleanField(default=False, verbose_name='Underfloor Heating'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='video_intercom',
+            field=models.BooleanField(default=False, verbose_name='Video Intercom'),
+        ),
+        migrations.AlterField(
+            model_name='propertyinteriorfeature',
+            name='wallpaper',
+            field=models.BooleanField(default=False, verbose_name='Wallpaper'),
+        ),
+    ]
@@ -1,8 +1,17 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.functions import Upper
 from django.core.validators import FileExtensionValidator
 from accounts.models import User
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
+from core.models import AdIndex, ExchangeRate
+from kibris_acil_satilik.search import build_search_vector
+from properties.constants import PROPERTY_FEATURE_BITS
+from properties.utils import build_feature_mask_expression, get_feature_bits
+from kibris_acil_satilik.storage import get_image_storage
 
 class Location(models.Model):
     id = models.AutoField(primary_key=True)
@@ -12,6 +21,13 @@ class Location(models.Model):
     class Meta:
         unique_together = ('city', 'area')
         ordering = ['city', 'area']
+        indexes = [
+            # PropertyFilter matches city/area with iexact, i.e. UPPER(col) = UPPER(%s).
+            models.Index(Upper('city'), Upper('area'), name='location_upper_city_area_idx'),
+            # Trigram indexes back the typo-tolerant autocomplete.
+            GinIndex(fields=['city'], name='location_city_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['area'], name='location_area_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
         verbose_name = "Location"
         verbose_name_plural = "Locations"
 
@@ -153,26 +169,151 @@ class PropertyAdvertisement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Storage name of the cover image, maintained by PropertyImage.save()/delete() so list
+    # serializers can render covers without querying images.
+    cover_image_path = models.CharField(max_length=255, blank=True, null=True, editable=False)
+    # Weighted tsvector over the title, location, address and explanation, maintained by
+    # the signals in properties.signals.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # One bit per boolean of the feature tables (numbered by FEATURE_BITS), maintained by the
+    # signals in properties.signals so multi-feature filters need no joins.
+    feature_mask = models.BigIntegerField(default=0, editable=False)
+    # `price` converted to settings.BASE_CURRENCY with the core.ExchangeRate table, so price
+    # ranges and ordering compare like with like. Maintained by the signals in properties.signals
+    # and the recompute_price_base command; NULL while the currency has no rate.
+    price_base = models.DecimalField(max_digits=20, decimal_places=2, blank=True, null=True, editable=False)
+
+    # Columns derived from other rows; kept out of API payloads, forms and the form schema.
+    DENORMALIZED_FIELDS = ('cover_image_path', 'search_vector', 'feature_mask', 'price_base')
+
+    # core.AdIndex column -> field of this model.
+    AD_INDEX_KIND = AdIndex.PROPERTY
+    AD_INDEX_COLUMNS = {
+        'published_date': 'published_date',
+        'is_active': 'is_active',
+        'title': 'title',
+        'price': 'price',
+        'currency': 'price_currency',
+        'advertisement_type': 'advertisement_type',
+        'cover_image_path': 'cover_image_path',
+        'search_vector': 'search_vector',
+    }
+
+    # Bit number of each feature key in feature_mask; append-only, see properties.constants.
+    FEATURE_BITS = PROPERTY_FEATURE_BITS
+
+    # core.LiveCounter scope and the fields active ads are also counted by.
+    COUNTER_SCOPE = 'properties'
+    COUNTER_DIMENSIONS = ('advertisement_type', 'property_type')
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['-published_date'], name='prop_ad_active_published_idx',
+                condition=models.Q(is_active=True),
+            ),
+            # Mirrors the iexact lookups of PropertyFilter's type/roomType and the minPrice/maxPrice range.
+            models.Index(
+                Upper('property_type'), Upper('room_type'), 'price_base', name='prop_ad_type_room_price_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['price_base'], name='prop_ad_active_price_base_idx',
+                condition=models.Q(is_active=True),
+            ),
+            GinIndex(fields=['search_vector'], name='prop_ad_search_vector_idx'),
+            GinIndex(
+                fields=['title'], name='prop_ad_title_trgm_idx', opclasses=['gin_trgm_ops'],
+                condition=models.Q(is_active=True),
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
+    @classmethod
+    def search_vector_expression(cls):
+        """tsvector expression for an UPDATE of this table; related text is read through subqueries."""
+        location = Location.objects.filter(pk=OuterRef('location_id'))
+        explanation = PropertyExplanation.objects.filter(property_ad_id=OuterRef('pk'))
+        return build_search_vector([
+            (F('title'), 'A'),
+            (Subquery(location.values('city')[:1]), 'B'),
+            (Subquery(location.values('area')[:1]), 'B'),
+            (F('address'), 'C'),
+            (Subquery(explanation.values('explanation')[:1]), 'D'),
+        ])
+
+    @classmethod
+    def update_search_vectors(cls, **filters):
+        cls.objects.filter(**filters).update(search_vector=cls.search_vector_expression())
+
+    @classmethod
+    def update_price_base(cls, **filters):
+        return cls.objects.filter(**filters).update(price_base=ExchangeRate.conversion_expression('price', 'price_currency'))
+
+    @classmethod
+    def feature_models(cls):
+        return [PropertyExternalFeature, PropertyInteriorFeature]
+
+    @classmethod
+    def feature_bits(cls):
+        return get_feature_bits(cls.feature_models(), cls.FEATURE_BITS)
+
+    @classmethod
+    def update_feature_masks(cls, **filters):
+        cls.objects.filter(**filters).update(
+            feature_mask=build_feature_mask_expression(cls.feature_models(), cls.feature_bits(), 'property_ad')
+        )
+
 
 class PropertyImage(models.Model):
     id = models.AutoField(primary_key=True)
     property_ad = models.ForeignKey(PropertyAdvertisement, on_delete=models.CASCADE, related_name='images')
     image = models.ImageField(
-        upload_to='property_images/',
+        upload_to='property_images/', storage=get_image_storage,
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])])
     is_cover = models.BooleanField(default=False)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # Display order set when the ad's images are reconciled; unpositioned images follow in upload order.
+    position = models.PositiveIntegerField(blank=True, null=True)
+
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    READY = 'ready'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (PROCESSING, 'Processing'),
+        (READY, 'Ready'),
+        (FAILED, 'Failed'),
+    ]
+    # Progress of the background `process_image` job (verification and derivatives).
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
 
     class Meta:
-        ordering = ['-is_cover', 'uploaded_at']
+        ordering = ['-is_cover', models.F('position').asc(nulls_last=True), 'uploaded_at']
 
     def save(self, *args, **kwargs):
         if self.is_cover:
-            PropertyImage.objects.filter(property_ad=self.property_ad, is_cover=True).update(is_cover=False)
+            PropertyImage.objects.filter(property_ad=self.property_ad, is_cover=True).exclude(pk=self.pk).update(is_cover=False)
         super().save(*args, **kwargs)
+        PropertyImage.sync_cover_image_path(self.property_ad_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        PropertyImage.sync_cover_image_path(self.property_ad_id)
+        return result
+
+    @classmethod
+    def sync_cover_image_path(cls, property_ad_id):
+        """Stores the current cover (or first image, per Meta.ordering) on the advertisement and its index row."""
+        cover_path = (
+            cls.objects.filter(property_ad_id=property_ad_id).exclude(status=cls.FAILED)
+            .values_list('image', flat=True).first()
+        )
+        PropertyAdvertisement.objects.filter(pk=property_ad_id).update(cover_image_path=cover_path)
+        AdIndex.objects.filter(kind=PropertyAdvertisement.AD_INDEX_KIND, ad_id=property_ad_id).update(cover_image_path=cover_path)
 
     def __str__(self):
         status = " (Cover)" if self.is_cover else ""
@@ -1,10 +1,10 @@
 from rest_framework import serializers
+from kibris_acil_satilik.images import build_srcset
+from kibris_acil_satilik.values_serializers import ImageValuesSerializer, ValuesSerializer
 from .models import (
     PropertyAdvertisement, PropertyImage, PropertyExplanation, Location,
     PropertyExternalFeature, PropertyInteriorFeature
 )
-from vehicles.models import CarAdvertisement
-from vehicles.serializers import CarListSerializer
 
 
 class LocationSerializer(serializers.ModelSerializer):
@@ -15,11 +15,12 @@ class LocationSerializer(serializers.ModelSerializer):
 
 class PropertyImageSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = PropertyImage
-        fields = ('id', 'image', 'is_cover', 'uploaded_at')
-        read_only_fields = ('id', 'uploaded_at')
+        fields = ('id', 'image', 'srcset', 'is_cover', 'position', 'status', 'uploaded_at')
+        read_only_fields = ('id', 'status', 'uploaded_at')
 
     def get_image(self, obj):
         request = self.context.get('request')
@@ -27,6 +28,9 @@ class PropertyImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_srcset(self, obj):
+        return build_srcset(self.context.get('request'), obj)
+
 
 class PropertyExplanationSerializer(serializers.ModelSerializer):
 
@@ -55,14 +59,10 @@ class PropertyBasicSerializer(serializers.ModelSerializer):
         fields = ('id', 'title', 'price', 'published_date', 'is_active', 'cover_image')
 
     def get_cover_image(self, obj):
-        cover_image_instance = obj.images.filter(is_cover=True).first()
-        if not cover_image_instance:
-            cover_image_instance = obj.images.first()
-
-        if cover_image_instance:
-            request = self.context.get('request')
-            image_serializer_data = PropertyImageSerializer(cover_image_instance, context={'request': request}).data
-            return image_serializer_data.get('image')
+        request = self.context.get('request')
+        if obj.cover_image_path and request:
+            storage = PropertyImage._meta.get_field('image').storage
+            return request.build_absolute_uri(storage.url(obj.cover_image_path))
         return None
 
 class PropertyListSerializer(serializers.ModelSerializer):
@@ -83,6 +83,26 @@ class PropertyAdminListSerializer(PropertyListSerializer):
             'advertise_status', 'user_email', 'created_at'
         )
 
+class PropertyImageValuesSerializer(ImageValuesSerializer):
+    serializer_class = PropertyImageSerializer
+
+
+class PropertyListValuesSerializer(ValuesSerializer):
+    """PropertyListSerializer's output built from values() rows, for the list fast path."""
+    serializer_class = PropertyListSerializer
+    related = {'images': (PropertyImageValuesSerializer, 'property_ad')}
+    extra_columns = ('location__city', 'location__area')
+
+    def get_location_str(self, row):
+        if row['location__city'] is None:
+            return None
+        # Location.__str__
+        return f"{row['location__city']} / {row['location__area']}"
+
+
+class PropertyAdminListValuesSerializer(PropertyListValuesSerializer):
+    serializer_class = PropertyAdminListSerializer
+
 class PropertyDetailSerializer(serializers.ModelSerializer):
     """Serializer for DETAILED view (Public and Admin)"""
     images = PropertyImageSerializer(many=True, read_only=True)
@@ -93,7 +113,7 @@ class PropertyDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PropertyAdvertisement
-        fields = '__all__'
+        exclude = PropertyAdvertisement.DENORMALIZED_FIELDS
         read_only_fields = ('id', 'user', 'created_at', 'updated_at', 'published_date')
 
 
@@ -107,7 +127,7 @@ class PropertyAdminCreateUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PropertyAdvertisement
-        exclude = ('id', 'created_at', 'updated_at', 'published_date', 'location')
+        exclude = ('id', 'created_at', 'updated_at', 'published_date', 'location') + PropertyAdvertisement.DENORMALIZED_FIELDS
         read_only_fields = ('user',)
 
     def create(self, validated_data):
@@ -163,20 +183,3 @@ class PropertyAdminCreateUpdateSerializer(serializers.ModelSerializer):
             )
 
         return instance
-
-class LatestAdvertisementSerializer(serializers.Serializer):
-    def to_representation(self, instance):
-        request = self.context.get('request')
-        representation = None
-
-        if isinstance(instance, PropertyAdvertisement):
-            serializer = PropertyListSerializer(instance, context={'request': request})
-            representation = serializer.data
-        elif isinstance(instance, CarAdvertisement):
-            serializer = CarListSerializer(instance, context={'request': request})
-            representation = serializer.data
-            representation['advertisement_type'] = 'car'
-        else:
-            return None
-
-        return representation
\ No newline at end of file
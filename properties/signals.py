@@ -0,0 +1,107 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import AdIndex
+from kibris_acil_satilik.images import enqueue_image_processing
+from kibris_acil_satilik.response_cache import invalidate_ad_details, invalidate_public_responses
+from .models import (
+    Location, PropertyAdvertisement, PropertyExplanation, PropertyExternalFeature, PropertyImage,
+    PropertyInteriorFeature
+)
+
+
+@receiver(post_save, sender=PropertyAdvertisement)
+def update_property_search_vector(sender, instance, raw=False, **kwargs):
+    if not raw:
+        PropertyAdvertisement.update_search_vectors(pk=instance.pk)
+
+
+@receiver(post_save, sender=PropertyAdvertisement)
+def update_property_price_base(sender, instance, raw=False, **kwargs):
+    if not raw:
+        PropertyAdvertisement.update_price_base(pk=instance.pk)
+
+
+@receiver(post_save, sender=PropertyExplanation)
+@receiver(post_delete, sender=PropertyExplanation)
+def update_property_search_vector_for_explanation(sender, instance, raw=False, **kwargs):
+    if not raw:
+        PropertyAdvertisement.update_search_vectors(pk=instance.property_ad_id)
+        AdIndex.sync(PropertyAdvertisement, pk=instance.property_ad_id)
+
+
+@receiver(post_save, sender=Location)
+def update_property_search_vectors_for_location(sender, instance, created=False, raw=False, **kwargs):
+    if not raw and not created:
+        PropertyAdvertisement.update_search_vectors(location_id=instance.pk)
+        AdIndex.sync(PropertyAdvertisement, location_id=instance.pk)
+
+
+@receiver(post_save, sender=PropertyExternalFeature)
+@receiver(post_delete, sender=PropertyExternalFeature)
+@receiver(post_save, sender=PropertyInteriorFeature)
+@receiver(post_delete, sender=PropertyInteriorFeature)
+def update_property_feature_mask(sender, instance, raw=False, **kwargs):
+    if not raw:
+        PropertyAdvertisement.update_feature_masks(pk=instance.property_ad_id)
+
+
+@receiver(post_save, sender=PropertyImage)
+def queue_property_image_processing(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw and instance.image:
+        enqueue_image_processing(instance)
+
+
+@receiver(post_save, sender=PropertyAdvertisement)
+@receiver(post_delete, sender=PropertyAdvertisement)
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_save, sender=PropertyExplanation)
+@receiver(post_delete, sender=PropertyExplanation)
+@receiver(post_save, sender=PropertyExternalFeature)
+@receiver(post_delete, sender=PropertyExternalFeature)
+@receiver(post_save, sender=PropertyInteriorFeature)
+@receiver(post_delete, sender=PropertyInteriorFeature)
+@receiver(post_save, sender=Location)
+def invalidate_public_property_responses(sender, raw=False, **kwargs):
+    if not raw:
+        invalidate_public_responses('properties')
+
+
+@receiver(post_save, sender=PropertyAdvertisement)
+@receiver(post_delete, sender=PropertyAdvertisement)
+def invalidate_property_detail(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_ad_details('properties', instance.pk)
+
+
+@receiver(post_save, sender=PropertyImage)
+@receiver(post_delete, sender=PropertyImage)
+@receiver(post_save, sender=PropertyExplanation)
+@receiver(post_delete, sender=PropertyExplanation)
+@receiver(post_save, sender=PropertyExternalFeature)
+@receiver(post_delete, sender=PropertyExternalFeature)
+@receiver(post_save, sender=PropertyInteriorFeature)
+@receiver(post_delete, sender=PropertyInteriorFeature)
+def invalidate_property_detail_for_related(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_ad_details('properties', instance.property_ad_id)
+
+
+@receiver(post_save, sender=Location)
+def invalidate_property_details_for_location(sender, instance, created=False, raw=False, **kwargs):
+    if not raw and not created:
+        invalidate_ad_details(
+            'properties', *PropertyAdvertisement.objects.filter(location_id=instance.pk).values_list('pk', flat=True)
+        )
+
+
+@receiver(post_save, sender=PropertyAdvertisement)
+def sync_property_ad_index(sender, instance, raw=False, **kwargs):
+    if not raw:
+        AdIndex.sync(PropertyAdvertisement, pk=instance.pk)
+
+
+@receiver(post_delete, sender=PropertyAdvertisement)
+def remove_property_ad_index(sender, instance, **kwargs):
+    AdIndex.remove(PropertyAdvertisement, instance.pk)
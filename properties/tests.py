@@ -1,3 +1,394 @@
-from django.test import TestCase
+import base64
+import hashlib
+import importlib
+import io
+import shutil
+import tempfile
+from decimal import Decimal
 
-# Create your tests here.
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from vehicles.models import CarAdvertisement
+from core.management.commands.generate_image_derivatives import Command as GenerateImageDerivatives
+from core.models import AdIndex, Blob, ExchangeRate
+from kibris_acil_satilik.images import generate_derivatives
+from kibris_acil_satilik.response_cache import ad_detail_cache_key
+from kibris_acil_satilik.storage import blob_name
+from .models import (
+    Location, PropertyAdvertisement, PropertyExternalFeature, PropertyImage, PropertyInteriorFeature,
+)
+from .utils import get_bilingual_feature_metadata, get_feature_bits, reconcile_ad_images
+
+
+def jpeg_bytes(color):
+    buffer = io.BytesIO()
+    Image.new('RGB', (32, 24), color).save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+class PropertyListFastPathParityTests(TestCase):
+    """The values() list fast path must render byte-for-byte what the list serializers do."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='admin@example.com', password='secret')
+        locations = [
+            Location.objects.create(city='Nicosia', area='Kumsal'),
+            Location.objects.create(city='Kyrenia', area=None),
+        ]
+        for i in range(4):
+            ad = PropertyAdvertisement.objects.create(
+                user=cls.user if i % 2 else None, location=locations[i % 2],
+                title=f'Sea view villa {i}', price=Decimal('125000.5') + i, price_currency='GBP',
+                address='Main street', room_type='3+1', property_type='villa',
+                advertisement_type='sale' if i % 2 else 'rent', gross_area=150 + i,
+            )
+            for position in range(i % 3):
+                PropertyImage.objects.create(
+                    property_ad=ad, image=f'blobs/aa/bb/{i}{position}.jpg', position=position,
+                    is_cover=position == 1, status=PropertyImage.READY if i == 2 else PropertyImage.PENDING,
+                )
+
+    def setUp(self):
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.user)
+
+    def assertSameBody(self, client, url, params=None):
+        bodies = []
+        for fast in (False, True):
+            cache.clear()
+            with override_settings(FAST_LIST_SERIALIZERS=fast):
+                response = client.get(url, params or {})
+            self.assertEqual(response.status_code, 200)
+            bodies.append(response.content)
+        self.assertEqual(bodies[0], bodies[1])
+
+    def test_public_list(self):
+        self.assertSameBody(self.client, '/api/properties/')
+        self.assertSameBody(self.client, '/api/properties/', {'page_size': 2, 'page': 2})
+        self.assertSameBody(self.client, '/api/properties/', {'cursor': '', 'page_size': 3})
+        self.assertSameBody(self.client, '/api/properties/', {'search': 'villa', 'cursor': ''})
+
+    def test_srcset_lists_derivatives_of_ready_images_only(self):
+        for fast in (False, True):
+            cache.clear()
+            with override_settings(FAST_LIST_SERIALIZERS=fast):
+                results = self.client.get('/api/properties/', {'page_size': 10}).json()['results']
+            images = [image for ad in results for image in ad['images']]
+            self.assertLessEqual({PropertyImage.READY, PropertyImage.PENDING}, {image['status'] for image in images})
+            for image in images:
+                if image['status'] == PropertyImage.READY:
+                    self.assertEqual(len(image['srcset'].split(', ')), len(settings.IMAGE_DERIVATIVE_WIDTHS))
+                    self.assertIn(f"{image['image']}.w320.webp 320w", image['srcset'])
+                else:
+                    self.assertEqual(image['srcset'], image['image'])
+
+    def test_admin_list(self):
+        self.assertSameBody(self.admin_client, '/api/properties/admin/')
+        self.assertSameBody(self.admin_client, '/api/properties/admin/', {'ordering': '-price', 'page_size': 2, 'page': 2})
+
+
+class PropertyPriceOrderingTests(TestCase):
+    """Price ordering sorts on price_base, with ads whose currency has no rate last."""
+
+    @classmethod
+    def setUpTestData(cls):
+        ExchangeRate.objects.update_or_create(currency='EUR', defaults={'rate': Decimal('0.85')})
+        ExchangeRate.objects.filter(currency='TRY').delete()
+        location = Location.objects.create(city='Famagusta', area=None)
+        prices = [
+            ('100000', 'GBP'), ('100000', 'GBP'), ('110000', 'EUR'), ('90000', 'GBP'),
+            ('5000000', 'TRY'), ('4000000', 'TRY'), ('150000', 'EUR'),
+        ]
+        for i, (price, currency) in enumerate(prices):
+            PropertyAdvertisement.objects.create(
+                location=location, title=f'Flat {i}', price=Decimal(price), price_currency=currency,
+                address='Harbour street', room_type='2+1', property_type='apartment',
+                advertisement_type='sale', gross_area=90,
+            )
+
+    def fetch_all(self, params):
+        cache.clear()
+        ids, cursor = [], ''
+        while cursor is not None:
+            response = self.client.get('/api/properties/', {**params, 'cursor': cursor, 'page_size': 2})
+            self.assertEqual(response.status_code, 200)
+            ids += [item['id'] for item in response.json()['results']]
+            cursor = response.json()['next_cursor']
+        return ids
+
+    def assertPriceOrdered(self, ids, descending):
+        price_base = dict(PropertyAdvertisement.objects.values_list('pk', 'price_base'))
+        active = PropertyAdvertisement.objects.filter(is_active=True).values_list('pk', flat=True)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids), set(active))
+        priced = [price_base[pk] for pk in ids if price_base[pk] is not None]
+        self.assertEqual(priced, sorted(priced, reverse=descending))
+        # NULLs come after every priced ad.
+        self.assertTrue(all(price_base[pk] is None for pk in ids[len(priced):]))
+
+    def test_price_order_across_cursor_pages(self):
+        self.assertTrue(PropertyAdvertisement.objects.filter(price_base__isnull=True).exists())
+        for fast in (False, True):
+            with override_settings(FAST_LIST_SERIALIZERS=fast):
+                self.assertPriceOrdered(self.fetch_all({'ordering': '-price'}), descending=True)
+                self.assertPriceOrdered(self.fetch_all({'ordering': 'price'}), descending=False)
+
+
+class ImageReconciliationTests(TestCase):
+    """An images update listing existing ids keeps, reorders, adds and removes images in place."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.ad = PropertyAdvertisement.objects.create(
+            location=Location.objects.create(city='Kyrenia', area=None), title='Harbour flat',
+            price=Decimal('90000'), price_currency='GBP', address='Harbour street', room_type='2+1',
+            property_type='apartment', advertisement_type='sale', gross_area=80,
+        )
+        self.images = [
+            PropertyImage.objects.create(
+                property_ad=self.ad, image=ContentFile(jpeg_bytes((i * 80, 0, 0)), name=f'{i}.jpg'),
+                position=i, is_cover=i == 0,
+            )
+            for i in range(3)
+        ]
+
+    def test_listed_images_are_kept_and_the_rest_replaced(self):
+        first, second, third = self.images
+        new_image = 'data:image/jpeg;base64,' + base64.b64encode(jpeg_bytes((0, 200, 0))).decode('ascii')
+        reconcile_ad_images(PropertyImage, 'property_ad', self.ad, [
+            {'id': third.pk}, {'image': new_image, 'is_cover': True}, {'id': first.pk},
+        ])
+
+        images = list(PropertyImage.objects.filter(property_ad=self.ad).order_by('position'))
+        self.assertEqual([image.position for image in images], [0, 1, 2])
+        self.assertEqual([images[0].pk, images[2].pk], [third.pk, first.pk])
+        # Kept rows keep their stored file; only the new one was written.
+        self.assertEqual([images[0].image.name, images[2].image.name], [third.image.name, first.image.name])
+        self.assertNotIn(images[1].pk, [image.pk for image in self.images])
+        self.assertEqual([image.is_cover for image in images], [False, True, False])
+
+        self.assertFalse(PropertyImage.objects.filter(pk=second.pk).exists())
+        self.assertEqual(Blob.objects.get(name=second.image.name).ref_count, 0)
+        self.assertEqual(Blob.objects.get(name=images[1].image.name).ref_count, 1)
+        self.assertEqual(Blob.objects.get(name=first.image.name).ref_count, 1)
+
+    def test_unknown_id_changes_nothing(self):
+        with self.assertRaises(ValidationError):
+            reconcile_ad_images(PropertyImage, 'property_ad', self.ad, [{'id': self.images[0].pk}, {'id': 0}])
+        self.assertEqual(
+            sorted(PropertyImage.objects.filter(property_ad=self.ad).values_list('pk', flat=True)),
+            sorted(image.pk for image in self.images),
+        )
+
+    def test_duplicate_id_changes_nothing(self):
+        first = self.images[0]
+        with self.assertRaises(ValidationError):
+            reconcile_ad_images(PropertyImage, 'property_ad', self.ad, [{'id': first.pk}, {'id': first.pk}])
+        self.assertEqual(
+            sorted(PropertyImage.objects.filter(property_ad=self.ad).values_list('pk', flat=True)),
+            sorted(image.pk for image in self.images),
+        )
+
+    def test_reorder_updates_the_cached_detail_and_index_cover(self):
+        cache.clear()
+        first, second, third = self.images
+        user = User.objects.create_user(email='reorder@example.com', password='secret')
+        admin_client = APIClient()
+        admin_client.force_authenticate(user)
+        detail_url = f'/api/properties/{self.ad.pk}/'
+
+        self.assertEqual([image['id'] for image in self.client.get(detail_url).json()['images']],
+                         [first.pk, second.pk, third.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            response = admin_client.patch(f'/api/properties/admin/{self.ad.pk}/', {
+                'images': [{'id': third.pk, 'is_cover': True}, {'id': first.pk}, {'id': second.pk}],
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        images = self.client.get(detail_url).json()['images']
+        self.assertEqual([image['id'] for image in images], [third.pk, first.pk, second.pk])
+        self.assertEqual([image['is_cover'] for image in images], [True, False, False])
+        self.assertEqual(
+            AdIndex.objects.get(kind=PropertyAdvertisement.AD_INDEX_KIND, ad_id=self.ad.pk).cover_image_path,
+            third.image.name,
+        )
+
+    def test_images_are_ready_only_once_their_derivatives_exist(self):
+        first, second, third = self.images
+        self.assertEqual({image.status for image in self.images}, {PropertyImage.PENDING})
+        generate_derivatives(first.image.storage, first.image.name)
+
+        migration = importlib.import_module('properties.migrations.0010_image_status')
+        migration.mark_processed_images_ready(apps, None)
+        statuses = dict(PropertyImage.objects.filter(property_ad=self.ad).values_list('pk', 'status'))
+        self.assertEqual(
+            [statuses[image.pk] for image in self.images],
+            [PropertyImage.READY, PropertyImage.PENDING, PropertyImage.PENDING],
+        )
+
+        generate_derivatives(second.image.storage, second.image.name)
+        GenerateImageDerivatives().mark_ready(PropertyImage, [second.image.name])
+        second.refresh_from_db()
+        third.refresh_from_db()
+        self.assertEqual((second.status, third.status), (PropertyImage.READY, PropertyImage.PENDING))
+
+class StreamingUploadTests(TestCase):
+    """Multipart uploads are streamed to disk, hashed on the way and stored as blobs."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.ad = PropertyAdvertisement.objects.create(
+            location=Location.objects.create(city='Guzelyurt', area=None), title='Citrus farm',
+            price=Decimal('180000'), price_currency='GBP', address='Farm road', room_type='3+1',
+            property_type='villa', advertisement_type='sale', gross_area=160,
+        )
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(User.objects.create_user(email='uploader@example.com', password='secret'))
+
+    def test_upload_is_stored_under_its_content_hash(self):
+        data = jpeg_bytes((0, 120, 60))
+        response = self.admin_client.post(
+            f'/api/properties/admin/{self.ad.pk}/upload-files/',
+            {'images': SimpleUploadedFile('Photo.JPG', data, content_type='image/jpeg')},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 201)
+
+        image = PropertyImage.objects.get(property_ad=self.ad)
+        self.assertEqual(image.image.name, blob_name(hashlib.sha256(data).hexdigest(), '.jpg'))
+        self.assertTrue(image.is_cover)
+        with image.image.open('rb') as stored:
+            self.assertEqual(stored.read(), data)
+        self.assertEqual(Blob.objects.get(name=image.image.name).ref_count, 1)
+
+
+class PropertyDetailCacheTests(TestCase):
+    """The cached public detail is evicted when the ad or a row shown in it is saved."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+        self.ad = PropertyAdvertisement.objects.create(
+            location=Location.objects.create(city='Lapta', area=None), title='Hillside villa',
+            price=Decimal('250000'), price_currency='GBP', address='Hill road', room_type='4+1',
+            property_type='villa', advertisement_type='sale', gross_area=220,
+        )
+        self.image = PropertyImage.objects.create(
+            property_ad=self.ad, image=ContentFile(jpeg_bytes((0, 0, 200)), name='villa.jpg'), position=0,
+        )
+        self.features = PropertyExternalFeature.objects.create(property_ad=self.ad)
+        self.url = f'/api/properties/{self.ad.pk}/'
+
+    def detail(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def assert_change_evicts_the_cached_detail(self, instance, field, value, read):
+        self.detail()
+        self.assertIsNotNone(cache.get(ad_detail_cache_key('properties', self.ad.pk)))
+        with self.captureOnCommitCallbacks(execute=True):
+            setattr(instance, field, value)
+            instance.save()
+        self.assertIsNone(cache.get(ad_detail_cache_key('properties', self.ad.pk)))
+        self.assertEqual(read(self.detail()), value)
+
+    def test_ad_save_evicts_the_cached_detail(self):
+        self.assert_change_evicts_the_cached_detail(self.ad, 'title', 'Clifftop villa', lambda data: data['title'])
+
+    def test_image_save_evicts_the_cached_detail(self):
+        self.assert_change_evicts_the_cached_detail(
+            self.image, 'position', 3, lambda data: data['images'][0]['position'],
+        )
+
+    def test_feature_save_evicts_the_cached_detail(self):
+        self.assert_change_evicts_the_cached_detail(
+            self.features, 'swimming_pool', True, lambda data: data['external_features']['swimming_pool'],
+        )
+
+
+class FeatureMaskFilterTests(TestCase):
+    """`?features=` matches ads having every listed feature, whichever feature table holds it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        location = Location.objects.create(city='Famagusta', area=None)
+        cls.ads = {}
+        for name, elevator, balcony in [('both', True, True), ('elevator', True, False),
+                                         ('balcony', False, True), ('neither', False, False)]:
+            ad = PropertyAdvertisement.objects.create(
+                location=location, title=f'Flat with {name}', price=Decimal('70000'), price_currency='GBP',
+                address='Salamis road', room_type='2+1', property_type='apartment',
+                advertisement_type='sale', gross_area=75,
+            )
+            PropertyExternalFeature.objects.create(property_ad=ad, elevator=elevator)
+            PropertyInteriorFeature.objects.create(property_ad=ad, balcony=balcony)
+            cls.ads[name] = ad.pk
+
+    def setUp(self):
+        cache.clear()
+
+    def listed_ids(self, features):
+        response = self.client.get('/api/properties/', {'features': features, 'page_size': 10})
+        self.assertEqual(response.status_code, 200)
+        return {result['id'] for result in response.json()['results']}
+
+    def test_all_listed_features_are_required(self):
+        self.assertEqual(self.listed_ids('elevator,balcony'), {self.ads['both']})
+        self.assertEqual(self.listed_ids('elevator'), {self.ads['both'], self.ads['elevator']})
+        self.assertEqual(self.listed_ids('balcony'), {self.ads['both'], self.ads['balcony']})
+
+    def test_unknown_feature_is_rejected(self):
+        response = self.client.get('/api/properties/', {'features': 'elevator,moat'})
+        self.assertEqual(response.status_code, 400)
+
+
+class FeatureBitsTests(SimpleTestCase):
+    """feature_mask bits come from the append-only FEATURE_BITS maps, not field order."""
+
+    def test_every_feature_has_its_own_bit(self):
+        for model in (PropertyAdvertisement, CarAdvertisement):
+            keys = [key for feature_model in model.feature_models() for key in get_bilingual_feature_metadata(feature_model)]
+            bits = model.feature_bits()
+            self.assertEqual(sorted(bits), sorted(keys))
+            self.assertEqual(len(set(bits.values())), len(keys))
+
+    def test_bits_follow_the_map_not_declaration_order(self):
+        keys = list(get_bilingual_feature_metadata(PropertyExternalFeature))
+        reordered = {key: number for number, key in enumerate(reversed(keys))}
+        self.assertEqual(get_feature_bits([PropertyExternalFeature], reordered)[keys[0]], 1 << (len(keys) - 1))
+
+    def test_unnumbered_or_shared_bits_are_rejected(self):
+        numbers = dict(PropertyAdvertisement.FEATURE_BITS)
+        del numbers['elevator']
+        with self.assertRaises(ImproperlyConfigured):
+            get_feature_bits([PropertyExternalFeature], numbers)
+        numbers['elevator'] = numbers['gardened']
+        with self.assertRaises(ImproperlyConfigured):
+            get_feature_bits([PropertyExternalFeature], numbers)
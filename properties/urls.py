@@ -9,6 +9,7 @@ urlpatterns = [
 # Public URLs
     path('', views.PublicPropertyListView.as_view(), name='public-property-list'),
     path('<int:pk>/', views.PublicPropertyDetailView.as_view(), name='public-property-detail'),
+    path('facets/', views.PublicPropertyFacetsView.as_view(), name='public-property-facets'),
     path('features/external/', views.PropertyExternalFeaturesMetadataView.as_view(),
          name='property-external-features-metadata'),
     path('features/interior/', views.PropertyInteriorFeaturesMetadataView.as_view(),
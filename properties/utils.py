@@ -1,5 +1,7 @@
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.files.base import ContentFile
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.db.models.fields.reverse_related import (
     ManyToOneRel,
     OneToOneRel,
@@ -7,9 +9,13 @@ from django.db.models.fields.reverse_related import (
 )
 from django.apps import apps
 from django.conf import settings
+from rest_framework.exceptions import ValidationError as DRFValidationError
 import base64
 import uuid
 
+from core.models import Blob
+from kibris_acil_satilik.images import enqueue_image_processing
+from kibris_acil_satilik.storage import HashingTemporaryFileUploadHandler
 from properties.constants import FEATURE_TR_LABELS_MAP
 
 
@@ -54,6 +60,112 @@ def base64_to_image_file(base64_string, name_prefix="img_"):
         return None
 
 
+def use_streaming_upload_handlers(request):
+    """
+    Makes a multipart request spool every uploaded file to a temporary file in
+    FILE_UPLOAD chunks instead of buffering it in memory, hashing it on the way for
+    ContentAddressedStorage. Must run before request.data is first accessed.
+    """
+    django_request = getattr(request, '_request', request)
+    django_request.upload_handlers = [HashingTemporaryFileUploadHandler(django_request)]
+
+
+def prepare_uploaded_image(uploaded_file, image_field, name_prefix="img_"):
+    """
+    Validates a streamed upload against the image field's validators and the
+    IMAGE_UPLOAD_MAX_BYTES limit, and gives it a unique storage name. Raises
+    django.core.exceptions.ValidationError.
+    """
+    if uploaded_file.size > settings.IMAGE_UPLOAD_MAX_BYTES:
+        raise ValidationError(f"{uploaded_file.name} is larger than {settings.IMAGE_UPLOAD_MAX_BYTES} bytes.")
+    image_field.run_validators(uploaded_file)
+    ext = uploaded_file.name.rsplit('.', 1)[-1].lower()
+    uploaded_file.name = f"{name_prefix}{uuid.uuid4()}.{ext}"
+    return uploaded_file
+
+
+def plan_cover_flags(explicit_cover_flags, ad_has_cover):
+    """
+    Decides which image of an uploaded batch becomes the cover, using the same rules as the
+    base64 upload: the first image explicitly marked as cover wins, replacing any existing
+    cover; without one, the first image becomes the cover only if the ad has none yet.
+    """
+    flags = []
+    cover_assigned = False
+    for i, is_explicit_cover in enumerate(explicit_cover_flags):
+        is_cover = not cover_assigned and (is_explicit_cover or (i == 0 and not ad_has_cover))
+        cover_assigned = cover_assigned or is_cover
+        flags.append(is_cover)
+    return flags
+
+
+def is_image_reconciliation_payload(images_payload_list):
+    """An `images` update payload that references existing images by id is reconciled, not replaced."""
+    return any(isinstance(item, dict) and item.get('id') is not None for item in images_payload_list)
+
+
+def reconcile_ad_images(image_model, ad_field, ad, images_payload_list, name_prefix="img_"):
+    """
+    Brings an ad's images in line with an update payload listing, in display order, items
+    that are either `{"id": <existing image id>}` or `{"image": <base64>}`, each with an
+    optional `is_cover`. Existing images not listed are deleted, releasing their blobs;
+    listed ones keep their files. Only new images are written to storage. The cover is the
+    first item marked is_cover, else the first item.
+    DB changes are one bulk delete, one bulk update and one bulk create. Unknown or
+    repeated image ids are rejected with a ValidationError.
+    """
+    existing = {image.pk: image for image in image_model.objects.filter(**{ad_field: ad})}
+    items = [item for item in images_payload_list if isinstance(item, dict)]
+
+    try:
+        referenced_ids = [int(item['id']) for item in items if item.get('id') is not None]
+    except (TypeError, ValueError):
+        raise DRFValidationError({"images": ["Image ids must be integers."]})
+    unknown_ids = sorted(set(referenced_ids) - existing.keys())
+    if unknown_ids:
+        raise DRFValidationError({"images": [f"Unknown image id(s) for this ad: {unknown_ids}"]})
+    duplicate_ids = sorted({pk for pk in referenced_ids if referenced_ids.count(pk) > 1})
+    if duplicate_ids:
+        raise DRFValidationError({"images": [f"Duplicate image id(s): {duplicate_ids}"]})
+
+    resolved = []
+    for item in items:
+        if item.get('id') is not None:
+            image = existing[int(item['id'])]
+        else:
+            image_content_file = base64_to_image_file(item.get('image'), name_prefix=name_prefix)
+            if not image_content_file:
+                continue
+            image = image_model(**{ad_field: ad})
+            image.image.save(image_content_file.name, image_content_file, save=False)
+        resolved.append((image, bool(item.get('is_cover'))))
+
+    cover_position = next((i for i, (_, is_cover) in enumerate(resolved) if is_cover), 0)
+    kept, created = [], []
+    for position, (image, _) in enumerate(resolved):
+        image.position = position
+        image.is_cover = position == cover_position
+        (created if image.pk is None else kept).append(image)
+
+    # The queryset delete still sends post_delete per image (blob release, cache
+    # invalidation), but bulk_update and bulk_create send no post_save. What the image
+    # receivers would do on save is therefore done by hand: take the new images' blob
+    # references, queue their processing jobs and re-sync the ad's cover path. The
+    # response and detail caches are invalidated by the advertisement save that the
+    # admin update views make before calling this.
+    kept_ids = set(referenced_ids)
+    removed = [image for pk, image in existing.items() if pk not in kept_ids]
+    if removed:
+        image_model.objects.filter(pk__in=[image.pk for image in removed]).delete()
+    if kept:
+        image_model.objects.bulk_update(kept, ['position', 'is_cover'])
+    if created:
+        image_model.objects.bulk_create(created)
+        Blob.acquire(*(image.image.name for image in created))
+        enqueue_image_processing(*created)
+    image_model.sync_cover_image_path(ad.pk)
+
+
 def get_bilingual_feature_metadata(model_class):
     features = {}
     for field in model_class._meta.get_fields():
@@ -70,6 +182,54 @@ def get_bilingual_feature_metadata(model_class):
     return features
 
 
+def get_feature_bits(feature_models, bit_numbers):
+    """
+    Maps each feature key of `feature_models` to its bit in an advertisement's feature_mask,
+    numbered by `bit_numbers` (see PROPERTY_FEATURE_BITS in properties.constants). A feature
+    without a number, or two features sharing one, would corrupt stored masks, so either
+    raises ImproperlyConfigured.
+    """
+    bits = {}
+    for model_class in feature_models:
+        for key in get_bilingual_feature_metadata(model_class):
+            if key not in bit_numbers:
+                raise ImproperlyConfigured(f"Feature '{key}' of {model_class.__name__} has no feature_mask bit.")
+            bits[key] = 1 << bit_numbers[key]
+    if len(set(bits.values())) != len(bits):
+        raise ImproperlyConfigured("Features of one advertisement model share a feature_mask bit.")
+    if max(bit_numbers.values(), default=0) > 62:
+        raise ImproperlyConfigured("feature_mask is a signed 64-bit column; bits above 62 do not fit.")
+    return bits
+
+
+def build_feature_mask_expression(feature_models, bits, ad_field):
+    """
+    Expression computing an advertisement's feature_mask from its one-to-one feature rows,
+    for use in `update()`. `bits` maps feature keys to their bit (see get_feature_bits) and
+    `ad_field` is the feature models' foreign key to the advertisement.
+    """
+    expression = None
+    for model_class in feature_models:
+        model_bits = [
+            models.When(**{key: True}, then=models.Value(bits[key]))
+            for key in get_bilingual_feature_metadata(model_class)
+        ]
+        model_mask = sum(
+            (models.Case(when, default=models.Value(0)) for when in model_bits),
+            models.Value(0, output_field=models.BigIntegerField())
+        )
+        part = Coalesce(
+            models.Subquery(
+                model_class.objects.filter(**{ad_field: models.OuterRef('pk')})
+                .annotate(mask=model_mask).values('mask')[:1],
+                output_field=models.BigIntegerField()
+            ),
+            models.Value(0)
+        )
+        expression = part if expression is None else expression + part
+    return expression
+
+
 def get_choices_as_list_of_dicts(choices_tuple):
     """Helper function to convert Django choices tuple to a list of dicts."""
     return [{"value": choice[0], "label": choice[1]} for choice in choices_tuple]
@@ -158,6 +318,9 @@ def get_dynamic_model_form_schema(
         field_name = field.name
         field_data = {}
 
+        if field_name in getattr(model_class, 'DENORMALIZED_FIELDS', ()):
+            continue
+
 
         if is_child_schema:
             if field_name in fields_to_skip_in_children:
@@ -1,23 +1,39 @@
 import datetime
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from django.db import models
 from rest_framework import viewsets, permissions, status, generics, filters
 from rest_framework.decorators import action
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from knox.auth import TokenAuthentication
+from rest_framework.parsers import MultiPartParser, FormParser
+from kibris_acil_satilik.parsers import ORJSONParser
+from kibris_acil_satilik.authentication import CachedTokenAuthentication
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import PropertyAdvertisement, PropertyImage, Location, PropertyInteriorFeature, PropertyExternalFeature
 from .serializers import (
     PropertyAdminListSerializer, PropertyDetailSerializer, PropertyAdminCreateUpdateSerializer,
-    PropertyListSerializer, PropertyImageSerializer, LatestAdvertisementSerializer, PropertyBasicSerializer
+    PropertyListSerializer, PropertyImageSerializer, PropertyBasicSerializer, PropertyListValuesSerializer,
+    PropertyAdminListValuesSerializer
 )
 from .filters import PropertyFilter
+from kibris_acil_satilik.search import FullTextSearchFilter
+from kibris_acil_satilik.ordering import AliasedOrderingFilter
+from kibris_acil_satilik.autocomplete import get_suggestions, normalize_prefix
+from kibris_acil_satilik.facets import FacetCountsView
+from kibris_acil_satilik.http import PrecomputedJSON
+from kibris_acil_satilik.response_cache import AdDetailCacheMixin, PublicResponseCacheMixin
+from kibris_acil_satilik.values_serializers import ValuesListMixin
+from kibris_acil_satilik.pagination import FeedPagination
+from core.models import AdIndex
+from core.serializers import AdCardSerializer
 from vehicles.models import CarAdvertisement, CarExternalFeature, CarInternalFeature
 from .constants import PREDEFINED_CAR_DATA, PROPERTY_TYPE_TR_LABELS_MAP, VEHICLE_TYPE_TR_LABELS_MAP, \
     FUEL_TYPE_TR_LABELS_MAP, TRANSMISSION_TR_LABELS_MAP, WARMING_TYPE_TR_LABELS_MAP
 from .utils import get_dynamic_model_form_schema, base64_to_image_file
+from .utils import plan_cover_flags, prepare_uploaded_image, use_streaming_upload_handlers
+from .utils import is_image_reconciliation_payload, reconcile_ad_images
 from .data_loaders import CITY_AREAS_DATA
 from .utils import (
     get_bilingual_feature_metadata,
@@ -26,19 +42,21 @@ from .utils import (
 )
 
 
-class PropertyAdminViewSet(viewsets.ModelViewSet):
+class PropertyAdminViewSet(ValuesListMixin, viewsets.ModelViewSet):
 
     queryset = PropertyAdvertisement.objects.select_related(
         'location', 'user', 'explanation', 'external_features', 'interior_features'
     ).prefetch_related('images').all()
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
-    parser_classes = [FormParser, JSONParser]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    authentication_classes = [CachedTokenAuthentication]
+    parser_classes = [FormParser, ORJSONParser]
+    filter_backends = [DjangoFilterBackend, AliasedOrderingFilter, FullTextSearchFilter]
     filterset_class = PropertyFilter
     search_fields = ['title', 'advertise_no', 'explanation__explanation', 'location__city', 'location__area']
     ordering_fields = ['created_at', 'published_date', 'price', 'title']
+    ordering_aliases = {'price': 'price_base'}
     ordering = ['-created_at']
+    values_serializer_class = PropertyAdminListValuesSerializer
 
     http_method_names = ['get', 'post', 'put', 'patch', 'head', 'options']
 
@@ -151,7 +169,12 @@ class PropertyAdminViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         updated_instance = serializer.save(location=location)
 
-        if images_payload_list is not None: 
+        if images_payload_list is not None and is_image_reconciliation_payload(images_payload_list):
+            reconcile_ad_images(
+                PropertyImage, 'property_ad', updated_instance, images_payload_list,
+                name_prefix=f"property_{updated_instance.id}_img_"
+            )
+        elif images_payload_list is not None: 
             existing_images = PropertyImage.objects.filter(property_ad=updated_instance)
             for img in existing_images:
                 img.delete()
@@ -200,7 +223,7 @@ class PropertyAdminViewSet(viewsets.ModelViewSet):
         detail_serializer = PropertyDetailSerializer(updated_instance, context=self.get_serializer_context())
         return Response(detail_serializer.data)
 
-    @action(detail=True, methods=['post'], parser_classes=[JSONParser], url_path='upload-images')
+    @action(detail=True, methods=['post'], parser_classes=[ORJSONParser], url_path='upload-images')
     def upload_images(self, request, pk=None):
         """Upload additional images for a specific property."""
         property_ad = self.get_object()
@@ -248,6 +271,44 @@ class PropertyAdminViewSet(viewsets.ModelViewSet):
         serializer = PropertyImageSerializer(created_images, many=True, context=self.get_serializer_context())
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=['post'], parser_classes=[MultiPartParser], url_path='upload-files')
+    def upload_files(self, request, pk=None):
+        """
+        Upload additional images for a specific property as multipart `images` files, each
+        streamed to a temporary file and moved into storage. `cover_index` optionally marks
+        which of them should become the cover.
+        """
+        use_streaming_upload_handlers(request)
+        property_ad = self.get_object()
+        uploaded_files = request.FILES.getlist('images')
+        if not uploaded_files:
+            return Response({"detail": "No 'images' files were uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+
+        cover_index = request.data.get('cover_index')
+        try:
+            cover_index = int(cover_index) if cover_index not in (None, '') else None
+        except ValueError:
+            return Response({"cover_index": "A valid integer is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        image_field = PropertyImage._meta.get_field('image')
+        try:
+            image_files = [
+                prepare_uploaded_image(uploaded_file, image_field, name_prefix=f"property_{property_ad.id}_upload_")
+                for uploaded_file in uploaded_files
+            ]
+        except DjangoValidationError as e:
+            return Response({"images": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+        ad_has_cover = PropertyImage.objects.filter(property_ad=property_ad, is_cover=True).exists()
+        cover_flags = plan_cover_flags([i == cover_index for i in range(len(image_files))], ad_has_cover)
+
+        created_images = []
+        with transaction.atomic():
+            for image_file, is_cover in zip(image_files, cover_flags):
+                created_images.append(PropertyImage.objects.create(property_ad=property_ad, image=image_file, is_cover=is_cover))
+        serializer = PropertyImageSerializer(created_images, many=True, context=self.get_serializer_context())
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     @action(detail=True, methods=['post'], url_path='set-cover-image/(?P<image_pk>[^/.]+)')
     def set_cover_image(self, request, pk=None, image_pk=None):
         """Set a specific image as the cover photo."""
@@ -287,20 +348,24 @@ class PropertyAdminViewSet(viewsets.ModelViewSet):
 class PropertyBasicListView(generics.ListAPIView):
     serializer_class = PropertyBasicSerializer
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
-    queryset = PropertyAdvertisement.objects.filter(is_active=True).prefetch_related('images').order_by('-published_date')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    authentication_classes = [CachedTokenAuthentication]
+    queryset = PropertyAdvertisement.objects.filter(is_active=True).order_by('-published_date')
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, AliasedOrderingFilter]
     filterset_fields = ['is_active']
     search_fields = ['title']
     ordering_fields = ['published_date', 'price', 'title']
-class PublicPropertyListView(generics.ListAPIView):
+    ordering_aliases = {'price': 'price_base'}
+class PublicPropertyListView(ValuesListMixin, PublicResponseCacheMixin, generics.ListAPIView):
     """View for listing ACTIVE properties publicly"""
     serializer_class = PropertyListSerializer
-    permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    values_serializer_class = PropertyListValuesSerializer
+    permission_classes = [permissions.AllowAny]
+    response_cache_namespaces = ['properties']
+    filter_backends = [DjangoFilterBackend, AliasedOrderingFilter, FullTextSearchFilter]
     filterset_class = PropertyFilter
     search_fields = ['title', 'explanation__explanation', 'location__city', 'location__area']
     ordering_fields = ['published_date', 'price', 'title']
+    ordering_aliases = {'price': 'price_base'}
     ordering = ['-published_date']
 
     def get_queryset(self):
@@ -308,10 +373,29 @@ class PublicPropertyListView(generics.ListAPIView):
         return PropertyAdvertisement.objects.filter(is_active=True).select_related('location').prefetch_related('images').order_by('-published_date')
 
 
-class PublicPropertyDetailView(generics.RetrieveAPIView):
+class PublicPropertyFacetsView(PublicResponseCacheMixin, FacetCountsView):
+    """Per-facet counts of ACTIVE properties matching the public list's filters"""
+    permission_classes = [permissions.AllowAny]
+    response_cache_namespaces = ['properties']
+    queryset = PropertyAdvertisement.objects.filter(is_active=True)
+    filterset_class = PropertyFilter
+    search_fields = ['title', 'explanation__explanation', 'location__city', 'location__area']
+    facets = {
+        'type': 'property_type',
+        'roomType': 'room_type',
+        'city': 'location__city',
+        'location': 'location__area',
+        'advertisementType': 'advertisement_type',
+        'warmingType': 'warming_type',
+        'floorLocation': 'floor_location',
+    }
+
+
+class PublicPropertyDetailView(AdDetailCacheMixin, generics.RetrieveAPIView):
     """View for retrieving ACTIVE property details publicly"""
     serializer_class = PropertyDetailSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.AllowAny]
+    detail_cache_kind = 'properties'
     lookup_field = 'pk'
 
     def get_queryset(self):
@@ -350,38 +434,52 @@ class PropertyInteriorFeaturesMetadataView(APIView):
         interior_features = get_feature_metadata(PropertyInteriorFeature)
         return Response(interior_features)
 
-class LatestAdvertisementsView(APIView):
+class LatestAdvertisementsView(PublicResponseCacheMixin, generics.ListAPIView):
+    """Newest active properties and cars in one feed, cursor-paged over core.AdIndex."""
+    serializer_class = AdCardSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = FeedPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['kind']
+    response_cache_namespaces = ['properties', 'cars']
+
+    def get_queryset(self):
+        return AdIndex.objects.filter(is_active=True).order_by('-published_date', '-id')
+
+class UnifiedSearchView(PublicResponseCacheMixin, generics.ListAPIView):
+    """
+    Full-text search over active properties and cars at once: `?search=` is matched against
+    core.AdIndex's search vectors, results are ranked together and cursor-paged by rank, and
+    returned as compact cards. Without a search term it lists the newest ads.
+    """
+    serializer_class = AdCardSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = FeedPagination
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter]
+    filterset_fields = ['kind']
+    search_fields = ['title']
+    response_cache_namespaces = ['properties', 'cars']
+
+    def get_queryset(self):
+        return AdIndex.objects.filter(is_active=True).order_by('-published_date', '-id')
+
+class AutocompleteView(APIView):
+    """Typo-tolerant suggestions for the search box across property and car listings."""
     permission_classes = [permissions.IsAuthenticated]
-    AD_COUNT_LIMIT =6
 
     def get(self, request, *args, **kwargs):
-        latest_properties_qs = PropertyAdvertisement.objects.filter(
-            is_active=True
-        ).select_related(
-            'location'
-        ).prefetch_related(
-            'images'
-        ).order_by('-published_date')[:self.AD_COUNT_LIMIT]
-
-        latest_cars_qs = CarAdvertisement.objects.filter(
-            is_active=True
-        ).prefetch_related(
-            'images'
-        ).order_by('-published_date')[:self.AD_COUNT_LIMIT]
-
-        combined_ads_list = list(latest_properties_qs) + list(latest_cars_qs)
-
-        combined_ads_list.sort(key=lambda ad: ad.published_date, reverse=True)
-
-        final_latest_ads_to_serialize = combined_ads_list[:self.AD_COUNT_LIMIT]
-
-        serializer = LatestAdvertisementSerializer(
-            final_latest_ads_to_serialize,
-            many=True,
-            context={'request': request}
-        )
+        query = normalize_prefix(request.query_params.get('q', ''))
+        try:
+            limit = int(request.query_params.get('limit', settings.AUTOCOMPLETE_DEFAULT_LIMIT))
+        except ValueError:
+            return Response({"limit": "A valid integer is required."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, settings.AUTOCOMPLETE_MAX_LIMIT))
 
-        return Response(serializer.data)
+        if len(query) < settings.AUTOCOMPLETE_MIN_LENGTH:
+            return Response({"query": query, "suggestions": [], "timed_out": False})
+
+        suggestions, timed_out = get_suggestions(query, limit)
+        return Response({"query": query, "suggestions": suggestions, "timed_out": timed_out})
 
 class CombinedFilterOptionsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
@@ -464,67 +562,84 @@ class CombinedFilterOptionsView(APIView):
             "internalFeatures": car_internal_features,
         }
 
-    def get(self, request, *args, **kwargs):
-        data = {
+    def get_options(self):
+        return {
             "property": self.get_property_options(),
             "car": self.get_car_options()
         }
-        return Response(data)
 
+    def get(self, request, *args, **kwargs):
+        return FILTER_OPTIONS.response(request)
 
 
-class PropertyAdvertisementFormSchemaView(APIView):
-    permission_classes = [permissions.IsAuthenticated]
+# The options only change on deploy, except the model-year list which ends at the current year.
+FILTER_OPTIONS = PrecomputedJSON(
+    build=lambda: CombinedFilterOptionsView().get_options(),
+    version=lambda: datetime.date.today().year,
+    max_age=settings.FILTER_OPTIONS_MAX_AGE,
+)
 
-    def get(self, request, *args, **kwargs):
-        main_model = PropertyAdvertisement
-        app_label = main_model._meta.app_label
-
-
-        property_special_handlers = {
-            "location": {
-                "type": "location_picker_new",
-                "field_name_match": "location",
-                "related_model_app": app_label,
-                "related_model_name": "Location",
-                "data_source_key": "cityAreas",
-                "city_object_value_key": "value",
-                "city_object_label_en_key": "label_en",
-                "city_object_label_tr_key": "label_tr",
-                "city_object_areas_list_key": "areas",
-                "area_object_value_key": "value",
-                "area_object_label_key": "label",
-                "city_payload_key": "city",
-                "area_payload_key": "area",
-            }
-        }
 
-        property_nested_objects = {
-            'external_features': 'PropertyExternalFeature',
-            'interior_features': 'PropertyInteriorFeature',
-        }
-        property_list_children = {
-            'images': 'PropertyImage',
-        }
-        property_single_field_one_to_one = {
-            'explanation': ('PropertyExplanation', 'explanation'),
+
+def build_property_form_schema():
+    main_model = PropertyAdvertisement
+    app_label = main_model._meta.app_label
+
+
+    property_special_handlers = {
+        "location": {
+            "type": "location_picker_new",
+            "field_name_match": "location",
+            "related_model_app": app_label,
+            "related_model_name": "Location",
+            "data_source_key": "cityAreas",
+            "city_object_value_key": "value",
+            "city_object_label_en_key": "label_en",
+            "city_object_label_tr_key": "label_tr",
+            "city_object_areas_list_key": "areas",
+            "area_object_value_key": "value",
+            "area_object_label_key": "label",
+            "city_payload_key": "city",
+            "area_payload_key": "area",
         }
+    }
+
+    property_nested_objects = {
+        'external_features': 'PropertyExternalFeature',
+        'interior_features': 'PropertyInteriorFeature',
+    }
+    property_list_children = {
+        'images': 'PropertyImage',
+    }
+    property_single_field_one_to_one = {
+        'explanation': ('PropertyExplanation', 'explanation'),
+    }
+
+    form_meta = get_dynamic_model_form_schema(
+        main_model,
+        app_label=app_label,
+        nested_object_relations_config=property_nested_objects,
+        list_child_relations_config=property_list_children,
+        single_field_one_to_one_config=property_single_field_one_to_one,
+        special_handlers=property_special_handlers
+    )
+
+    return {
+        "form_meta": form_meta,
+        "cityAreas": CITY_AREAS_DATA,
+    }
+
+
+# A pure function of the model definitions, so it is built on first use and kept for the process.
+PROPERTY_FORM_SCHEMA = PrecomputedJSON(build_property_form_schema, max_age=settings.FILTER_OPTIONS_MAX_AGE)
 
-        try:
-            form_meta = get_dynamic_model_form_schema(
-                main_model,
-                app_label=app_label,
-                nested_object_relations_config=property_nested_objects,
-                list_child_relations_config=property_list_children,
-                single_field_one_to_one_config=property_single_field_one_to_one,
-                special_handlers=property_special_handlers
-            )
 
-            response_data = {
-                "form_meta": form_meta,
-                "cityAreas": CITY_AREAS_DATA,
-            }
-            return Response(response_data)
+class PropertyAdvertisementFormSchemaView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            return PROPERTY_FORM_SCHEMA.response(request)
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -1,14 +1,17 @@
 from django_filters import rest_framework as filters
+from properties.filters import FeatureMaskFilter
 from .models import CarAdvertisement
 
 
 class CarFilter(filters.FilterSet):
-    minPrice = filters.NumberFilter(field_name="price", lookup_expr='gte')
-    maxPrice = filters.NumberFilter(field_name="price", lookup_expr='lte')
+    # Price bounds are in settings.BASE_CURRENCY and compared against the converted price.
+    minPrice = filters.NumberFilter(field_name="price_base", lookup_expr='gte')
+    maxPrice = filters.NumberFilter(field_name="price_base", lookup_expr='lte')
     type = filters.CharFilter(field_name="vehicle_type", lookup_expr='iexact')
     brand = filters.CharFilter(field_name="brand", lookup_expr='iexact')
     series = filters.CharFilter(field_name="series", lookup_expr='iexact')
     modelYear = filters.NumberFilter(field_name="model_year", lookup_expr='gte')
+    features = FeatureMaskFilter(field_name="features", label="Features")
 
     class Meta:
         model = CarAdvertisement
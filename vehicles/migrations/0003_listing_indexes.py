@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-17 00:08
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicles', '0002_rename_gear_type_caradvertisement_transmission_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='caradvertisement',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-published_date'], name='car_ad_active_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='caradvertisement',
+            index=models.Index(django.db.models.functions.text.Upper('brand'), django.db.models.functions.text.Upper('series'), models.F('model_year'), condition=models.Q(('is_active', True)), name='car_ad_brand_series_year_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-17 00:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+from django.db.models import F, Max, OuterRef, Subquery
+
+from kibris_acil_satilik.search import build_search_vector
+
+
+def backfill_search_vectors(apps, schema_editor):
+    # The expression of CarAdvertisement.search_vector_expression(), applied one pk
+    # range per UPDATE so a large table is not rewritten in a single statement.
+    CarAdvertisement = apps.get_model('vehicles', 'CarAdvertisement')
+    CarExplanation = apps.get_model('vehicles', 'CarExplanation')
+    explanation = CarExplanation.objects.filter(car_ad_id=OuterRef('pk'))
+    vector = build_search_vector([
+        (F('title'), 'A'),
+        (F('brand'), 'B'),
+        (F('series'), 'B'),
+        (F('city'), 'C'),
+        (F('area'), 'C'),
+        (F('address'), 'C'),
+        (Subquery(explanation.values('explanation')[:1]), 'D'),
+    ])
+    max_pk = CarAdvertisement.objects.aggregate(max_pk=Max('pk'))['max_pk'] or 0
+    for start in range(0, max_pk + 1, 1000):
+        CarAdvertisement.objects.filter(pk__gte=start, pk__lt=start + 1000).update(search_vector=vector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicles', '0004_cover_image_path'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='caradvertisement',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='caradvertisement',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='car_ad_search_vector_idx'),
+        ),
+        migrations.RunPython(backfill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-17 00:17
+
+from django.db import migrations, models
+
+from properties.constants import CAR_FEATURE_BITS
+from properties.utils import build_feature_mask_expression, get_feature_bits
+
+
+def backfill_feature_mask(apps, schema_editor):
+    CarAdvertisement = apps.get_model('vehicles', 'CarAdvertisement')
+    feature_models = [
+        apps.get_model('vehicles', 'CarExternalFeature'),
+        apps.get_model('vehicles', 'CarInternalFeature'),
+    ]
+    CarAdvertisement.objects.update(
+        feature_mask=build_feature_mask_expression(feature_models, get_feature_bits(feature_models, CAR_FEATURE_BITS), 'car_ad')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicles', '0006_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='caradvertisement',
+            name='feature_mask',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_feature_mask, migrations.RunPython.noop),
+    ]
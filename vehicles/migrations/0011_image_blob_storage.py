@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-17 00:28
+
+import django.core.validators
+import kibris_acil_satilik.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicles', '0010_image_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='carimage',
+            name='image',
+            field=models.ImageField(storage=kibris_acil_satilik.storage.get_image_storage, upload_to='car_images/', validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'webp'])]),
+        ),
+    ]
@@ -0,0 +1,168 @@
+# Generated by Django 5.2 on 2026-10-17 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicles', '0011_image_blob_storage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='caradvertisement',
+            name='brand',
+            field=models.CharField(blank=True, choices=[('audi', 'Audi'), ('bmw', 'BMW'), ('ford', 'Ford'), ('honda', 'Honda'), ('hyundai', 'Hyundai'), ('kia', 'Kia'), ('mercedesbenz', 'Mercedes-Benz'), ('nissan', 'Nissan'), ('peugeot', 'Peugeot'), ('renault', 'Renault'), ('skoda', 'Skoda'), ('toyota', 'Toyota'), ('volkswagen', 'Volkswagen'), ('volvo', 'Volvo')], max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='alloy_wheel',
+            field=models.BooleanField(default=False, verbose_name='Alloy Wheels'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='electric_mirrors',
+            field=models.BooleanField(default=False, verbose_name='Electric Mirrors'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='folding_mirrors',
+            field=models.BooleanField(default=False, verbose_name='Folding Mirrors'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='headlamp_xenon',
+            field=models.BooleanField(default=False, verbose_name='Xenon Headlamps'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='headlight_adaptive',
+            field=models.BooleanField(default=False, verbose_name='Adaptive Headlights'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='headlight_sensor',
+            field=models.BooleanField(default=False, verbose_name='Headlight Sensor'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='mirrors_heated',
+            field=models.BooleanField(default=False, verbose_name='Heated Mirrors'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='parking_sensor_front',
+            field=models.BooleanField(default=False, verbose_name='Front Parking Sensor'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='parking_sensor_rear',
+            field=models.BooleanField(default=False, verbose_name='Rear Parking Sensor'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='rain_sensor',
+            field=models.BooleanField(default=False, verbose_name='Rain Sensor'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='rear_window_defroster',
+            field=models.BooleanField(default=False, verbose_name='Rear Window Defroster'),
+        ),
+        migrations.AlterField(
+            model_name='carexternalfeature',
+            name='smart_tailgate',
+            field=models.BooleanField(default=False, verbose_name='Smart Tailgate'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='adaptive_cruise_control',
+            field=models.BooleanField(default=False, verbose_name='Adaptive Cruise Control'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='adjustable_steering_wheel',
+            field=models.BooleanField(default=False, verbose_name='Adjustable Steering Wheel'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='air_conditioner_digital',
+            field=models.BooleanField(default=False, verbose_name='Digital Air Conditioner'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='cruise_control',
+            field=models.BooleanField(default=False, verbose_name='Cruise Control'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='digital_monitor',
+            field=models.BooleanField(default=False, verbose_name='Digital Monitor'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='electric_windshields',
+            field=models.BooleanField(default=False, verbose_name='Electric Windshields'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='fabric_armchair',
+            field=models.BooleanField(default=False, verbose_name='Fabric Armchair'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='forward_gear',
+            field=models.BooleanField(default=False, verbose_name='Forward Gear'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='front_armrest',
+            field=models.BooleanField(default=False, verbose_name='Front Armrest'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='functional_steering_wheel',
+            field=models.BooleanField(default=False, verbose_name='Functional Steering Wheel'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='hydraulic_steering',
+            field=models.BooleanField(default=False, verbose_name='Hydraulic Steering'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='keyless_drive',
+            field=models.BooleanField(default=False, verbose_name='Keyless Drive'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='leather_fabric_armchair',
+            field=models.BooleanField(default=False, verbose_name='Leather-Fabric Armchair'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='leather_steering_wheel',
+            field=models.BooleanField(default=False, verbose_name='Leather Steering Wheel'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='rear_armrest',
+            field=models.BooleanField(default=False, verbose_name='Rear Armrest'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='reverse_view_camera',
+            field=models.BooleanField(default=False, verbose_name='Reverse View Camera'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='road_computer',
+            field=models.BooleanField(default=False, verbose_name='Road Computer'),
+        ),
+        migrations.AlterField(
+            model_name='carinternalfeature',
+            name='start_stop',
+            field=models.BooleanField(default=False, verbose_name='Start-Stop System'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from kibris_acil_satilik.images import build_srcset
+from kibris_acil_satilik.values_serializers import ImageValuesSerializer, ValuesSerializer
 from .models import (
     CarAdvertisement, CarImage, CarExplanation,
     CarExternalFeature, CarInternalFeature
@@ -7,11 +9,12 @@ from .models import (
 
 class CarImageSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = CarImage
-        fields = ('id', 'image',  'is_cover', 'uploaded_at')
-        read_only_fields = ('id', 'uploaded_at')
+        fields = ('id', 'image', 'srcset', 'is_cover', 'position', 'status', 'uploaded_at')
+        read_only_fields = ('id', 'status', 'uploaded_at')
 
     def get_image(self, obj):
         request = self.context.get('request')
@@ -19,6 +22,9 @@ class CarImageSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(obj.image.url)
         return None
 
+    def get_srcset(self, obj):
+        return build_srcset(self.context.get('request'), obj)
+
 
 class CarExplanationSerializer(serializers.ModelSerializer):
 
@@ -48,14 +54,10 @@ class CarBasicSerializer(serializers.ModelSerializer):
         fields = ('id', 'title', 'price', 'published_date', 'is_active', 'cover_image')
 
     def get_cover_image(self, obj):
-        cover_image_instance = obj.images.filter(is_cover=True).first()
-        if not cover_image_instance:
-            cover_image_instance = obj.images.first()
-
-        if cover_image_instance:
-            request = self.context.get('request')
-            image_serializer_data = CarImageSerializer(cover_image_instance, context={'request': request}).data
-            return image_serializer_data.get('image')
+        request = self.context.get('request')
+        if obj.cover_image_path and request:
+            storage = CarImage._meta.get_field('image').storage
+            return request.build_absolute_uri(storage.url(obj.cover_image_path))
         return None
 
 class CarListSerializer(serializers.ModelSerializer):
@@ -81,6 +83,20 @@ class CarAdminListSerializer(CarListSerializer):
         )
 
 
+class CarImageValuesSerializer(ImageValuesSerializer):
+    serializer_class = CarImageSerializer
+
+
+class CarListValuesSerializer(ValuesSerializer):
+    """CarListSerializer's output built from values() rows, for the list fast path."""
+    serializer_class = CarListSerializer
+    related = {'images': (CarImageValuesSerializer, 'car_ad')}
+
+
+class CarAdminListValuesSerializer(CarListValuesSerializer):
+    serializer_class = CarAdminListSerializer
+
+
 class CarDetailSerializer(serializers.ModelSerializer):
     """Serializer for DETAILED car view (Public and Admin)"""
     images = CarImageSerializer(many=True, read_only=True)
@@ -91,7 +107,7 @@ class CarDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = CarAdvertisement
-        fields = '__all__'
+        exclude = CarAdvertisement.DENORMALIZED_FIELDS
 
 class CarAdminCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer used by Admin for Creating and Updating Cars"""
@@ -0,0 +1,88 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import AdIndex
+from kibris_acil_satilik.images import enqueue_image_processing
+from kibris_acil_satilik.response_cache import invalidate_ad_details, invalidate_public_responses
+from .models import CarAdvertisement, CarExplanation, CarExternalFeature, CarImage, CarInternalFeature
+
+
+@receiver(post_save, sender=CarAdvertisement)
+def update_car_search_vector(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CarAdvertisement.update_search_vectors(pk=instance.pk)
+
+
+@receiver(post_save, sender=CarAdvertisement)
+def update_car_price_base(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CarAdvertisement.update_price_base(pk=instance.pk)
+
+
+@receiver(post_save, sender=CarExplanation)
+@receiver(post_delete, sender=CarExplanation)
+def update_car_search_vector_for_explanation(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CarAdvertisement.update_search_vectors(pk=instance.car_ad_id)
+        AdIndex.sync(CarAdvertisement, pk=instance.car_ad_id)
+
+
+@receiver(post_save, sender=CarExternalFeature)
+@receiver(post_delete, sender=CarExternalFeature)
+@receiver(post_save, sender=CarInternalFeature)
+@receiver(post_delete, sender=CarInternalFeature)
+def update_car_feature_mask(sender, instance, raw=False, **kwargs):
+    if not raw:
+        CarAdvertisement.update_feature_masks(pk=instance.car_ad_id)
+
+
+@receiver(post_save, sender=CarImage)
+def queue_car_image_processing(sender, instance, created=False, raw=False, **kwargs):
+    if created and not raw and instance.image:
+        enqueue_image_processing(instance)
+
+
+@receiver(post_save, sender=CarAdvertisement)
+@receiver(post_delete, sender=CarAdvertisement)
+@receiver(post_save, sender=CarImage)
+@receiver(post_delete, sender=CarImage)
+@receiver(post_save, sender=CarExplanation)
+@receiver(post_delete, sender=CarExplanation)
+@receiver(post_save, sender=CarExternalFeature)
+@receiver(post_delete, sender=CarExternalFeature)
+@receiver(post_save, sender=CarInternalFeature)
+@receiver(post_delete, sender=CarInternalFeature)
+def invalidate_public_car_responses(sender, raw=False, **kwargs):
+    if not raw:
+        invalidate_public_responses('cars')
+
+
+@receiver(post_save, sender=CarAdvertisement)
+@receiver(post_delete, sender=CarAdvertisement)
+def invalidate_car_detail(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_ad_details('cars', instance.pk)
+
+
+@receiver(post_save, sender=CarImage)
+@receiver(post_delete, sender=CarImage)
+@receiver(post_save, sender=CarExplanation)
+@receiver(post_delete, sender=CarExplanation)
+@receiver(post_save, sender=CarExternalFeature)
+@receiver(post_delete, sender=CarExternalFeature)
+@receiver(post_save, sender=CarInternalFeature)
+@receiver(post_delete, sender=CarInternalFeature)
+def invalidate_car_detail_for_related(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_ad_details('cars', instance.car_ad_id)
+
+
+@receiver(post_save, sender=CarAdvertisement)
+def sync_car_ad_index(sender, instance, raw=False, **kwargs):
+    if not raw:
+        AdIndex.sync(CarAdvertisement, pk=instance.pk)
+
+
+@receiver(post_delete, sender=CarAdvertisement)
+def remove_car_ad_index(sender, instance, **kwargs):
+    AdIndex.remove(CarAdvertisement, instance.pk)
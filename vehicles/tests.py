@@ -1,3 +1,52 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .models import CarAdvertisement, CarImage
+
+
+class CarListFastPathParityTests(TestCase):
+    """The values() list fast path must render byte-for-byte what the list serializers do."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='admin@example.com', password='secret')
+        for i in range(4):
+            ad = CarAdvertisement.objects.create(
+                user=cls.user if i % 2 else None, title=f'BMW 320i {i}', price=Decimal('18500.75') + i,
+                price_type='EUR', vehicle_type='sedan', advertisement_type='sale', transmission='automatic',
+                model_year=2018 + i, steering_type='left_steering_wheel', brand='bmw', series='3-series',
+                city='Nicosia' if i % 2 else None,
+            )
+            for position in range(i % 3):
+                CarImage.objects.create(
+                    car_ad=ad, image=f'blobs/cc/dd/{i}{position}.jpg', position=position,
+                    is_cover=position == 1,
+                )
+
+    def setUp(self):
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.user)
+
+    def assertSameBody(self, client, url, params=None):
+        bodies = []
+        for fast in (False, True):
+            cache.clear()
+            with override_settings(FAST_LIST_SERIALIZERS=fast):
+                response = client.get(url, params or {})
+            self.assertEqual(response.status_code, 200)
+            bodies.append(response.content)
+        self.assertEqual(bodies[0], bodies[1])
+
+    def test_public_list(self):
+        self.assertSameBody(self.client, '/api/cars/')
+        self.assertSameBody(self.client, '/api/cars/', {'page_size': 2, 'page': 2})
+        self.assertSameBody(self.client, '/api/cars/', {'cursor': '', 'page_size': 3})
+        self.assertSameBody(self.client, '/api/cars/', {'search': 'bmw', 'cursor': ''})
+
+    def test_admin_list(self):
+        self.assertSameBody(self.admin_client, '/api/cars/admin/')
+        self.assertSameBody(self.admin_client, '/api/cars/admin/', {'ordering': '-price', 'cursor': ''})
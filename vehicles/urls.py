@@ -10,6 +10,7 @@ urlpatterns = [
 # Public URLs
     path('', views.PublicCarListView.as_view(), name='public-car-list'),
     path('<int:pk>/', views.PublicCarDetailView.as_view(), name='public-car-detail'),
+    path('facets/', views.PublicCarFacetsView.as_view(), name='public-car-facets'),
     path('features/external/', views.CarExternalFeaturesMetadataView.as_view(),
          name='car-external-features-metadata'),
     path('features/internal/', views.CarInternalFeaturesMetadataView.as_view(),
@@ -36,6 +36,8 @@ def get_model_form_schema(model_class, is_child_schema=False, field_instance_on_
 
     for field in model_class._meta.get_fields(include_hidden=True):
 
+        if field.name in getattr(model_class, 'DENORMALIZED_FIELDS', ()):
+            continue
         if is_child_schema and field.name in fields_to_skip_in_children:
             continue
         if field.name in excluded_base_fields and not is_child_schema:
@@ -1,37 +1,52 @@
+from django.conf import settings
 
 from django.db import models
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from rest_framework import viewsets, permissions, status, generics, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from knox.auth import TokenAuthentication
+from rest_framework.parsers import MultiPartParser, FormParser
+from kibris_acil_satilik.parsers import ORJSONParser
+from kibris_acil_satilik.authentication import CachedTokenAuthentication
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.views import APIView
 from properties.constants import PREDEFINED_CAR_DATA
 from .filters import CarFilter
+from kibris_acil_satilik.search import FullTextSearchFilter
+from kibris_acil_satilik.ordering import AliasedOrderingFilter
+from kibris_acil_satilik.facets import FacetCountsView
+from kibris_acil_satilik.http import PrecomputedJSON
+from kibris_acil_satilik.response_cache import AdDetailCacheMixin, PublicResponseCacheMixin
+from kibris_acil_satilik.values_serializers import ValuesListMixin
 from .models import (
     CarAdvertisement, CarImage,CarExternalFeature, CarInternalFeature
 )
 from .serializers import (
     CarAdminListSerializer, CarDetailSerializer, CarAdminCreateUpdateSerializer,
-    CarListSerializer, CarImageSerializer, CarBasicSerializer
+    CarListSerializer, CarImageSerializer, CarBasicSerializer, CarListValuesSerializer,
+    CarAdminListValuesSerializer
+)
+from properties.utils import (
+    base64_to_image_file, plan_cover_flags, prepare_uploaded_image, use_streaming_upload_handlers,
+    is_image_reconciliation_payload, reconcile_ad_images
 )
-from properties.utils import base64_to_image_file
 from .utils import get_model_form_schema
 
-class CarAdminViewSet(viewsets.ModelViewSet):
+class CarAdminViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """ViewSet for Admin users to manage Car Advertisements."""
     queryset = CarAdvertisement.objects.select_related( 'user', 'explanation', 'external_features', 'internal_features'
     ).prefetch_related('images').all()
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
-    parser_classes = [FormParser, JSONParser]
+    authentication_classes = [CachedTokenAuthentication]
+    parser_classes = [FormParser, ORJSONParser]
     filterset_class = CarFilter
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, AliasedOrderingFilter, FullTextSearchFilter]
     search_fields = ['title', 'brand', 'series', 'explanation__explanation']
     ordering_fields = ['created_at', 'published_date', 'price', 'title', 'model_year']
+    ordering_aliases = {'price': 'price_base'}
     ordering = ['-created_at']
+    values_serializer_class = CarAdminListValuesSerializer
 
     http_method_names = ['get', 'post', 'put', 'patch', 'head', 'options']
 
@@ -120,7 +135,12 @@ class CarAdminViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         
         updated_instance = serializer.save()
-        if images_payload_list is not None: 
+        if images_payload_list is not None and is_image_reconciliation_payload(images_payload_list):
+            reconcile_ad_images(
+                CarImage, 'car_ad', updated_instance, images_payload_list,
+                name_prefix=f"car_{updated_instance.id}_img_"
+            )
+        elif images_payload_list is not None: 
             existing_images = CarImage.objects.filter(car_ad=updated_instance)
             for img in existing_images:
                 img.delete()
@@ -169,7 +189,7 @@ class CarAdminViewSet(viewsets.ModelViewSet):
         detail_serializer = CarDetailSerializer(updated_instance, context=self.get_serializer_context())
         return Response(detail_serializer.data)
 
-    @action(detail=True, methods=['post'], parser_classes=[JSONParser], url_path='upload-images')
+    @action(detail=True, methods=['post'], parser_classes=[ORJSONParser], url_path='upload-images')
     def upload_images(self, request, pk=None):
         car_ad = self.get_object()
         images_payload_list = request.data.get('images')
@@ -217,6 +237,44 @@ class CarAdminViewSet(viewsets.ModelViewSet):
         serializer = CarImageSerializer(created_images, many=True, context=self.get_serializer_context())
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=['post'], parser_classes=[MultiPartParser], url_path='upload-files')
+    def upload_files(self, request, pk=None):
+        """
+        Upload additional images for a specific car as multipart `images` files, each
+        streamed to a temporary file and moved into storage. `cover_index` optionally marks
+        which of them should become the cover.
+        """
+        use_streaming_upload_handlers(request)
+        car_ad = self.get_object()
+        uploaded_files = request.FILES.getlist('images')
+        if not uploaded_files:
+            return Response({"detail": "No 'images' files were uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+
+        cover_index = request.data.get('cover_index')
+        try:
+            cover_index = int(cover_index) if cover_index not in (None, '') else None
+        except ValueError:
+            return Response({"cover_index": "A valid integer is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        image_field = CarImage._meta.get_field('image')
+        try:
+            image_files = [
+                prepare_uploaded_image(uploaded_file, image_field, name_prefix=f"car_{car_ad.id}_upload_")
+                for uploaded_file in uploaded_files
+            ]
+        except DjangoValidationError as e:
+            return Response({"images": e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+        ad_has_cover = CarImage.objects.filter(car_ad=car_ad, is_cover=True).exists()
+        cover_flags = plan_cover_flags([i == cover_index for i in range(len(image_files))], ad_has_cover)
+
+        created_images = []
+        with transaction.atomic():
+            for image_file, is_cover in zip(image_files, cover_flags):
+                created_images.append(CarImage.objects.create(car_ad=car_ad, image=image_file, is_cover=is_cover))
+        serializer = CarImageSerializer(created_images, many=True, context=self.get_serializer_context())
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     @action(detail=True, methods=['post'], url_path='set-cover-image/(?P<image_pk>[^/.]+)')
     def set_cover_image(self, request, pk=None, image_pk=None):
         car_ad = self.get_object()
@@ -246,28 +304,49 @@ class CarAdminViewSet(viewsets.ModelViewSet):
 class CarBasicListView(generics.ListAPIView):
     serializer_class = CarBasicSerializer
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [TokenAuthentication]
-    queryset = CarAdvertisement.objects.filter(is_active=True).prefetch_related('images').order_by('-published_date')
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    authentication_classes = [CachedTokenAuthentication]
+    queryset = CarAdvertisement.objects.filter(is_active=True).order_by('-published_date')
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, AliasedOrderingFilter]
     filterset_fields = ['is_active']
     search_fields = ['title']
     ordering_fields = ['published_date', 'price', 'title']
+    ordering_aliases = {'price': 'price_base'}
 
-class PublicCarListView(generics.ListAPIView):
+class PublicCarListView(ValuesListMixin, PublicResponseCacheMixin, generics.ListAPIView):
     serializer_class = CarListSerializer
-    permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    values_serializer_class = CarListValuesSerializer
+    permission_classes = [permissions.AllowAny]
+    response_cache_namespaces = ['cars']
+    filter_backends = [DjangoFilterBackend, AliasedOrderingFilter, FullTextSearchFilter]
     filterset_class = CarFilter
     search_fields = ['title', 'brand', 'series', 'explanation__explanation']
     ordering_fields = ['published_date', 'price', 'title', 'model_year']
+    ordering_aliases = {'price': 'price_base'}
     ordering = ['-published_date']
 
     def get_queryset(self):
         return CarAdvertisement.objects.filter(is_active=True).prefetch_related('images').order_by('-published_date')
 
-class PublicCarDetailView(generics.RetrieveAPIView):
+class PublicCarFacetsView(PublicResponseCacheMixin, FacetCountsView):
+    permission_classes = [permissions.AllowAny]
+    response_cache_namespaces = ['cars']
+    queryset = CarAdvertisement.objects.filter(is_active=True)
+    filterset_class = CarFilter
+    search_fields = ['title', 'brand', 'series', 'explanation__explanation']
+    facets = {
+        'type': 'vehicle_type',
+        'brand': 'brand',
+        'series': 'series',
+        'modelYear': 'model_year',
+        'fuelType': 'fuel_type',
+        'transmission': 'transmission',
+        'city': 'city',
+    }
+
+class PublicCarDetailView(AdDetailCacheMixin, generics.RetrieveAPIView):
     serializer_class = CarDetailSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.AllowAny]
+    detail_cache_kind = 'cars'
     lookup_field = 'pk'
 
     def get_queryset(self):
@@ -304,21 +383,25 @@ class CarInternalFeaturesMetadataView(APIView):
         internal_features = get_feature_metadata(CarInternalFeature)
         return Response(internal_features)
 
+def build_car_form_schema():
+    return {
+        "form_meta": get_model_form_schema(CarAdvertisement),
+        "brand_series_map": PREDEFINED_CAR_DATA
+    }
+
+
+# A pure function of the model definitions, so it is built on first use and kept for the process.
+CAR_FORM_SCHEMA = PrecomputedJSON(build_car_form_schema, max_age=settings.FILTER_OPTIONS_MAX_AGE)
+
+
 class CarAdvertisementFormSchemaView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
         try:
-            main_model = CarAdvertisement
-            form_meta = get_model_form_schema(main_model)
-
-            response_data = {
-                          "form_meta": form_meta,
-                          "brand_series_map": PREDEFINED_CAR_DATA
-            }
-            return Response(response_data)
+            return CAR_FORM_SCHEMA.response(request)
         except Exception as e:
             print(f"Error generating schema: {e}")
             import traceback
             traceback.print_exc()
-            return Response({"error": "Could not generate form schema.", "details": str(e)}, status=500)
\ No newline at end of file
+            return Response({"error": "Could not generate form schema.", "details": str(e)}, status=500)